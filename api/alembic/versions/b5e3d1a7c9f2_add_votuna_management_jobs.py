@@ -0,0 +1,66 @@
+"""add votuna management jobs
+
+Revision ID: b5e3d1a7c9f2
+Revises: a7c2e9f41b6d
+Create Date: 2026-03-02 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b5e3d1a7c9f2"
+down_revision: Union[str, None] = "a7c2e9f41b6d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add persisted management transfer jobs table."""
+    op.create_table(
+        "votuna_management_jobs",
+        sa.Column("playlist_id", sa.Integer(), nullable=False),
+        sa.Column("requested_by_user_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("request_payload", sa.JSON(), nullable=False),
+        sa.Column("total_count", sa.Integer(), nullable=False),
+        sa.Column("processed_count", sa.Integer(), nullable=False),
+        sa.Column("added_count", sa.Integer(), nullable=False),
+        sa.Column("failed_count", sa.Integer(), nullable=False),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("error", sa.String(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["playlist_id"], ["votuna_playlists.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["requested_by_user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_votuna_management_jobs_id"), "votuna_management_jobs", ["id"], unique=False)
+    op.create_index(
+        op.f("ix_votuna_management_jobs_playlist_id"),
+        "votuna_management_jobs",
+        ["playlist_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_votuna_management_jobs_requested_by_user_id"),
+        "votuna_management_jobs",
+        ["requested_by_user_id"],
+        unique=False,
+    )
+    op.create_index(op.f("ix_votuna_management_jobs_status"), "votuna_management_jobs", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop persisted management transfer jobs table."""
+    op.drop_index(op.f("ix_votuna_management_jobs_status"), table_name="votuna_management_jobs")
+    op.drop_index(op.f("ix_votuna_management_jobs_requested_by_user_id"), table_name="votuna_management_jobs")
+    op.drop_index(op.f("ix_votuna_management_jobs_playlist_id"), table_name="votuna_management_jobs")
+    op.drop_index(op.f("ix_votuna_management_jobs_id"), table_name="votuna_management_jobs")
+    op.drop_table("votuna_management_jobs")
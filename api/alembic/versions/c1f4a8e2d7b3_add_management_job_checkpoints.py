@@ -0,0 +1,28 @@
+"""add management job checkpoints
+
+Revision ID: c1f4a8e2d7b3
+Revises: b5e3d1a7c9f2
+Create Date: 2026-03-04 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c1f4a8e2d7b3"
+down_revision: Union[str, None] = "b5e3d1a7c9f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store per-chunk transfer checkpoints on management jobs."""
+    op.add_column("votuna_management_jobs", sa.Column("checkpoint", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop management job checkpoints."""
+    op.drop_column("votuna_management_jobs", "checkpoint")
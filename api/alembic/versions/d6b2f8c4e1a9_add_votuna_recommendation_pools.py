@@ -0,0 +1,74 @@
+"""add votuna recommendation pools
+
+Revision ID: d6b2f8c4e1a9
+Revises: c1f4a8e2d7b3
+Create Date: 2026-03-06 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d6b2f8c4e1a9"
+down_revision: Union[str, None] = "c1f4a8e2d7b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add precomputed recommendation candidate pools table."""
+    op.create_table(
+        "votuna_recommendation_pools",
+        sa.Column("playlist_id", sa.Integer(), nullable=False),
+        sa.Column("provider", sa.String(), nullable=False),
+        sa.Column("tracks_fingerprint", sa.String(), nullable=False),
+        sa.Column("track_count", sa.Integer(), nullable=True),
+        sa.Column("seed_track_ids", sa.JSON(), nullable=False),
+        sa.Column("candidates", sa.JSON(), nullable=False),
+        sa.Column("is_stale", sa.Boolean(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_accessed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["playlist_id"], ["votuna_playlists.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_votuna_recommendation_pools_id"), "votuna_recommendation_pools", ["id"], unique=False)
+    op.create_index(
+        op.f("ix_votuna_recommendation_pools_playlist_id"),
+        "votuna_recommendation_pools",
+        ["playlist_id"],
+        unique=True,
+    )
+    op.create_index(
+        op.f("ix_votuna_recommendation_pools_is_stale"),
+        "votuna_recommendation_pools",
+        ["is_stale"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_votuna_recommendation_pools_computed_at"),
+        "votuna_recommendation_pools",
+        ["computed_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_votuna_recommendation_pools_last_accessed_at"),
+        "votuna_recommendation_pools",
+        ["last_accessed_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop precomputed recommendation candidate pools table."""
+    op.drop_index(op.f("ix_votuna_recommendation_pools_last_accessed_at"), table_name="votuna_recommendation_pools")
+    op.drop_index(op.f("ix_votuna_recommendation_pools_computed_at"), table_name="votuna_recommendation_pools")
+    op.drop_index(op.f("ix_votuna_recommendation_pools_is_stale"), table_name="votuna_recommendation_pools")
+    op.drop_index(op.f("ix_votuna_recommendation_pools_playlist_id"), table_name="votuna_recommendation_pools")
+    op.drop_index(op.f("ix_votuna_recommendation_pools_id"), table_name="votuna_recommendation_pools")
+    op.drop_table("votuna_recommendation_pools")
@@ -0,0 +1,31 @@
+"""add management job unmatched count
+
+Revision ID: e8b3d5f7a2c4
+Revises: d6b2f8c4e1a9
+Create Date: 2026-03-07 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e8b3d5f7a2c4"
+down_revision: Union[str, None] = "d6b2f8c4e1a9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Count source tracks with no destination match apart from failed adds."""
+    op.add_column(
+        "votuna_management_jobs",
+        sa.Column("unmatched_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+
+
+def downgrade() -> None:
+    """Drop management job unmatched counts."""
+    op.drop_column("votuna_management_jobs", "unmatched_count")
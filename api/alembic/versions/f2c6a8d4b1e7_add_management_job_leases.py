@@ -0,0 +1,37 @@
+"""add management job leases
+
+Revision ID: f2c6a8d4b1e7
+Revises: e8b3d5f7a2c4
+Create Date: 2026-03-08 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c6a8d4b1e7"
+down_revision: Union[str, None] = "e8b3d5f7a2c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Track which worker holds a running job and when it last heartbeated."""
+    op.add_column("votuna_management_jobs", sa.Column("lease_token", sa.String(), nullable=True))
+    op.add_column("votuna_management_jobs", sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        op.f("ix_votuna_management_jobs_heartbeat_at"),
+        "votuna_management_jobs",
+        ["heartbeat_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop management job leases."""
+    op.drop_index(op.f("ix_votuna_management_jobs_heartbeat_at"), table_name="votuna_management_jobs")
+    op.drop_column("votuna_management_jobs", "heartbeat_at")
+    op.drop_column("votuna_management_jobs", "lease_token")
@@ -0,0 +1,59 @@
+"""Route class shared by the API routers."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import time
+from typing import Any, Callable, Coroutine
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from app.utils.request_timing import current_request_timings
+
+
+def _mark_endpoint_finish(call: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap an endpoint so the request's timing context knows when it returned."""
+    if inspect.iscoroutinefunction(call):
+
+        @functools.wraps(call)
+        async def _async_endpoint(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await call(*args, **kwargs)
+            finally:
+                timings = current_request_timings()
+                if timings is not None:
+                    timings.endpoint_finished_at = time.perf_counter()
+
+        return _async_endpoint
+
+    @functools.wraps(call)
+    def _sync_endpoint(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return call(*args, **kwargs)
+        finally:
+            timings = current_request_timings()
+            if timings is not None:
+                timings.endpoint_finished_at = time.perf_counter()
+
+    return _sync_endpoint
+
+
+class TimedAPIRoute(APIRoute):
+    """APIRoute that records response validation and rendering time as the ``serialize`` phase."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        if self.dependant.call is not None and not isinstance(self.dependant.call, type):
+            self.dependant.call = _mark_endpoint_finish(self.dependant.call)
+        handler = super().get_route_handler()
+
+        async def _timed_handler(request: Request) -> Response:
+            response = await handler(request)
+            timings = current_request_timings()
+            if timings is not None and timings.endpoint_finished_at is not None:
+                timings.record("serialize", time.perf_counter() - timings.endpoint_finished_at)
+                timings.endpoint_finished_at = None
+            return response
+
+        return _timed_handler
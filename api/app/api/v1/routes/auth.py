@@ -10,6 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response,
 from fastapi.responses import JSONResponse, RedirectResponse
 from sqlalchemy.orm import Session
 
+from app.api.routing import TimedAPIRoute
 from app.auth.dependencies import get_current_user
 from app.auth.jwt import create_access_token
 from app.auth.sso import (
@@ -36,7 +37,7 @@ from app.utils.avatar_storage import (
 )
 from app.utils.token_expiry import coerce_expires_at, expires_at_from_payload
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 logger = logging.getLogger(__name__)
 
 PENDING_INVITE_COOKIE = "votuna_pending_invite_token"
@@ -3,6 +3,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
+from app.api.routing import TimedAPIRoute
 from app.auth.dependencies import get_current_user
 from app.db.session import get_db
 from app.models.user import User
@@ -14,7 +15,7 @@ from app.services.music_providers import (
     get_provider_client_for_user,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 def _get_provider_client(provider: str, user: User, db: Session) -> MusicProviderClient:
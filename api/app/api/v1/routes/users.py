@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from fastapi.responses import FileResponse, RedirectResponse
 from sqlalchemy.orm import Session
 
+from app.api.routing import TimedAPIRoute
 from app.auth.dependencies import get_current_user
 from app.crud.user import user_crud
 from app.crud.user_settings import user_settings_crud
@@ -13,7 +14,7 @@ from app.schemas.user import UserOut, UserUpdate
 from app.schemas.user_settings import UserSettingsOut, UserSettingsUpdate
 from app.utils.avatar_storage import delete_avatar_if_exists, get_avatar_file_path, save_avatar_upload
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 @router.get("/me", response_model=UserOut)
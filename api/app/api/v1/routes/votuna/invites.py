@@ -9,6 +9,7 @@ from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, sta
 from fastapi.responses import RedirectResponse, Response
 from sqlalchemy.orm import Session
 
+from app.api.routing import TimedAPIRoute
 from app.api.v1.routes.votuna.common import get_owner_client, raise_provider_auth, require_owner
 from app.auth.dependencies import get_current_user, get_optional_current_user
 from app.auth.sso import AuthProvider
@@ -37,7 +38,7 @@ from app.services.votuna_invites import (
     join_invite_by_token,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 DEFAULT_LINK_EXPIRES_HOURS = 24 * 7
 DEFAULT_LINK_MAX_USES = 1
@@ -1,23 +1,34 @@
 """Playlist management routes for import/export workflows."""
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Iterable, Sequence
+import hashlib
+import json
+import secrets
+import time
+from typing import Any, Callable, Iterable, Sequence
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.api.routing import TimedAPIRoute
 from app.api.v1.routes.votuna.common import (
     get_owner_client,
     get_playlist_or_404,
     raise_provider_auth,
     raise_provider_api_error,
+    require_member,
     require_owner,
 )
 from app.auth.dependencies import get_current_user
 from app.db.session import get_db
 from app.models.user import User
+from app.models.votuna_management_jobs import VotunaManagementJob
 from app.models.votuna_playlist import VotunaPlaylist
+from app.crud.user import user_crud
+from app.crud.votuna_management_job import votuna_management_job_crud
+from app.crud.votuna_recommendation_pool import votuna_recommendation_pool_crud
 from app.crud.votuna_track_addition import votuna_track_addition_crud
 from app.schemas.votuna_playlist import MusicProvider, ProviderTrackOut
 from app.schemas.votuna_playlist_management import (
@@ -27,6 +38,7 @@ from app.schemas.votuna_playlist_management import (
     ManagementDestinationCreate,
     ManagementExecuteResponse,
     ManagementFailedItem,
+    ManagementJobOut,
     ManagementPremiumCleanupResponse,
     ManagementPlaylistRef,
     ManagementPlaylistSummary,
@@ -35,15 +47,32 @@ from app.schemas.votuna_playlist_management import (
     ManagementShuffleResponse,
     ManagementSourceTracksRequest,
     ManagementSourceTracksResponse,
+    ManagementTransferCheckpoint,
     ManagementTransferRequest,
 )
+from app.services.management_jobs import ManagementJobLeaseLost, ManagementJobWorkerPool
 from app.services.music_providers import MusicProviderClient, ProviderAPIError, ProviderAuthError, ProviderTrack
+from app.services.track_fingerprints import TrackFingerprintIndex, dedupe_tracks_by_fingerprint
+from app.services.track_matching import match_tracks
+from app.utils.json_response import FastJSONResponse, model_list_adapter, model_response
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 MAX_TRACKS_PER_ACTION = 500
 ADD_CHUNK_SIZE = 100
 FACETS_LIMIT = 100
+PREVIEW_PLAN_TTL_SECONDS = 5 * 60.0
+SOURCE_INDEX_TTL_SECONDS = 2 * 60.0
+SOURCE_INDEX_MAX_ENTRIES = 128
+SOURCE_INDEX_SEARCH_CACHE_SIZE = 32
+
+# Persists transfer state after planning and after every applied chunk.
+TransferCheckpointCallback = Callable[[ManagementTransferCheckpoint], None]
+# A provider snapshot id where the provider has one, else the track count.
+PlaylistSnapshot = str | int | None
+
+# Process-local plans computed by preview, keyed by the opaque token handed to the client.
+_preview_plans: dict[str, tuple[float, "_PreviewPlan"]] = {}
 
 
 @dataclass
@@ -51,6 +80,11 @@ class ResolvedProviderPlaylist:
     provider: MusicProvider
     provider_playlist_id: str
     title: str
+    track_count: int | None = None
+    snapshot_id: str | None = None
+    # Set for playlists read through another owner's provider session (cross-provider sources).
+    client: MusicProviderClient | None = field(default=None, repr=False, compare=False)
+    owner_user_id: int | None = None
 
     def to_summary(self) -> ManagementPlaylistSummary:
         return ManagementPlaylistSummary(
@@ -110,25 +144,9 @@ def _validate_transfer_payload(payload: ManagementTransferRequest, cleaned_value
         )
 
 
-def _provider_track_to_out(track: ProviderTrack) -> ProviderTrackOut:
-    return ProviderTrackOut(
-        provider_track_id=track.provider_track_id,
-        title=track.title,
-        artist=track.artist,
-        genre=track.genre,
-        artwork_url=track.artwork_url,
-        url=track.url,
-        access=track.access,
-    )
-
-
-def _contains_search(track: ProviderTrack, needle: str) -> bool:
-    if not needle:
-        return True
-    title = (track.title or "").lower()
-    artist = (track.artist or "").lower()
-    genre = (track.genre or "").lower()
-    return needle in title or needle in artist or needle in genre
+def _provider_tracks_to_out(tracks: Iterable[ProviderTrack]) -> list[ProviderTrackOut]:
+    """Convert provider tracks in one validation pass over the whole list."""
+    return model_list_adapter(ProviderTrackOut).validate_python(list(tracks), from_attributes=True)
 
 
 def _build_facet_counts(values: Iterable[str | None]) -> list[ManagementFacetCount]:
@@ -210,6 +228,8 @@ async def _safe_get_playlist(
         provider=provider_playlist.provider,  # type: ignore[arg-type]
         provider_playlist_id=provider_playlist.provider_playlist_id,
         title=provider_playlist.title,
+        track_count=provider_playlist.track_count,
+        snapshot_id=provider_playlist.snapshot_id,
     )
 
 
@@ -239,6 +259,7 @@ async def _resolve_playlist_ref(
     current_user: User,
     client: MusicProviderClient,
     ref: ManagementPlaylistRef,
+    allow_cross_provider: bool = False,
 ) -> ResolvedProviderPlaylist:
     if ref.kind == "provider":
         if ref.provider != current_playlist.provider:
@@ -257,9 +278,17 @@ async def _resolve_playlist_ref(
             provider=current_playlist.provider,  # type: ignore[arg-type]
             provider_playlist_id=resolved.provider_playlist_id,
             title=resolved.title,
+            track_count=resolved.track_count,
+            snapshot_id=resolved.snapshot_id,
         )
 
     other_playlist = get_playlist_or_404(db, ref.votuna_playlist_id)
+    if allow_cross_provider and other_playlist.provider != current_playlist.provider:
+        return await _resolve_cross_provider_source(
+            db=db,
+            current_user=current_user,
+            other_playlist=other_playlist,
+        )
     if other_playlist.owner_user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -281,6 +310,39 @@ async def _resolve_playlist_ref(
         provider=other_playlist.provider,  # type: ignore[arg-type]
         provider_playlist_id=other_playlist.provider_playlist_id,
         title=resolved.title or other_playlist.title,
+        track_count=resolved.track_count,
+        snapshot_id=resolved.snapshot_id,
+    )
+
+
+async def _resolve_cross_provider_source(
+    *,
+    db: Session,
+    current_user: User,
+    other_playlist: VotunaPlaylist,
+) -> ResolvedProviderPlaylist:
+    """Resolve a Votuna playlist on another provider as a read-only transfer source.
+
+    Accounts are per provider, so the playlist is read through its owner's
+    session, which requires the same membership as viewing its tracks.
+    """
+    require_member(db, other_playlist.id, current_user.id)
+    other_client = get_owner_client(db, other_playlist)
+    resolved = await _safe_get_playlist(
+        client=other_client,
+        provider_playlist_id=other_playlist.provider_playlist_id,
+        current_user=current_user,
+        owner_id=other_playlist.owner_user_id,
+        provider=other_playlist.provider,
+    )
+    return ResolvedProviderPlaylist(
+        provider=other_playlist.provider,  # type: ignore[arg-type]
+        provider_playlist_id=other_playlist.provider_playlist_id,
+        title=resolved.title or other_playlist.title,
+        track_count=resolved.track_count,
+        snapshot_id=resolved.snapshot_id,
+        client=other_client,
+        owner_user_id=other_playlist.owner_user_id,
     )
 
 
@@ -318,6 +380,7 @@ async def _resolve_transfer_endpoints(
             current_user=current_user,
             client=client,
             ref=payload.counterparty,
+            allow_cross_provider=True,
         )
         destination = current_summary
         destination_is_created = False
@@ -349,9 +412,94 @@ async def _resolve_transfer_endpoints(
     return source, destination, destination_is_created
 
 
+@dataclass
+class _SourceTrackIndex:
+    """Search and facet view of one source playlist listing."""
+
+    snapshot: PlaylistSnapshot
+    tracks: list[ProviderTrack]
+    search_texts: list[str]
+    genres: list[ManagementFacetCount]
+    artists: list[ManagementFacetCount]
+    matches_by_needle: OrderedDict[str, list[int]]
+
+    @classmethod
+    def build(cls, tracks: Sequence[ProviderTrack], snapshot: PlaylistSnapshot) -> "_SourceTrackIndex":
+        return cls(
+            snapshot=snapshot,
+            tracks=list(tracks),
+            search_texts=[
+                "\x00".join(((track.title or "").lower(), (track.artist or "").lower(), (track.genre or "").lower()))
+                for track in tracks
+            ],
+            genres=_build_facet_counts(track.genre for track in tracks),
+            artists=_build_facet_counts(track.artist for track in tracks),
+            matches_by_needle=OrderedDict(),
+        )
+
+    def search(self, needle: str) -> list[int]:
+        """Return positions of tracks matching ``needle``, in listing order."""
+        if not needle:
+            return list(range(len(self.tracks)))
+        matches = self.matches_by_needle.get(needle)
+        if matches is None:
+            # Extending a cached shorter query only needs to rescan its matches.
+            candidates: Iterable[int] = range(len(self.tracks))
+            for cached_needle in reversed(self.matches_by_needle):
+                if cached_needle in needle:
+                    candidates = self.matches_by_needle[cached_needle]
+                    break
+            matches = [position for position in candidates if needle in self.search_texts[position]]
+            self.matches_by_needle[needle] = matches
+            while len(self.matches_by_needle) > SOURCE_INDEX_SEARCH_CACHE_SIZE:
+                self.matches_by_needle.popitem(last=False)
+        else:
+            self.matches_by_needle.move_to_end(needle)
+        return matches
+
+
+# Source listings indexed per (owner, provider, provider playlist id), most recently used last.
+_source_track_indexes: OrderedDict[tuple[int, str, str], tuple[float, _SourceTrackIndex]] = OrderedDict()
+
+
+async def _get_source_track_index(
+    *,
+    client: MusicProviderClient,
+    current_playlist: VotunaPlaylist,
+    current_user: User,
+    source: ResolvedProviderPlaylist,
+) -> _SourceTrackIndex:
+    """Return the index for ``source``, re-listing it only when its snapshot changed or the entry expired."""
+    owner_id = source.owner_user_id or current_playlist.owner_user_id
+    key = (owner_id, str(source.provider), source.provider_playlist_id)
+    snapshot = _playlist_snapshot(source)
+    now = time.monotonic()
+    cached = _source_track_indexes.get(key)
+    if cached is not None:
+        expires_at, index = cached
+        if expires_at > now and index.snapshot == snapshot:
+            _source_track_indexes.move_to_end(key)
+            return index
+        _source_track_indexes.pop(key, None)
+
+    tracks = await _safe_list_tracks(
+        client=source.client or client,
+        provider_playlist_id=source.provider_playlist_id,
+        current_user=current_user,
+        owner_id=owner_id,
+        provider=source.provider,
+    )
+    index = _SourceTrackIndex.build(tracks, snapshot)
+    _source_track_indexes[key] = (time.monotonic() + SOURCE_INDEX_TTL_SECONDS, index)
+    while len(_source_track_indexes) > SOURCE_INDEX_MAX_ENTRIES:
+        _source_track_indexes.popitem(last=False)
+    return index
+
+
 @router.post(
     "/playlists/{playlist_id}/management/source-tracks",
     response_model=ManagementSourceTracksResponse,
+    response_class=FastJSONResponse,
 )
 async def list_management_source_tracks(
     playlist_id: int,
@@ -368,20 +516,19 @@ async def list_management_source_tracks(
         current_user=current_user,
         client=client,
         ref=payload.source,
+        allow_cross_provider=True,
     )
-    tracks = await _safe_list_tracks(
+    index = await _get_source_track_index(
         client=client,
-        provider_playlist_id=source.provider_playlist_id,
+        current_playlist=current_playlist,
         current_user=current_user,
-        owner_id=current_playlist.owner_user_id,
-        provider=current_playlist.provider,
+        source=source,
     )
-    needle = _normalize(payload.search or "")
-    filtered_tracks = [track for track in tracks if _contains_search(track, needle)]
-    paged_tracks = filtered_tracks[payload.offset : payload.offset + payload.limit]
+    matches = index.search(_normalize(payload.search or ""))
+    paged_positions = matches[payload.offset : payload.offset + payload.limit]
     return ManagementSourceTracksResponse(
-        tracks=[_provider_track_to_out(track) for track in paged_tracks],
-        total_count=len(filtered_tracks),
+        tracks=_provider_tracks_to_out(index.tracks[position] for position in paged_positions),
+        total_count=len(matches),
         limit=payload.limit,
         offset=payload.offset,
     )
@@ -406,19 +553,19 @@ async def list_management_facets(
         current_user=current_user,
         client=client,
         ref=payload.source,
+        allow_cross_provider=True,
     )
-    tracks = await _safe_list_tracks(
+    index = await _get_source_track_index(
         client=client,
-        provider_playlist_id=source.provider_playlist_id,
+        current_playlist=current_playlist,
         current_user=current_user,
-        owner_id=current_playlist.owner_user_id,
-        provider=current_playlist.provider,
+        source=source,
     )
 
     return ManagementFacetsResponse(
-        genres=_build_facet_counts(track.genre for track in tracks),
-        artists=_build_facet_counts(track.artist for track in tracks),
-        total_tracks_considered=len(tracks),
+        genres=list(index.genres),
+        artists=list(index.artists),
+        total_tracks_considered=len(index.tracks),
     )
 
 
@@ -466,6 +613,7 @@ async def remove_management_premium_tracks(
             if exc.status_code == status.HTTP_501_NOT_IMPLEMENTED:
                 raise HTTPException(status_code=status.HTTP_405_METHOD_NOT_ALLOWED, detail=str(exc)) from exc
             raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
+        votuna_recommendation_pool_crud.mark_stale(db, playlist.id)
 
     return ManagementPremiumCleanupResponse(
         provider=playlist.provider,  # type: ignore[arg-type]
@@ -516,39 +664,187 @@ async def shuffle_management_playlist(
     )
 
 
-@router.post("/playlists/{playlist_id}/management/preview", response_model=ManagementPreviewResponse)
-async def preview_management_transfer(
-    playlist_id: int,
-    payload: ManagementTransferRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    """Preview a management transfer without mutating provider playlists."""
-    current_playlist = require_owner(db, playlist_id, current_user.id)
-    cleaned_values = _sanitize_selection_values(payload.selection_values)
-    _validate_transfer_payload(payload, cleaned_values)
+@dataclass
+class _ListedTransfer:
+    source: ResolvedProviderPlaylist
+    destination: ResolvedProviderPlaylist
+    destination_is_created: bool
+    selected_count: int
+    matched_tracks: list[ProviderTrack]
+    duplicate_tracks: list[ProviderTrack]
+    to_add_tracks: list[ProviderTrack]
+    unmatched_tracks: list[ProviderTrack]
+    snapshots: dict[str, PlaylistSnapshot]
+
+    def to_checkpoint(self) -> ManagementTransferCheckpoint:
+        return ManagementTransferCheckpoint(
+            source=self.source.to_summary(),
+            destination=self.destination.to_summary(),
+            destination_is_created=self.destination_is_created,
+            matched_count=self.selected_count,
+            skipped_duplicate_count=len(self.duplicate_tracks),
+            to_add_track_ids=[track.provider_track_id for track in self.to_add_tracks],
+            # Kept apart from failed_items: they were never sent, count toward no progress and a retry can't add them.
+            unmatched_track_ids=[track.provider_track_id for track in self.unmatched_tracks],
+        )
 
-    client = get_owner_client(db, current_playlist)
-    source, destination, destination_is_created = await _resolve_transfer_endpoints(
-        db=db,
-        current_playlist=current_playlist,
-        current_user=current_user,
+
+@dataclass
+class _PreviewPlan:
+    playlist_id: int
+    user_id: int
+    payload_fingerprint: str
+    checkpoint: ManagementTransferCheckpoint
+    snapshots: dict[str, PlaylistSnapshot]
+
+
+def _transfer_payload_fingerprint(payload: ManagementTransferRequest, cleaned_values: list[str]) -> str:
+    data = payload.model_dump(mode="json", exclude={"preview_token"})
+    data["selection_values"] = cleaned_values
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _store_preview_plan(plan: _PreviewPlan) -> str:
+    now = time.monotonic()
+    expired_tokens = [token for token, (expires_at, _plan) in _preview_plans.items() if expires_at <= now]
+    for token in expired_tokens:
+        _preview_plans.pop(token, None)
+    token = secrets.token_urlsafe(24)
+    _preview_plans[token] = (now + PREVIEW_PLAN_TTL_SECONDS, plan)
+    return token
+
+
+def _take_preview_plan(
+    token: str | None,
+    *,
+    playlist_id: int,
+    user_id: int,
+    payload_fingerprint: str,
+) -> _PreviewPlan | None:
+    if not token:
+        return None
+    entry = _preview_plans.pop(token, None)
+    if entry is None:
+        return None
+    expires_at, plan = entry
+    if expires_at <= time.monotonic():
+        return None
+    if (plan.playlist_id, plan.user_id, plan.payload_fingerprint) != (playlist_id, user_id, payload_fingerprint):
+        return None
+    return plan
+
+
+async def _current_playlist_endpoint(
+    *,
+    client: MusicProviderClient,
+    current_playlist: VotunaPlaylist,
+    current_user: User,
+    endpoint: ResolvedProviderPlaylist,
+) -> ResolvedProviderPlaylist:
+    """Return ``endpoint`` with a provider snapshot and track count when it is the current playlist."""
+    if endpoint.track_count is not None or endpoint.snapshot_id is not None:
+        return endpoint
+    if endpoint.provider_playlist_id != current_playlist.provider_playlist_id:
+        return endpoint
+    resolved = await _safe_get_playlist(
         client=client,
-        payload=payload,
+        provider_playlist_id=current_playlist.provider_playlist_id,
+        current_user=current_user,
+        owner_id=current_playlist.owner_user_id,
+        provider=current_playlist.provider,
     )
+    return ResolvedProviderPlaylist(
+        provider=endpoint.provider,
+        provider_playlist_id=endpoint.provider_playlist_id,
+        title=endpoint.title,
+        track_count=resolved.track_count,
+        snapshot_id=resolved.snapshot_id,
+    )
+
+
+def _playlist_snapshot(playlist: ResolvedProviderPlaylist) -> PlaylistSnapshot:
+    # A snapshot id also changes when tracks are swapped or reordered; the track count is the fallback.
+    return playlist.snapshot_id or playlist.track_count
+
+
+def _snapshots_for(
+    source: ResolvedProviderPlaylist,
+    destination: ResolvedProviderPlaylist,
+    destination_is_created: bool,
+) -> dict[str, PlaylistSnapshot]:
+    snapshots = {source.provider_playlist_id: _playlist_snapshot(source)}
+    if not destination_is_created:
+        snapshots[destination.provider_playlist_id] = _playlist_snapshot(destination)
+    return snapshots
+
 
+async def _match_tracks_to_provider(
+    *,
+    client: MusicProviderClient,
+    current_playlist: VotunaPlaylist,
+    current_user: User,
+    tracks: list[ProviderTrack],
+    source_provider: str,
+) -> tuple[list[ProviderTrack], list[ProviderTrack]]:
+    """Resolve source tracks on the current playlist's provider.
+
+    Returns the matched catalog tracks, deduped by id, and the source tracks with no match.
+    """
+    try:
+        results = await match_tracks(
+            tracks,
+            source_provider=source_provider,
+            target_client=client,
+            target_provider=current_playlist.provider,
+        )
+    except ProviderAuthError:
+        raise_provider_auth(
+            current_user,
+            owner_id=current_playlist.owner_user_id,
+            provider=current_playlist.provider,
+        )
+        raise AssertionError("unreachable")
+    matched = _dedupe_tracks_by_id([result.target_track for result in results if result.target_track is not None])
+    unmatched = [result.source_track for result in results if result.target_track is None]
+    return matched, unmatched
+
+
+async def _list_transfer(
+    *,
+    client: MusicProviderClient,
+    current_playlist: VotunaPlaylist,
+    current_user: User,
+    payload: ManagementTransferRequest,
+    cleaned_values: list[str],
+    source: ResolvedProviderPlaylist,
+    destination: ResolvedProviderPlaylist,
+    destination_is_created: bool,
+) -> _ListedTransfer:
     source_tracks = await _safe_list_tracks(
-        client=client,
+        client=source.client or client,
         provider_playlist_id=source.provider_playlist_id,
         current_user=current_user,
-        owner_id=current_playlist.owner_user_id,
-        provider=current_playlist.provider,
+        owner_id=source.owner_user_id or current_playlist.owner_user_id,
+        provider=source.provider,
     )
+    match_fingerprints = payload.duplicate_match == "fingerprint"
     matched_tracks = _dedupe_tracks_by_id(
         _filter_tracks_by_selection(source_tracks, payload.selection_mode, cleaned_values)
     )
+    if match_fingerprints:
+        matched_tracks = dedupe_tracks_by_fingerprint(matched_tracks)
+    selected_count = len(matched_tracks)
+    unmatched_tracks: list[ProviderTrack] = []
+    if source.provider != destination.provider:
+        matched_tracks, unmatched_tracks = await _match_tracks_to_provider(
+            client=client,
+            current_playlist=current_playlist,
+            current_user=current_user,
+            tracks=matched_tracks,
+            source_provider=source.provider,
+        )
 
-    destination_track_ids: set[str] = set()
+    destination_tracks: list[ProviderTrack] = []
     if not destination_is_created:
         destination_tracks = await _safe_list_tracks(
             client=client,
@@ -557,64 +853,178 @@ async def preview_management_transfer(
             owner_id=current_playlist.owner_user_id,
             provider=current_playlist.provider,
         )
-        destination_track_ids = {track.provider_track_id for track in destination_tracks if track.provider_track_id}
-
-    duplicate_tracks = [track for track in matched_tracks if track.provider_track_id in destination_track_ids]
-    to_add_tracks = [track for track in matched_tracks if track.provider_track_id not in destination_track_ids]
-
-    if len(to_add_tracks) > MAX_TRACKS_PER_ACTION:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Transfer exceeds max tracks per action ({MAX_TRACKS_PER_ACTION})",
-        )
-
-    return ManagementPreviewResponse(
-        source=source.to_summary(),
-        destination=destination.to_summary(),
-        selection_mode=payload.selection_mode,
-        selection_values=cleaned_values,
-        matched_count=len(matched_tracks),
-        to_add_count=len(to_add_tracks),
-        duplicate_count=len(duplicate_tracks),
-        max_tracks_per_action=MAX_TRACKS_PER_ACTION,
-        matched_sample=[_provider_track_to_out(track) for track in matched_tracks],
-        duplicate_sample=[_provider_track_to_out(track) for track in duplicate_tracks],
+    destination_track_ids = {track.provider_track_id for track in destination_tracks if track.provider_track_id}
+    destination_fingerprints = TrackFingerprintIndex(destination_tracks) if match_fingerprints else None
+
+    duplicate_tracks: list[ProviderTrack] = []
+    to_add_tracks: list[ProviderTrack] = []
+    for track in matched_tracks:
+        if track.provider_track_id in destination_track_ids or (
+            destination_fingerprints is not None and destination_fingerprints.matches(track)
+        ):
+            duplicate_tracks.append(track)
+        else:
+            to_add_tracks.append(track)
+
+    return _ListedTransfer(
+        source=source,
+        destination=destination,
+        destination_is_created=destination_is_created,
+        selected_count=selected_count,
+        matched_tracks=matched_tracks,
+        duplicate_tracks=duplicate_tracks,
+        to_add_tracks=to_add_tracks,
+        unmatched_tracks=unmatched_tracks,
+        snapshots=_snapshots_for(source, destination, destination_is_created),
     )
 
 
-@router.post("/playlists/{playlist_id}/management/execute", response_model=ManagementExecuteResponse)
-async def execute_management_transfer(
+@router.post(
+    "/playlists/{playlist_id}/management/preview",
+    response_model=ManagementPreviewResponse,
+    response_class=FastJSONResponse,
+)
+async def preview_management_transfer(
     playlist_id: int,
     payload: ManagementTransferRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Execute a management transfer against provider playlists."""
+    """Preview a management transfer without mutating provider playlists.
+
+    Transfers over ``MAX_TRACKS_PER_ACTION`` are still previewed and flagged with
+    ``exceeds_max_tracks_per_action``: execute rejects them, but a background job
+    runs them without the cap.
+    """
     current_playlist = require_owner(db, playlist_id, current_user.id)
     cleaned_values = _sanitize_selection_values(payload.selection_values)
     _validate_transfer_payload(payload, cleaned_values)
 
     client = get_owner_client(db, current_playlist)
-    source, destination_preview, destination_is_created = await _resolve_transfer_endpoints(
+    source, destination, destination_is_created = await _resolve_transfer_endpoints(
         db=db,
         current_playlist=current_playlist,
         current_user=current_user,
         client=client,
         payload=payload,
     )
-
-    source_tracks = await _safe_list_tracks(
+    # Track counts taken before listing let execute tell whether this listing is still current.
+    source = await _current_playlist_endpoint(
         client=client,
-        provider_playlist_id=source.provider_playlist_id,
+        current_playlist=current_playlist,
         current_user=current_user,
-        owner_id=current_playlist.owner_user_id,
-        provider=current_playlist.provider,
+        endpoint=source,
     )
-    matched_tracks = _dedupe_tracks_by_id(
-        _filter_tracks_by_selection(source_tracks, payload.selection_mode, cleaned_values)
+    if not destination_is_created:
+        destination = await _current_playlist_endpoint(
+            client=client,
+            current_playlist=current_playlist,
+            current_user=current_user,
+            endpoint=destination,
+        )
+    listed = await _list_transfer(
+        client=client,
+        current_playlist=current_playlist,
+        current_user=current_user,
+        payload=payload,
+        cleaned_values=cleaned_values,
+        source=source,
+        destination=destination,
+        destination_is_created=destination_is_created,
+    )
+
+    preview_token = _store_preview_plan(
+        _PreviewPlan(
+            playlist_id=current_playlist.id,
+            user_id=current_user.id,
+            payload_fingerprint=_transfer_payload_fingerprint(payload, cleaned_values),
+            checkpoint=listed.to_checkpoint(),
+            snapshots=listed.snapshots,
+        )
+    )
+    # Samples can hold thousands of tracks; dump them without the jsonable_encoder round trip.
+    return model_response(
+        ManagementPreviewResponse(
+            source=source.to_summary(),
+            destination=destination.to_summary(),
+            selection_mode=payload.selection_mode,
+            selection_values=cleaned_values,
+            matched_count=listed.selected_count,
+            to_add_count=len(listed.to_add_tracks),
+            duplicate_count=len(listed.duplicate_tracks),
+            unmatched_count=len(listed.unmatched_tracks),
+            max_tracks_per_action=MAX_TRACKS_PER_ACTION,
+            exceeds_max_tracks_per_action=len(listed.to_add_tracks) > MAX_TRACKS_PER_ACTION,
+            matched_sample=_provider_tracks_to_out(listed.matched_tracks),
+            duplicate_sample=_provider_tracks_to_out(listed.duplicate_tracks),
+            unmatched_sample=_provider_tracks_to_out(listed.unmatched_tracks),
+            preview_token=preview_token,
+        )
     )
 
-    created_destination_summary: ManagementPlaylistSummary | None = None
+
+async def _plan_transfer(
+    *,
+    db: Session,
+    current_playlist: VotunaPlaylist,
+    current_user: User,
+    client: MusicProviderClient,
+    payload: ManagementTransferRequest,
+    cleaned_values: list[str],
+    max_tracks: int | None,
+) -> ManagementTransferCheckpoint:
+    """Build the transfer plan, reusing a preview listing when its snapshots still match."""
+    source, destination, destination_is_created = await _resolve_transfer_endpoints(
+        db=db,
+        current_playlist=current_playlist,
+        current_user=current_user,
+        client=client,
+        payload=payload,
+    )
+
+    checkpoint: ManagementTransferCheckpoint | None = None
+    preview_plan = _take_preview_plan(
+        payload.preview_token,
+        playlist_id=current_playlist.id,
+        user_id=current_user.id,
+        payload_fingerprint=_transfer_payload_fingerprint(payload, cleaned_values),
+    )
+    if preview_plan is not None:
+        source = await _current_playlist_endpoint(
+            client=client,
+            current_playlist=current_playlist,
+            current_user=current_user,
+            endpoint=source,
+        )
+        if not destination_is_created:
+            destination = await _current_playlist_endpoint(
+                client=client,
+                current_playlist=current_playlist,
+                current_user=current_user,
+                endpoint=destination,
+            )
+        snapshots = _snapshots_for(source, destination, destination_is_created)
+        if None not in snapshots.values() and snapshots == preview_plan.snapshots:
+            checkpoint = preview_plan.checkpoint.model_copy(deep=True)
+
+    if checkpoint is None:
+        listed = await _list_transfer(
+            client=client,
+            current_playlist=current_playlist,
+            current_user=current_user,
+            payload=payload,
+            cleaned_values=cleaned_values,
+            source=source,
+            destination=destination,
+            destination_is_created=destination_is_created,
+        )
+        checkpoint = listed.to_checkpoint()
+
+    if max_tracks is not None and len(checkpoint.to_add_track_ids) > max_tracks:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Transfer exceeds max tracks per action ({max_tracks})",
+        )
 
     if destination_is_created:
         assert payload.destination_create is not None
@@ -634,47 +1044,159 @@ async def execute_management_transfer(
         except ProviderAPIError as exc:
             raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
 
-        destination = ResolvedProviderPlaylist(
+        checkpoint.destination = ManagementPlaylistSummary(
             provider=current_playlist.provider,  # type: ignore[arg-type]
             provider_playlist_id=created_destination.provider_playlist_id,
             title=created_destination.title,
         )
-        created_destination_summary = destination.to_summary()
-        destination_track_ids: set[str] = set()
+
+    return checkpoint
+
+
+def _is_rate_limited(exc: ProviderAPIError) -> bool:
+    return exc.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+
+async def _bisect_add_tracks(
+    *,
+    client: MusicProviderClient,
+    provider_playlist_id: str,
+    track_ids: list[str],
+    added_track_ids: list[str],
+    failed_items: list[ManagementFailedItem],
+) -> None:
+    """Add a batch that already failed as a whole by splitting it until bad tracks are isolated.
+
+    k bad tracks in a batch of n cost roughly 2k log n provider calls instead of n.
+    Halves are sent one after another, never concurrently: some providers
+    (SoundCloud) add by rewriting the whole playlist, so overlapping calls would
+    drop each other's tracks, and even append-only providers would add them out
+    of source order. Only per-item rejections are split: auth errors, rate limits
+    and anything unexpected propagate, with ``added_track_ids`` complete so far.
+    """
+
+    async def add_or_split(batch: list[str]) -> None:
+        try:
+            await client.add_tracks(provider_playlist_id, batch)
+            added_track_ids.extend(batch)
+            return
+        except ProviderAPIError as exc:
+            if _is_rate_limited(exc):
+                raise
+            error = exc
+        if len(batch) == 1:
+            failed_items.append(ManagementFailedItem(provider_track_id=batch[0], error=str(error)))
+            return
+        await split(batch)
+
+    async def split(batch: list[str]) -> None:
+        middle = len(batch) // 2
+        await add_or_split(batch[:middle])
+        await add_or_split(batch[middle:])
+
+    if len(track_ids) == 1:
+        await add_or_split(track_ids)
     else:
-        destination = destination_preview
-        destination_tracks = await _safe_list_tracks(
-            client=client,
-            provider_playlist_id=destination.provider_playlist_id,
+        await split(track_ids)
+
+
+def _record_transfer_provenance(
+    db: Session,
+    *,
+    provider: str,
+    destination_playlist_ids: list[int],
+    track_ids: list[str],
+    added_by_user_id: int,
+) -> None:
+    if not track_ids:
+        return
+    added_at = datetime.now(timezone.utc)
+    for destination_playlist_id in destination_playlist_ids:
+        for track_id in track_ids:
+            votuna_track_addition_crud.create(
+                db,
+                {
+                    "playlist_id": destination_playlist_id,
+                    "provider_track_id": track_id,
+                    "source": "playlist_utils",
+                    "added_at": added_at,
+                    "added_by_user_id": added_by_user_id,
+                    "suggestion_id": None,
+                },
+            )
+        votuna_recommendation_pool_crud.mark_stale(db, destination_playlist_id)
+
+
+async def _execute_transfer(
+    *,
+    db: Session,
+    current_playlist: VotunaPlaylist,
+    current_user: User,
+    client: MusicProviderClient,
+    payload: ManagementTransferRequest,
+    cleaned_values: list[str],
+    max_tracks: int | None,
+    checkpoint: ManagementTransferCheckpoint | None = None,
+    on_checkpoint: TransferCheckpointCallback | None = None,
+) -> ManagementExecuteResponse:
+    """Plan and apply a transfer, resuming after the chunks recorded in ``checkpoint``.
+
+    ``on_checkpoint`` runs once the plan is fixed and again after every chunk, so
+    a retry never re-lists playlists, re-creates a destination or re-adds
+    confirmed tracks.
+    """
+    if checkpoint is None:
+        checkpoint = await _plan_transfer(
+            db=db,
+            current_playlist=current_playlist,
             current_user=current_user,
-            owner_id=current_playlist.owner_user_id,
-            provider=current_playlist.provider,
+            client=client,
+            payload=payload,
+            cleaned_values=cleaned_values,
+            max_tracks=max_tracks,
         )
-        destination_track_ids = {track.provider_track_id for track in destination_tracks if track.provider_track_id}
-
-    duplicate_tracks = [track for track in matched_tracks if track.provider_track_id in destination_track_ids]
-    to_add_track_ids = [
-        track.provider_track_id for track in matched_tracks if track.provider_track_id not in destination_track_ids
+        if on_checkpoint is not None:
+            on_checkpoint(checkpoint)
+
+    destination_playlist_id = checkpoint.destination.provider_playlist_id
+    destination_playlist_ids = [
+        playlist_id
+        for (playlist_id,) in db.query(VotunaPlaylist.id)
+        .filter(
+            VotunaPlaylist.provider == current_playlist.provider,
+            VotunaPlaylist.provider_playlist_id == destination_playlist_id,
+        )
+        .all()
     ]
-
-    if len(to_add_track_ids) > MAX_TRACKS_PER_ACTION:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Transfer exceeds max tracks per action ({MAX_TRACKS_PER_ACTION})",
+    # Failed tracks are not settled: a resumed job tries them again, since most failures are transient.
+    settled_track_ids = set(checkpoint.added_track_ids)
+    remaining_track_ids = [track_id for track_id in checkpoint.to_add_track_ids if track_id not in settled_track_ids]
+
+    def save_chunk(added_track_ids: list[str], failed_items: list[ManagementFailedItem]) -> None:
+        # Replace failures recorded by an earlier attempt at these tracks with this attempt's outcome.
+        attempted_track_ids = set(added_track_ids).union(item.provider_track_id for item in failed_items)
+        checkpoint.failed_items = [
+            item for item in checkpoint.failed_items if item.provider_track_id not in attempted_track_ids
+        ] + failed_items
+        checkpoint.added_track_ids.extend(added_track_ids)
+        _record_transfer_provenance(
+            db,
+            provider=current_playlist.provider,
+            destination_playlist_ids=destination_playlist_ids,
+            track_ids=added_track_ids,
+            added_by_user_id=current_user.id,
         )
+        if on_checkpoint is not None:
+            on_checkpoint(checkpoint)
 
-    added_count = 0
-    successfully_added_track_ids: list[str] = []
-    failed_items: list[ManagementFailedItem] = []
-
-    for chunk in _chunks(to_add_track_ids, ADD_CHUNK_SIZE):
+    for chunk in _chunks(remaining_track_ids, ADD_CHUNK_SIZE):
         if not chunk:
             continue
+        chunk_added_track_ids: list[str] = []
+        chunk_failed_items: list[ManagementFailedItem] = []
         try:
-            await client.add_tracks(destination.provider_playlist_id, chunk)
-            added_count += len(chunk)
-            successfully_added_track_ids.extend(chunk)
-            continue
+            await client.add_tracks(destination_playlist_id, chunk)
+            chunk_added_track_ids.extend(chunk)
         except ProviderAuthError:
             raise_provider_auth(
                 current_user,
@@ -682,58 +1204,206 @@ async def execute_management_transfer(
                 provider=current_playlist.provider,
             )
             raise AssertionError("unreachable")
-        except ProviderAPIError:
-            # Fall back to per-track retries for best-effort behavior.
-            pass
-
-        for track_id in chunk:
+        except ProviderAPIError as exc:
+            if _is_rate_limited(exc):
+                raise_provider_api_error(exc)
+            # Isolate the tracks the provider rejects without retrying the whole chunk one track at a time.
             try:
-                await client.add_tracks(destination.provider_playlist_id, [track_id])
-                added_count += 1
-                successfully_added_track_ids.append(track_id)
+                await _bisect_add_tracks(
+                    client=client,
+                    provider_playlist_id=destination_playlist_id,
+                    track_ids=chunk,
+                    added_track_ids=chunk_added_track_ids,
+                    failed_items=chunk_failed_items,
+                )
             except ProviderAuthError:
+                # Keep the tracks confirmed so far in this chunk before bailing out.
+                save_chunk(chunk_added_track_ids, chunk_failed_items)
                 raise_provider_auth(
                     current_user,
                     owner_id=current_playlist.owner_user_id,
                     provider=current_playlist.provider,
                 )
                 raise AssertionError("unreachable")
-            except ProviderAPIError as exc:
-                failed_items.append(ManagementFailedItem(provider_track_id=track_id, error=str(exc)))
-            except Exception as exc:  # pragma: no cover - defensive fallback
-                failed_items.append(ManagementFailedItem(provider_track_id=track_id, error=str(exc)))
-
-    if successfully_added_track_ids:
-        destination_playlists = (
-            db.query(VotunaPlaylist)
-            .filter(
-                VotunaPlaylist.provider == current_playlist.provider,
-                VotunaPlaylist.provider_playlist_id == destination.provider_playlist_id,
-            )
-            .all()
-        )
-        added_at = datetime.now(timezone.utc)
-        for destination_playlist in destination_playlists:
-            for track_id in successfully_added_track_ids:
-                votuna_track_addition_crud.create(
-                    db,
-                    {
-                        "playlist_id": destination_playlist.id,
-                        "provider_track_id": track_id,
-                        "source": "playlist_utils",
-                        "added_at": added_at,
-                        "added_by_user_id": current_user.id,
-                        "suggestion_id": None,
-                    },
-                )
+            except ProviderAPIError as rate_limit_exc:
+                save_chunk(chunk_added_track_ids, chunk_failed_items)
+                raise_provider_api_error(rate_limit_exc)
+        save_chunk(chunk_added_track_ids, chunk_failed_items)
 
     return ManagementExecuteResponse(
-        source=source.to_summary(),
-        destination=destination.to_summary(),
-        created_destination=created_destination_summary,
-        matched_count=len(matched_tracks),
-        added_count=added_count,
-        skipped_duplicate_count=len(duplicate_tracks),
-        failed_count=len(failed_items),
-        failed_items=failed_items,
+        source=checkpoint.source,
+        destination=checkpoint.destination,
+        created_destination=checkpoint.destination if checkpoint.destination_is_created else None,
+        matched_count=checkpoint.matched_count,
+        added_count=len(checkpoint.added_track_ids),
+        skipped_duplicate_count=checkpoint.skipped_duplicate_count,
+        failed_count=len(checkpoint.failed_items),
+        failed_items=list(checkpoint.failed_items),
+        unmatched_count=len(checkpoint.unmatched_track_ids),
+        unmatched_track_ids=list(checkpoint.unmatched_track_ids),
+    )
+
+
+@router.post("/playlists/{playlist_id}/management/execute", response_model=ManagementExecuteResponse)
+async def execute_management_transfer(
+    playlist_id: int,
+    payload: ManagementTransferRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Execute a management transfer against provider playlists."""
+    current_playlist = require_owner(db, playlist_id, current_user.id)
+    cleaned_values = _sanitize_selection_values(payload.selection_values)
+    _validate_transfer_payload(payload, cleaned_values)
+
+    client = get_owner_client(db, current_playlist)
+    return await _execute_transfer(
+        db=db,
+        current_playlist=current_playlist,
+        current_user=current_user,
+        client=client,
+        payload=payload,
+        cleaned_values=cleaned_values,
+        max_tracks=MAX_TRACKS_PER_ACTION,
+    )
+
+
+async def run_management_job(db: Session, job: VotunaManagementJob) -> None:
+    """Run one claimed transfer job, resuming from its last checkpoint if it has one."""
+    payload = ManagementTransferRequest.model_validate(job.request_payload)
+    cleaned_values = _sanitize_selection_values(payload.selection_values)
+    checkpoint = ManagementTransferCheckpoint.model_validate(job.checkpoint) if job.checkpoint else None
+    lease_token = job.lease_token
+
+    def save(values: dict[str, Any]) -> None:
+        # Another worker reclaimed the job if the lease moved on; stop before adding tracks twice.
+        if not votuna_management_job_crud.update_leased(db, job, values, lease_token=lease_token):
+            raise ManagementJobLeaseLost(job.id)
+
+    def record_checkpoint(current: ManagementTransferCheckpoint) -> None:
+        save(
+            {
+                "checkpoint": current.model_dump(mode="json"),
+                "total_count": len(current.to_add_track_ids),
+                "processed_count": len(current.added_track_ids) + len(current.failed_items),
+                "added_count": len(current.added_track_ids),
+                "failed_count": len(current.failed_items),
+                "unmatched_count": len(current.unmatched_track_ids),
+            }
+        )
+
+    try:
+        current_playlist = require_owner(db, job.playlist_id, job.requested_by_user_id)
+        current_user = user_crud.get(db, job.requested_by_user_id)
+        if current_user is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        client = get_owner_client(db, current_playlist)
+        result = await _execute_transfer(
+            db=db,
+            current_playlist=current_playlist,
+            current_user=current_user,
+            client=client,
+            payload=payload,
+            cleaned_values=cleaned_values,
+            max_tracks=None,
+            checkpoint=checkpoint,
+            on_checkpoint=record_checkpoint,
+        )
+    except HTTPException as exc:
+        save(
+            {
+                "status": "failed",
+                "error": str(exc.detail),
+                "finished_at": datetime.now(timezone.utc),
+            }
+        )
+        return
+
+    save(
+        {
+            "status": "completed",
+            "added_count": result.added_count,
+            "failed_count": result.failed_count,
+            "unmatched_count": result.unmatched_count,
+            "result": result.model_dump(mode="json"),
+            "finished_at": datetime.now(timezone.utc),
+        }
+    )
+
+
+management_job_workers = ManagementJobWorkerPool(run_management_job)
+
+
+@router.post(
+    "/playlists/{playlist_id}/management/jobs",
+    response_model=ManagementJobOut,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_management_job(
+    playlist_id: int,
+    payload: ManagementTransferRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Queue a management transfer to run in the background without a track cap."""
+    current_playlist = require_owner(db, playlist_id, current_user.id)
+    cleaned_values = _sanitize_selection_values(payload.selection_values)
+    _validate_transfer_payload(payload, cleaned_values)
+    job = votuna_management_job_crud.create(
+        db,
+        {
+            "playlist_id": current_playlist.id,
+            "requested_by_user_id": current_user.id,
+            "request_payload": payload.model_dump(mode="json"),
+        },
+    )
+    management_job_workers.notify()
+    return ManagementJobOut.model_validate(job)
+
+
+@router.get("/playlists/{playlist_id}/management/jobs/{job_id}", response_model=ManagementJobOut)
+async def get_management_job(
+    playlist_id: int,
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Return progress and, once finished, the outcome of a transfer job."""
+    require_owner(db, playlist_id, current_user.id)
+    job = votuna_management_job_crud.get_for_playlist(db, playlist_id, job_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return ManagementJobOut.model_validate(job)
+
+
+@router.post(
+    "/playlists/{playlist_id}/management/jobs/{job_id}/retry",
+    response_model=ManagementJobOut,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def retry_management_job(
+    playlist_id: int,
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Requeue a failed job, or a completed one with failed tracks, to resume from its last checkpoint.
+
+    The resumed run skips tracks already added and tries the failed ones again.
+    """
+    require_owner(db, playlist_id, current_user.id)
+    job = votuna_management_job_crud.get_for_playlist(db, playlist_id, job_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    if job.status != "failed" and not (job.status == "completed" and job.failed_count):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Only failed jobs or jobs with failed tracks can be retried",
+        )
+    job = votuna_management_job_crud.update(
+        db,
+        job,
+        {"status": "queued", "error": None, "result": None, "finished_at": None},
     )
+    management_job_workers.notify()
+    return ManagementJobOut.model_validate(job)
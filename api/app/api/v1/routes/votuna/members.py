@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from app.api.routing import TimedAPIRoute
 from app.auth.dependencies import get_current_user
 from app.db.session import get_db
 from app.models.user import User
@@ -12,7 +13,7 @@ from app.schemas.votuna_member import VotunaPlaylistMemberOut
 from app.crud.votuna_playlist_member import votuna_playlist_member_crud
 from app.api.v1.routes.votuna.common import get_playlist_or_404, require_member, require_owner
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 @router.get("/playlists/{playlist_id}/members", response_model=list[VotunaPlaylistMemberOut])
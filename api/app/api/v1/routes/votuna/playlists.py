@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
+from app.api.routing import TimedAPIRoute
 from app.api.v1.routes.votuna.common import (
     get_owner_client,
     get_playlist_or_404,
@@ -19,6 +20,7 @@ from app.auth.dependencies import get_current_user
 from app.crud.votuna_playlist import votuna_playlist_crud
 from app.crud.votuna_playlist_member import votuna_playlist_member_crud
 from app.crud.votuna_playlist_settings import votuna_playlist_settings_crud
+from app.crud.votuna_recommendation_pool import votuna_recommendation_pool_crud
 from app.crud.votuna_track_addition import votuna_track_addition_crud
 from app.db.session import get_db
 from app.models.user import User
@@ -38,8 +40,9 @@ from app.schemas.votuna_playlist_settings import (
     VotunaPlaylistSettingsUpdate,
 )
 from app.services.music_providers import ProviderAPIError, ProviderAuthError
+from app.utils.json_response import FastJSONResponse, model_list_response
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 PERSONAL_SETTINGS_ERROR_CODE = "PERSONAL_PLAYLIST_SETTINGS_DISABLED"
 COLLABORATIVE_DIRECT_ADD_ERROR_CODE = "COLLABORATIVE_PLAYLIST_DIRECT_ADD_DISABLED"
@@ -400,7 +403,11 @@ def personalize_playlist(
     )
 
 
-@router.get("/playlists/{playlist_id}/tracks", response_model=list[ProviderTrackOut])
+@router.get(
+    "/playlists/{playlist_id}/tracks",
+    response_model=list[ProviderTrackOut],
+    response_class=FastJSONResponse,
+)
 async def list_votuna_tracks(
     playlist_id: int,
     db: Session = Depends(get_db),
@@ -557,7 +564,7 @@ async def list_votuna_tracks(
                 suggested_by_display_name=suggested_by_display_name,
             )
         )
-    return payload
+    return model_list_response(ProviderTrackOut, payload)
 
 
 @router.delete("/playlists/{playlist_id}/tracks/{provider_track_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -584,4 +591,5 @@ async def remove_votuna_track(
                 detail=str(exc),
             ) from exc
         raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
+    votuna_recommendation_pool_crud.mark_stale(db, playlist.id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,14 +1,18 @@
 """Votuna suggestion routes."""
 
-import asyncio
 import hashlib
+import secrets
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Callable, Coroutine, cast
+from typing import Any, Awaitable, cast
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import Session
 
+from app.api.routing import TimedAPIRoute
 from app.api.v1.routes.votuna.common import (
     get_owner_client,
     get_playlist_or_404,
@@ -18,17 +22,20 @@ from app.api.v1.routes.votuna.common import (
     require_owner,
 )
 from app.auth.dependencies import get_current_user
+from app.crud.votuna_playlist import votuna_playlist_crud
 from app.crud.votuna_playlist_member import votuna_playlist_member_crud
 from app.crud.votuna_playlist_settings import votuna_playlist_settings_crud
+from app.crud.votuna_recommendation_pool import votuna_recommendation_pool_crud
 from app.crud.votuna_track_addition import votuna_track_addition_crud
 from app.crud.votuna_track_recommendation_decline import (
     votuna_track_recommendation_decline_crud,
 )
 from app.crud.votuna_track_suggestion import votuna_track_suggestion_crud
 from app.crud.votuna_track_vote import votuna_track_vote_crud
-from app.db.session import get_db
+from app.db.session import SessionLocal, get_db
 from app.models.user import User
 from app.models.votuna_playlist import VotunaPlaylist
+from app.models.votuna_recommendation_pools import VotunaRecommendationPool
 from app.models.votuna_suggestions import VotunaTrackSuggestion
 from app.schemas.votuna_playlist import ProviderTrackOut
 from app.schemas.votuna_suggestion import (
@@ -37,23 +44,50 @@ from app.schemas.votuna_suggestion import (
     VotunaTrackSuggestionCreate,
     VotunaTrackSuggestionOut,
 )
-from app.services.music_providers import ProviderAPIError, ProviderAuthError
+from app.services.music_providers import MusicProviderClient, ProviderAPIError, ProviderAuthError
 from app.services.music_providers.base import ProviderTrack
+from app.services.recommendation_pool import (
+    RECOMMENDATION_POOL_ACCESS_TOUCH_SECONDS,
+    RECOMMENDATION_POOL_MAX_AGE_SECONDS,
+    RecommendationPoolRefresher,
+    build_candidate_pool,
+    declined_track_filter,
+    rank_candidates,
+)
+from app.utils.async_cache import SingleFlightTTLCache
+from app.utils.json_response import FastJSONResponse, model_list_response
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 REJECTED_TRACK_ERROR_CODE = "TRACK_PREVIOUSLY_REJECTED"
 PERSONAL_SUGGESTIONS_ERROR_CODE = "PERSONAL_PLAYLIST_SUGGESTIONS_DISABLED"
 RECOMMENDATION_SEED_LIMIT = 4
-RECOMMENDATION_RELATED_LIMIT_PER_SEED = 12
 RECOMMENDATION_MAX_TRACKS_PER_ARTIST = 2
-RECOMMENDATION_RESULT_BUFFER = 8
-RECOMMENDATION_CACHE_TTL_SECONDS = 30.0
 RECOMMENDATIONS_DISABLED_PROVIDERS = {"spotify", "apple"}
+RECOMMENDATION_CURSOR_HEADER = "X-Votuna-Next-Cursor"
+RECOMMENDATION_CURSOR_TTL_SECONDS = 10 * 60.0
+RECOMMENDATION_CURSOR_MAX_ENTRIES = 1_024
+RECOMMENDATION_POOL_TRACK_COUNT_CHECK_SECONDS = 60.0
+RECOMMENDATION_POOL_TRACK_COUNT_CHECK_MAX_ENTRIES = 4_096
+
+TRACK_SEARCH_CACHE_TTL_SECONDS = 15.0
 
-_recommendation_cache_lock = asyncio.Lock()
-_recommendation_cache: dict[str, tuple[float, list[ProviderTrackOut]]] = {}
-_recommendation_inflight: dict[str, asyncio.Task[list[ProviderTrackOut]]] = {}
+
+def _copy_track_outs(tracks: list[ProviderTrackOut]) -> list[ProviderTrackOut]:
+    return [item.model_copy(deep=True) for item in tracks]
+
+
+# Pools live in the database; this only collapses concurrent rebuilds of one playlist's pool.
+_recommendation_cache: SingleFlightTTLCache[int, dict[str, Any]] = SingleFlightTTLCache(0.0)
+# When each playlist's pool was last compared with the provider's track count, most recently used last.
+_pool_track_count_checks: OrderedDict[int, float] = OrderedDict()
+# Ranked lists behind handed-out cursors, most recently used last.
+_recommendation_cursors: OrderedDict[str, tuple[float, "_RankedRecommendations"]] = OrderedDict()
+# Searches run with the playlist owner's token, so collaborators on one owner's playlists share results and
+# failures; keying by owner keeps one owner's expired token from surfacing on another owner's playlist.
+_track_search_cache: SingleFlightTTLCache[tuple[int, str, str, int, bool], list[ProviderTrackOut]] = (
+    SingleFlightTTLCache(TRACK_SEARCH_CACHE_TTL_SECONDS, copy_value=_copy_track_outs)
+)
 
 
 def _display_name(user: User) -> str:
@@ -76,17 +110,10 @@ def _raise_resuggest_conflict() -> None:
 
 
 def _ordered_seed_track_ids(
-    current_tracks: list[ProviderTrack],
+    pool_seed_track_ids: list[str],
     refresh_nonce: str | None,
 ) -> list[str]:
-    track_ids: list[str] = []
-    seen: set[str] = set()
-    for track in current_tracks:
-        track_id = (track.provider_track_id or "").strip()
-        if not track_id or track_id in seen:
-            continue
-        seen.add(track_id)
-        track_ids.append(track_id)
+    track_ids = [track_id for track_id in pool_seed_track_ids if track_id]
     if not track_ids:
         return []
     if not refresh_nonce:
@@ -113,79 +140,170 @@ def _serialize_provider_track(track: ProviderTrack) -> ProviderTrackOut:
     )
 
 
-def _recommendation_cache_key(
-    *,
-    playlist_id: int,
-    user_id: int,
-    provider: str,
-    limit: int,
-    offset: int,
-    refresh_nonce: str | None,
-) -> str:
-    nonce = (refresh_nonce or "").strip()
-    return f"{playlist_id}:{user_id}:{provider}:{limit}:{offset}:{nonce}"
-
-
-def _prune_recommendation_cache(now: float) -> None:
-    expired_keys = [key for key, (expires_at, _payload) in _recommendation_cache.items() if expires_at <= now]
-    for key in expired_keys:
-        _recommendation_cache.pop(key, None)
-
-
-async def _run_recommendation_cached(
-    cache_key: str,
-    operation: Callable[[], Coroutine[Any, Any, list[ProviderTrackOut]]],
-) -> list[ProviderTrackOut]:
-    now = time.monotonic()
-    cached_entry = _recommendation_cache.get(cache_key)
-    if cached_entry and cached_entry[0] > now:
-        return [item.model_copy(deep=True) for item in cached_entry[1]]
-
-    created_task = False
-    async with _recommendation_cache_lock:
-        now = time.monotonic()
-        _prune_recommendation_cache(now)
-        cached_entry = _recommendation_cache.get(cache_key)
-        if cached_entry and cached_entry[0] > now:
-            return [item.model_copy(deep=True) for item in cached_entry[1]]
-        task = _recommendation_inflight.get(cache_key)
-        if task is None:
-            task = asyncio.create_task(operation())
-            _recommendation_inflight[cache_key] = task
-            created_task = True
+def _pool_is_fresh(pool: VotunaRecommendationPool | None, provider: str) -> bool:
+    if pool is None or pool.is_stale or pool.provider != provider:
+        return False
+    computed_at = pool.computed_at
+    if computed_at.tzinfo is None:
+        computed_at = computed_at.replace(tzinfo=timezone.utc)
+    age_seconds = (datetime.now(timezone.utc) - computed_at).total_seconds()
+    return age_seconds < RECOMMENDATION_POOL_MAX_AGE_SECONDS
+
 
+async def _rebuild_recommendation_pool(playlist_id: int, bind: Engine | Connection) -> dict[str, Any]:
+    """List the playlist's tracks, fetch related candidates and persist them as the playlist's pool.
+
+    Every request waiting on a shared rebuild awaits this task, so it runs on its
+    own session rather than whichever request's session happened to start it.
+    """
+    db = SessionLocal(bind=bind)
     try:
-        payload = await task
-    except Exception:
-        if created_task:
-            async with _recommendation_cache_lock:
-                if _recommendation_inflight.get(cache_key) is task:
-                    _recommendation_inflight.pop(cache_key, None)
-        raise
+        playlist = votuna_playlist_crud.get(db, playlist_id)
+        if playlist is None:
+            return {"seed_track_ids": [], "candidates": []}
+        client = get_owner_client(db, playlist)
+        track_count = await _provider_track_count(client, playlist)
+        _mark_pool_track_count_checked(playlist_id)
+        current_tracks = list(await client.list_tracks(playlist.provider_playlist_id))
+        data = await build_candidate_pool(client, current_tracks, provider=playlist.provider)
+        votuna_recommendation_pool_crud.save_pool(
+            db,
+            playlist_id=playlist.id,
+            data={
+                **data,
+                "provider": playlist.provider,
+                "track_count": track_count,
+                "computed_at": datetime.now(timezone.utc),
+            },
+        )
+        return data
+    finally:
+        db.close()
+
+
+def _run_pool_rebuild(db: Session, playlist_id: int) -> Awaitable[dict[str, Any]]:
+    return _recommendation_cache.run(playlist_id, lambda: _rebuild_recommendation_pool(playlist_id, db.get_bind()))
+
+
+async def _provider_track_count(client: MusicProviderClient, playlist: VotunaPlaylist) -> int | None:
+    """Return the provider-reported track count, or None when the provider can't say right now."""
+    try:
+        provider_playlist = await client.get_playlist(playlist.provider_playlist_id)
+    except ProviderAPIError:
+        return None
+    return provider_playlist.track_count
+
+
+def _mark_pool_track_count_checked(playlist_id: int) -> None:
+    _pool_track_count_checks[playlist_id] = time.monotonic()
+    _pool_track_count_checks.move_to_end(playlist_id)
+    while len(_pool_track_count_checks) > RECOMMENDATION_POOL_TRACK_COUNT_CHECK_MAX_ENTRIES:
+        _pool_track_count_checks.popitem(last=False)
+
+
+def _pool_track_count_check_due(playlist_id: int) -> bool:
+    checked_at = _pool_track_count_checks.get(playlist_id)
+    if checked_at is not None and time.monotonic() - checked_at < RECOMMENDATION_POOL_TRACK_COUNT_CHECK_SECONDS:
+        return False
+    _mark_pool_track_count_checked(playlist_id)
+    return True
 
-    if created_task:
-        async with _recommendation_cache_lock:
-            if _recommendation_inflight.get(cache_key) is task:
-                _recommendation_inflight.pop(cache_key, None)
-            _recommendation_cache[cache_key] = (
-                time.monotonic() + RECOMMENDATION_CACHE_TTL_SECONDS,
-                [item.model_copy(deep=True) for item in payload],
-            )
 
-    return [item.model_copy(deep=True) for item in payload]
+async def _pool_matches_playlist(db: Session, playlist: VotunaPlaylist, pool: VotunaRecommendationPool) -> bool:
+    """Catch tracks added or removed on the provider since the pool was built, which never mark it stale.
 
+    The provider is asked at most once per check interval per playlist, so most
+    reads are served from the stored pool without a provider round trip.
+    """
+    if pool.track_count is None or not _pool_track_count_check_due(playlist.id):
+        return True
+    track_count = await _provider_track_count(get_owner_client(db, playlist), playlist)
+    return track_count is None or track_count == pool.track_count
 
-async def _invalidate_recommendation_cache_for_playlist(playlist_id: int) -> None:
-    prefix = f"{playlist_id}:"
-    async with _recommendation_cache_lock:
-        keys_to_remove = [key for key in _recommendation_cache if key.startswith(prefix)]
-        for key in keys_to_remove:
-            _recommendation_cache.pop(key, None)
-        inflight_keys = [key for key in _recommendation_inflight if key.startswith(prefix)]
-        for key in inflight_keys:
-            task = _recommendation_inflight.pop(key, None)
-            if task and not task.done():
-                task.cancel()
+
+def _touch_recommendation_pool(db: Session, playlist_id: int, last_accessed_at: datetime | None) -> None:
+    """Record a read so the refresher keeps the pool warm, writing at most once per touch interval."""
+    now = datetime.now(timezone.utc)
+    if last_accessed_at is not None:
+        if last_accessed_at.tzinfo is None:
+            last_accessed_at = last_accessed_at.replace(tzinfo=timezone.utc)
+        if (now - last_accessed_at).total_seconds() < RECOMMENDATION_POOL_ACCESS_TOUCH_SECONDS:
+            return
+    votuna_recommendation_pool_crud.touch(db, playlist_id, accessed_at=now)
+
+
+async def _load_recommendation_pool(db: Session, playlist: VotunaPlaylist) -> dict[str, Any]:
+    pool = votuna_recommendation_pool_crud.get_by_playlist_id(db, playlist.id)
+    last_accessed_at = pool.last_accessed_at if pool is not None else None
+    if (
+        pool is not None
+        and _pool_is_fresh(pool, playlist.provider)
+        and await _pool_matches_playlist(db, playlist, pool)
+    ):
+        data = {"seed_track_ids": list(pool.seed_track_ids or []), "candidates": list(pool.candidates or [])}
+    else:
+        data = await _run_pool_rebuild(db, playlist.id)
+    _touch_recommendation_pool(db, playlist.id, last_accessed_at)
+    return data
+
+
+async def refresh_recommendation_pool(db: Session, playlist_id: int) -> None:
+    """Background handler: rebuild one playlist's pool, dropping it when recommendations no longer apply."""
+    playlist = votuna_playlist_crud.get(db, playlist_id)
+    if playlist is None:
+        return
+    if playlist.provider in RECOMMENDATIONS_DISABLED_PROVIDERS:
+        pool = votuna_recommendation_pool_crud.get_by_playlist_id(db, playlist_id)
+        if pool is not None:
+            votuna_recommendation_pool_crud.delete(db, pool.id)
+        return
+    await _run_pool_rebuild(db, playlist.id)
+
+
+recommendation_pool_refresher = RecommendationPoolRefresher(refresh_recommendation_pool)
+
+
+@dataclass(frozen=True)
+class _RankedRecommendations:
+    playlist_id: int
+    user_id: int
+    tracks: tuple[ProviderTrackOut, ...]
+
+
+def _store_ranked_recommendations(ranked: _RankedRecommendations) -> str:
+    token = secrets.token_urlsafe(18)
+    _recommendation_cursors[token] = (time.monotonic() + RECOMMENDATION_CURSOR_TTL_SECONDS, ranked)
+    while len(_recommendation_cursors) > RECOMMENDATION_CURSOR_MAX_ENTRIES:
+        _recommendation_cursors.popitem(last=False)
+    return token
+
+
+def _parse_recommendation_cursor(cursor: str) -> tuple[str, int]:
+    token, _separator, raw_position = cursor.rpartition(".")
+    if not token or not raw_position.isdigit():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid recommendation cursor")
+    return token, int(raw_position)
+
+
+def _get_ranked_recommendations(token: str, *, playlist_id: int, user_id: int) -> _RankedRecommendations | None:
+    entry = _recommendation_cursors.get(token)
+    if entry is None:
+        return None
+    expires_at, ranked = entry
+    if expires_at <= time.monotonic():
+        _recommendation_cursors.pop(token, None)
+        return None
+    if (ranked.playlist_id, ranked.user_id) != (playlist_id, user_id):
+        return None
+    _recommendation_cursors.move_to_end(token)
+    return ranked
+
+
+def _track_search_cache_key(
+    owner_user_id: int, provider: str, query: str, limit: int, hydrate: bool
+) -> tuple[int, str, str, int, bool]:
+    normalized_query = " ".join(query.split()).casefold()
+    return (owner_user_id, provider, normalized_query, limit, hydrate)
 
 
 def _serialize_suggestion(
@@ -193,9 +311,19 @@ def _serialize_suggestion(
     playlist: VotunaPlaylist,
     suggestion: VotunaTrackSuggestion,
     current_user_id: int,
+    *,
+    member_names: dict[int, str] | None = None,
+    reaction_by_user: dict[int, str] | None = None,
 ) -> VotunaTrackSuggestionOut:
-    reaction_by_user = votuna_track_vote_crud.get_reaction_by_user(db, suggestion.id)
-    member_names = _member_name_by_user_id(db, suggestion.playlist_id)
+    """Build the API view of one suggestion.
+
+    List endpoints pass ``member_names`` and ``reaction_by_user`` loaded in bulk
+    so serializing many suggestions does not query per suggestion.
+    """
+    if reaction_by_user is None:
+        reaction_by_user = votuna_track_vote_crud.get_reaction_by_user(db, suggestion.id)
+    if member_names is None:
+        member_names = _member_name_by_user_id(db, suggestion.playlist_id)
     filtered_reactions = {
         user_id: reaction for user_id, reaction in reaction_by_user.items() if user_id in member_names
     }
@@ -291,7 +419,7 @@ async def _accept_suggestion(
             "suggestion_id": suggestion.id,
         },
     )
-    await _invalidate_recommendation_cache_for_playlist(playlist.id)
+    votuna_recommendation_pool_crud.mark_stale(db, playlist.id)
     return accepted
 
 
@@ -356,7 +484,11 @@ async def _resolve_if_all_collaborators_voted(
     )
 
 
-@router.get("/playlists/{playlist_id}/suggestions", response_model=list[VotunaTrackSuggestionOut])
+@router.get(
+    "/playlists/{playlist_id}/suggestions",
+    response_model=list[VotunaTrackSuggestionOut],
+    response_class=FastJSONResponse,
+)
 def list_suggestions(
     playlist_id: int,
     status: str | None = None,
@@ -367,10 +499,32 @@ def list_suggestions(
     playlist = get_playlist_or_404(db, playlist_id)
     require_member(db, playlist_id, current_user.id)
     suggestions = votuna_track_suggestion_crud.list_for_playlist(db, playlist_id, status)
-    return [_serialize_suggestion(db, playlist, suggestion, current_user.id) for suggestion in suggestions]
+    member_names = _member_name_by_user_id(db, playlist_id)
+    reactions = votuna_track_vote_crud.get_reactions_by_suggestion_ids(
+        db,
+        [suggestion.id for suggestion in suggestions],
+    )
+    return model_list_response(
+        VotunaTrackSuggestionOut,
+        (
+            _serialize_suggestion(
+                db,
+                playlist,
+                suggestion,
+                current_user.id,
+                member_names=member_names,
+                reaction_by_user=reactions[suggestion.id],
+            )
+            for suggestion in suggestions
+        ),
+    )
 
 
-@router.get("/playlists/{playlist_id}/tracks/search", response_model=list[ProviderTrackOut])
+@router.get(
+    "/playlists/{playlist_id}/tracks/search",
+    response_model=list[ProviderTrackOut],
+    response_class=FastJSONResponse,
+)
 async def search_tracks_for_suggestions(
     playlist_id: int,
     q: str = Query(..., min_length=1),
@@ -386,39 +540,100 @@ async def search_tracks_for_suggestions(
     query = q.strip()
     if not query:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Search query is required")
-    try:
+
+    async def _search() -> list[ProviderTrackOut]:
         if playlist.provider == "tidal":
             results = await cast(Any, client).search_tracks(query, limit=limit, hydrate_metadata=hydrate)
         else:
             results = await client.search_tracks(query, limit=limit)
+        return [_serialize_provider_track(track) for track in results]
+
+    cache_key = _track_search_cache_key(playlist.owner_user_id, playlist.provider, query, limit, hydrate)
+    try:
+        return model_list_response(ProviderTrackOut, await _track_search_cache.run(cache_key, _search))
+    except ProviderAuthError:
+        raise_provider_auth(current_user, owner_id=playlist.owner_user_id, provider=playlist.provider)
+    except ProviderAPIError as exc:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
+
+
+def _declined_track_ids(db: Session, playlist_id: int, user_id: int) -> set[str]:
+    return declined_track_filter.get_or_load(
+        (playlist_id, user_id),
+        lambda: votuna_track_recommendation_decline_crud.list_declined_track_ids(
+            db,
+            playlist_id=playlist_id,
+            user_id=user_id,
+        ),
+    )
+
+
+async def _rank_recommendations(
+    db: Session,
+    playlist: VotunaPlaylist,
+    current_user: User,
+    refresh_nonce: str | None,
+) -> _RankedRecommendations:
+    """Rank the playlist's pool for the chosen seeds and apply the user's filters."""
+    try:
+        pool = await _load_recommendation_pool(db, playlist)
     except ProviderAuthError:
         raise_provider_auth(current_user, owner_id=playlist.owner_user_id, provider=playlist.provider)
     except ProviderAPIError as exc:
         raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
-    return [
-        ProviderTrackOut(
-            provider_track_id=track.provider_track_id,
-            title=track.title,
-            artist=track.artist,
-            genre=track.genre,
-            artwork_url=track.artwork_url,
-            url=track.url,
-            access=track.access,
+
+    seed_track_ids = _ordered_seed_track_ids(pool["seed_track_ids"], refresh_nonce)
+    pending_track_ids = {
+        suggestion.provider_track_id
+        for suggestion in votuna_track_suggestion_crud.list_for_playlist(
+            db,
+            playlist.id,
+            status="pending",
         )
-        for track in results
-    ]
+    }
+    declined_track_ids = _declined_track_ids(db, playlist.id, current_user.id)
+
+    filtered_tracks: list[ProviderTrackOut] = []
+    artist_counts: dict[str, int] = {}
+    for candidate in rank_candidates(pool["candidates"], seed_track_ids):
+        track_id = candidate["provider_track_id"]
+        if track_id in pending_track_ids:
+            continue
+        if track_id in declined_track_ids:
+            continue
+        artist_key = (candidate.get("artist") or "").strip().lower()
+        if artist_key:
+            current_count = artist_counts.get(artist_key, 0)
+            if current_count >= RECOMMENDATION_MAX_TRACKS_PER_ARTIST:
+                continue
+            artist_counts[artist_key] = current_count + 1
+        filtered_tracks.append(ProviderTrackOut.model_validate(candidate))
+
+    return _RankedRecommendations(playlist_id=playlist.id, user_id=current_user.id, tracks=tuple(filtered_tracks))
 
 
-@router.get("/playlists/{playlist_id}/tracks/recommendations", response_model=list[ProviderTrackOut])
+@router.get(
+    "/playlists/{playlist_id}/tracks/recommendations",
+    response_model=list[ProviderTrackOut],
+    response_class=FastJSONResponse,
+)
 async def list_recommended_tracks(
     playlist_id: int,
     limit: int = Query(5, ge=1, le=50),
     offset: int = Query(0, ge=0),
     refresh_nonce: str | None = Query(None),
+    cursor: str | None = Query(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """List personalized track recommendations based on current playlist tracks."""
+    """List personalized track recommendations based on current playlist tracks.
+
+    The first page ranks and filters the playlist's whole pool once. When more
+    tracks remain, the next page's cursor is returned in the
+    ``X-Votuna-Next-Cursor`` header; passing it back slices the same ranked
+    list, skipping tracks declined since. An expired cursor re-ranks and
+    resumes at the cursor's position.
+    """
     playlist = get_playlist_or_404(db, playlist_id)
     require_member(db, playlist_id, current_user.id)
     if playlist.provider in RECOMMENDATIONS_DISABLED_PROVIDERS:
@@ -426,131 +641,34 @@ async def list_recommended_tracks(
         return []
     safe_limit = max(1, min(limit, 50))
     safe_offset = max(0, offset)
-    cache_key = _recommendation_cache_key(
-        playlist_id=playlist.id,
-        user_id=current_user.id,
-        provider=playlist.provider,
-        limit=safe_limit,
-        offset=safe_offset,
-        refresh_nonce=refresh_nonce,
-    )
-
-    async def _compute() -> list[ProviderTrackOut]:
-        client = get_owner_client(db, playlist)
-        try:
-            current_tracks = list(await client.list_tracks(playlist.provider_playlist_id))
-        except ProviderAuthError:
-            raise_provider_auth(current_user, owner_id=playlist.owner_user_id, provider=playlist.provider)
-        except ProviderAPIError as exc:
-            raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
 
-        if not current_tracks:
-            return []
-
-        seed_track_ids = _ordered_seed_track_ids(current_tracks, refresh_nonce)
-        if not seed_track_ids:
-            return []
-
-        existing_track_ids = {
-            (track.provider_track_id or "").strip()
-            for track in current_tracks
-            if (track.provider_track_id or "").strip()
-        }
-        pending_track_ids = {
-            suggestion.provider_track_id
-            for suggestion in votuna_track_suggestion_crud.list_for_playlist(
-                db,
-                playlist_id,
-                status="pending",
-            )
-        }
-        declined_track_ids = votuna_track_recommendation_decline_crud.list_declined_track_ids(
-            db,
-            playlist_id=playlist_id,
-            user_id=current_user.id,
-        )
-
-        target_candidate_count = safe_offset + safe_limit + RECOMMENDATION_RESULT_BUFFER
-        score_by_track_id: dict[str, tuple[int, int, ProviderTrack]] = {}
-        for seed_index, seed_track_id in enumerate(seed_track_ids):
-            try:
-                related_tracks = await client.related_tracks(
-                    seed_track_id,
-                    limit=RECOMMENDATION_RELATED_LIMIT_PER_SEED,
-                    offset=0,
-                )
-            except ProviderAuthError:
-                raise_provider_auth(current_user, owner_id=playlist.owner_user_id, provider=playlist.provider)
-            except ProviderAPIError as exc:
-                if exc.status_code in {400, 404}:
-                    continue
-                raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
-
-            for track in related_tracks:
-                track_id = (track.provider_track_id or "").strip()
-                if not track_id:
-                    continue
-                existing_entry = score_by_track_id.get(track_id)
-                if not existing_entry:
-                    score_by_track_id[track_id] = (1, seed_index, track)
-                    continue
-                score, first_seed_index, existing_track = existing_entry
-                next_first_seed_index = min(seed_index, first_seed_index)
-                score_by_track_id[track_id] = (score + 1, next_first_seed_index, existing_track)
-
-            eligible_candidate_count = 0
-            for related_track_id in score_by_track_id:
-                if related_track_id in existing_track_ids:
-                    continue
-                if related_track_id in pending_track_ids:
-                    continue
-                if related_track_id in declined_track_ids:
-                    continue
-                eligible_candidate_count += 1
-            if eligible_candidate_count >= target_candidate_count:
-                break
-
-        if not score_by_track_id:
-            return []
-
-        ranked_entries = sorted(
-            score_by_track_id.items(),
-            key=lambda entry: (
-                -entry[1][0],
-                entry[1][1],
-                entry[0],
-            ),
-        )
-
-        filtered_tracks: list[ProviderTrack] = []
-        artist_counts: dict[str, int] = {}
-        for _track_id, (_score, _first_seed_index, track) in ranked_entries:
-            track_id = (track.provider_track_id or "").strip()
-            if not track_id:
-                continue
-            if track_id in existing_track_ids:
-                continue
-            if track_id in pending_track_ids:
-                continue
-            if track_id in declined_track_ids:
-                continue
-            artist_key = (track.artist or "").strip().lower()
-            if artist_key:
-                current_count = artist_counts.get(artist_key, 0)
-                if current_count >= RECOMMENDATION_MAX_TRACKS_PER_ARTIST:
-                    continue
-                artist_counts[artist_key] = current_count + 1
-            filtered_tracks.append(track)
-            if len(filtered_tracks) >= target_candidate_count:
-                break
-
-        if not filtered_tracks:
-            return []
-
-        page = filtered_tracks[safe_offset : safe_offset + safe_limit]
-        return [_serialize_provider_track(track) for track in page]
-
-    return await _run_recommendation_cached(cache_key, _compute)
+    token: str | None = None
+    ranked: _RankedRecommendations | None = None
+    if cursor:
+        token, safe_offset = _parse_recommendation_cursor(cursor)
+        ranked = _get_ranked_recommendations(token, playlist_id=playlist.id, user_id=current_user.id)
+    if ranked is None:
+        ranked = await _rank_recommendations(db, playlist, current_user, refresh_nonce)
+        token = None
+
+    # Tracks declined after the list was ranked are skipped here rather than re-ranking.
+    declined_track_ids = _declined_track_ids(db, playlist.id, current_user.id)
+    page: list[ProviderTrackOut] = []
+    position = safe_offset
+    while position < len(ranked.tracks) and len(page) < safe_limit:
+        track = ranked.tracks[position]
+        position += 1
+        if track.provider_track_id in declined_track_ids:
+            continue
+        page.append(track)
+    headers = None
+    if position < len(ranked.tracks):
+        # Only lists with more pages are kept; a single-page answer never needs its cursor.
+        if token is None:
+            token = _store_ranked_recommendations(ranked)
+        headers = {RECOMMENDATION_CURSOR_HEADER: f"{token}.{position}"}
+    # Serialized straight from the shared ranked list; nothing here mutates it, so no copy is needed.
+    return model_list_response(ProviderTrackOut, page, headers=headers)
 
 
 @router.post(
@@ -577,7 +695,7 @@ async def decline_track_recommendation(
         provider_track_id=provider_track_id,
         declined_at=datetime.now(timezone.utc),
     )
-    await _invalidate_recommendation_cache_for_playlist(playlist.id)
+    declined_track_filter.add((playlist.id, current_user.id), provider_track_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -3,7 +3,7 @@
 from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
-from app.auth.jwt import decode_access_token
+from app.auth.jwt import decode_access_token_subject
 from app.config.settings import settings
 from app.crud.user import user_crud
 from app.db.session import get_db
@@ -35,7 +35,7 @@ def get_current_user(
         )
 
     try:
-        payload = decode_access_token(token)
+        user_id = decode_access_token_subject(token)
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -43,7 +43,6 @@ def get_current_user(
             headers={AUTH_EXPIRED_HEADER: "1"},
         )
 
-    user_id = payload.get("sub")
     if not user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -51,7 +50,7 @@ def get_current_user(
             headers={AUTH_EXPIRED_HEADER: "1"},
         )
 
-    user = user_crud.get(db, int(user_id))
+    user = user_crud.get_cached(db, int(user_id))
     if not user or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
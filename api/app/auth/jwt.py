@@ -1,6 +1,9 @@
 """JWT helpers"""
 
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
+import threading
+import time
 from typing import Any
 
 import jwt
@@ -8,6 +11,7 @@ import jwt
 from app.config.settings import settings
 
 ALGORITHM = "HS256"
+VERIFIED_TOKEN_CACHE_MAX_ENTRIES = 1_024
 
 
 def _require_secret() -> str:
@@ -34,3 +38,55 @@ def decode_access_token(token: str) -> dict[str, Any]:
     """Decode and validate a JWT, returning its payload."""
     secret = _require_secret()
     return jwt.decode(token, secret, algorithms=[ALGORITHM])
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of already verified tokens mapped to their subject and expiry.
+
+    A page load fires many API calls with the same token; only the first one
+    pays for signature verification. Entries are dropped once the token expires.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    def get(self, token: str) -> str | None:
+        with self._lock:
+            cached = self._entries.get(token)
+            if cached is None:
+                return None
+            subject, expires_at = cached
+            if expires_at <= time.time():
+                self._entries.pop(token, None)
+                return None
+            self._entries.move_to_end(token)
+            return subject
+
+    def put(self, token: str, subject: str, expires_at: float) -> None:
+        with self._lock:
+            self._entries[token] = (subject, expires_at)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+verified_token_cache = VerifiedTokenCache(max_entries=VERIFIED_TOKEN_CACHE_MAX_ENTRIES)
+
+
+def decode_access_token_subject(token: str) -> str | None:
+    """Return the subject of a valid JWT, reusing earlier verifications of the same token."""
+    cached_subject = verified_token_cache.get(token)
+    if cached_subject is not None:
+        return cached_subject
+    payload = decode_access_token(token)
+    subject = payload.get("sub")
+    expires_at = payload.get("exp")
+    if subject and isinstance(expires_at, (int, float)):
+        verified_token_cache.put(token, str(subject), float(expires_at))
+    return subject
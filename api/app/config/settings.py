@@ -43,6 +43,8 @@ class Settings(BaseSettings):
     TIDAL_COUNTRY_CODE: str = ""
     AUTH_SECRET_KEY: str = ""
     AUTH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7
+    # How long an authenticated user's row is reused across requests without a query. 0 disables.
+    AUTH_USER_CACHE_TTL_SECONDS: float = 30.0
     AUTH_COOKIE_NAME: str = "votuna_access_token"
     AUTH_COOKIE_SECURE: bool = False
     AUTH_COOKIE_SAMESITE: Literal["lax", "strict", "none"] = "lax"
@@ -50,6 +52,21 @@ class Settings(BaseSettings):
     USER_FILES_DIR: str = "user_files"
     MAX_AVATAR_BYTES: int = 5 * 1024 * 1024
 
+    # Background management transfer workers run inside each API process.
+    # Set to 0 on API processes when dedicated worker processes handle jobs.
+    MANAGEMENT_JOB_WORKERS: int = 2
+    # How often each API process rebuilds stale or aging recommendation pools. 0 disables the refresher.
+    RECOMMENDATION_POOL_REFRESH_INTERVAL_SECONDS: float = 60.0
+
+    # Log a warning when one request runs the same SQL statement shape this many times. 0 disables.
+    DB_REPEATED_QUERY_WARNING_THRESHOLD: int = 0
+    # Log a timing breakdown for requests slower than this many milliseconds. 0 disables.
+    SLOW_REQUEST_LOG_THRESHOLD_MS: float = 1000.0
+    # Compress JSON responses at least this many bytes long (brotli when installed, else gzip). 0 disables.
+    RESPONSE_COMPRESSION_MIN_BYTES: int = 1024
+    # Bearer token required to scrape /metrics. Empty disables the endpoint.
+    METRICS_BEARER_TOKEN: str = ""
+
     model_config = SettingsConfigDict(
         env_file=os.path.join(os.path.dirname(__file__), "../../../.env"),
         case_sensitive=True,
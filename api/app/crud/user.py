@@ -1,15 +1,114 @@
 """User CRUD helpers"""
 
-from typing import Optional
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from collections import OrderedDict
+import threading
+import time
+from typing import Any, Optional
 
+from sqlalchemy import inspect as sa_inspect, or_
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+
+from app.config.settings import settings
 from app.crud.base import BaseCRUD
 from app.models.user import User
 from app.schemas import UserCreate, UserUpdate
 
+USER_ROW_CACHE_MAX_ENTRIES = 4_096
+# Provider credentials change on token refresh in any process, so they are always read from the database.
+UNCACHED_USER_COLUMNS = frozenset({"access_token", "refresh_token", "token_expires_at"})
+
+
+class UserRowCache:
+    """Short-lived LRU of user column values keyed by user id.
+
+    Stores plain values rather than ORM instances so each session gets its own
+    object. ``UserCRUD`` drops a user's entry whenever it updates or deletes them;
+    the TTL bounds how long changes made by other processes go unseen.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[int, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def get(self, user_id: int) -> dict[str, Any] | None:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(user_id)
+            if cached is None:
+                return None
+            if cached[0] <= now:
+                self._entries.pop(user_id, None)
+                return None
+            self._entries.move_to_end(user_id)
+            return cached[1]
+
+    def put(self, user_id: int, values: dict[str, Any], ttl_seconds: float) -> None:
+        if ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + ttl_seconds, values)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+user_row_cache = UserRowCache(max_entries=USER_ROW_CACHE_MAX_ENTRIES)
+
+
+def _cacheable_values(user: User) -> dict[str, Any]:
+    return {
+        attr.key: getattr(user, attr.key)
+        for attr in sa_inspect(User).column_attrs
+        if attr.key not in UNCACHED_USER_COLUMNS
+    }
+
 
 class UserCRUD(BaseCRUD[User, UserCreate, UserUpdate]):
+    def get_cached(self, db: Session, user_id: int) -> Optional[User]:
+        """Return a user, reusing a recently loaded row instead of querying when possible.
+
+        The returned instance belongs to ``db``. Provider credential columns are
+        left unloaded and read from the database on first access.
+        """
+        existing = db.identity_map.get(identity_key(User, user_id))
+        if existing is not None:
+            return existing
+        values = user_row_cache.get(user_id)
+        if values is None:
+            user = self.get(db, user_id)
+            if user is not None:
+                user_row_cache.put(user_id, _cacheable_values(user), settings.AUTH_USER_CACHE_TTL_SECONDS)
+            return user
+        user = User(**values)
+        # Treat the cached values as loaded state so attaching the instance does not write them back.
+        make_transient_to_detached(user)
+        db.add(user)
+        return user
+
+    def update(self, db: Session, db_obj: User, obj_in: UserUpdate | dict[str, Any]) -> User:
+        """Update a user and drop their cached row."""
+        try:
+            return super().update(db, db_obj, obj_in)
+        finally:
+            user_row_cache.invalidate(db_obj.id)
+
+    def delete(self, db: Session, id: Any) -> bool:
+        """Delete a user and drop their cached row."""
+        try:
+            return super().delete(db, id)
+        finally:
+            user_row_cache.invalidate(id)
+
     def get_by_provider_id(self, db: Session, provider: str, provider_user_id: str) -> Optional[User]:
         """Return a user by provider and provider user id."""
         return db.query(User).filter(User.auth_provider == provider, User.provider_user_id == provider_user_id).first()
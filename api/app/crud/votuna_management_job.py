@@ -0,0 +1,103 @@
+"""CRUD helpers for persisted management transfer jobs."""
+
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Query, Session
+
+from app.crud.base import BaseCRUD
+from app.models.votuna_management_jobs import VotunaManagementJob
+from app.schemas import ManagementJobCreate, ManagementJobUpdate
+
+
+class VotunaManagementJobCRUD(BaseCRUD[VotunaManagementJob, ManagementJobCreate, ManagementJobUpdate]):
+    def get_for_playlist(self, db: Session, playlist_id: int, job_id: int) -> VotunaManagementJob | None:
+        """Return one job if it belongs to the playlist."""
+        return (
+            db.query(VotunaManagementJob)
+            .filter(
+                VotunaManagementJob.id == job_id,
+                VotunaManagementJob.playlist_id == playlist_id,
+            )
+            .first()
+        )
+
+    def claim_next(self, db: Session, *, stale_before: datetime) -> VotunaManagementJob | None:
+        """Mark the oldest runnable job as running under a new lease and return it.
+
+        Jobs left running by a worker that stopped heartbeating before
+        ``stale_before`` are reclaimed; the new lease token locks the old worker
+        out of further writes. Row locks are skipped so several worker processes
+        can poll the same table.
+        """
+        last_heartbeat_at = func.coalesce(VotunaManagementJob.heartbeat_at, VotunaManagementJob.updated_at)
+        job = (
+            db.query(VotunaManagementJob)
+            .filter(
+                or_(
+                    VotunaManagementJob.status == "queued",
+                    and_(
+                        VotunaManagementJob.status == "running",
+                        last_heartbeat_at < stale_before,
+                    ),
+                )
+            )
+            .order_by(VotunaManagementJob.id.asc())
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if job is None:
+            db.rollback()
+            return None
+        now = datetime.now(timezone.utc)
+        return self.update(
+            db,
+            job,
+            {
+                "status": "running",
+                "lease_token": uuid.uuid4().hex,
+                "heartbeat_at": now,
+                "started_at": now,
+                "error": None,
+            },
+        )
+
+    def _leased(self, db: Session, job_id: int, lease_token: str | None) -> Query[VotunaManagementJob]:
+        return db.query(VotunaManagementJob).filter(
+            VotunaManagementJob.id == job_id,
+            VotunaManagementJob.status == "running",
+            VotunaManagementJob.lease_token == lease_token,
+        )
+
+    def heartbeat(self, db: Session, job_id: int, *, lease_token: str | None) -> bool:
+        """Extend a running job's lease. Return False once another worker holds it."""
+        updated = self._leased(db, job_id, lease_token).update(
+            {VotunaManagementJob.heartbeat_at: datetime.now(timezone.utc)},
+            synchronize_session=False,
+        )
+        db.commit()
+        return bool(updated)
+
+    def update_leased(
+        self,
+        db: Session,
+        job: VotunaManagementJob,
+        values: dict[str, Any],
+        *,
+        lease_token: str | None,
+    ) -> bool:
+        """Apply ``values`` only while ``lease_token`` still holds the job. Return whether the row was written.
+
+        Pass the token the worker was handed at claim time: ``job.lease_token``
+        reloads after a commit and would show whichever worker holds the job now.
+        """
+        updated = self._leased(db, job.id, lease_token).update(values, synchronize_session=False)
+        db.commit()
+        if updated:
+            db.refresh(job)
+        return bool(updated)
+
+
+votuna_management_job_crud = VotunaManagementJobCRUD(VotunaManagementJob)
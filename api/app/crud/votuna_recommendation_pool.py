@@ -0,0 +1,88 @@
+"""CRUD helpers for precomputed recommendation pools."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.crud.base import BaseCRUD
+from app.models.votuna_recommendation_pools import VotunaRecommendationPool
+from app.schemas import VotunaRecommendationPoolCreate, VotunaRecommendationPoolUpdate
+
+
+class VotunaRecommendationPoolCRUD(
+    BaseCRUD[VotunaRecommendationPool, VotunaRecommendationPoolCreate, VotunaRecommendationPoolUpdate]
+):
+    def get_by_playlist_id(self, db: Session, playlist_id: int) -> VotunaRecommendationPool | None:
+        """Return the pool for one playlist, if any."""
+        return db.query(VotunaRecommendationPool).filter(VotunaRecommendationPool.playlist_id == playlist_id).first()
+
+    def save_pool(self, db: Session, *, playlist_id: int, data: dict[str, Any]) -> VotunaRecommendationPool:
+        """Create or replace the pool for one playlist and mark it fresh."""
+        values = {**data, "is_stale": False}
+        existing = self.get_by_playlist_id(db, playlist_id)
+        if existing:
+            return self.update(db, existing, values)
+        try:
+            return self.create(db, {**values, "playlist_id": playlist_id})
+        except IntegrityError:
+            db.rollback()
+            conflict = self.get_by_playlist_id(db, playlist_id)
+            if not conflict:
+                raise
+            return self.update(db, conflict, values)
+
+    def mark_stale(self, db: Session, playlist_id: int) -> None:
+        """Flag a playlist's pool for rebuilding after its tracks changed."""
+        db.query(VotunaRecommendationPool).filter(VotunaRecommendationPool.playlist_id == playlist_id).update(
+            {VotunaRecommendationPool.is_stale: True},
+            synchronize_session="fetch",
+        )
+        db.commit()
+
+    def touch(self, db: Session, playlist_id: int, *, accessed_at: datetime) -> None:
+        """Record that a member read the playlist's pool."""
+        db.query(VotunaRecommendationPool).filter(VotunaRecommendationPool.playlist_id == playlist_id).update(
+            {VotunaRecommendationPool.last_accessed_at: accessed_at},
+            synchronize_session="fetch",
+        )
+        db.commit()
+
+    def list_due_playlist_ids(
+        self,
+        db: Session,
+        *,
+        computed_before: datetime,
+        accessed_after: datetime,
+        limit: int,
+    ) -> list[int]:
+        """Return playlists whose pools are stale, or aged and read since ``accessed_after``, oldest first."""
+        rows = (
+            db.query(VotunaRecommendationPool.playlist_id)
+            .filter(
+                or_(
+                    VotunaRecommendationPool.is_stale.is_(True),
+                    and_(
+                        VotunaRecommendationPool.computed_at < computed_before,
+                        VotunaRecommendationPool.last_accessed_at >= accessed_after,
+                    ),
+                )
+            )
+            .order_by(VotunaRecommendationPool.computed_at.asc())
+            .limit(limit)
+            .all()
+        )
+        return [playlist_id for (playlist_id,) in rows]
+
+    def delete_idle(self, db: Session, *, accessed_before: datetime) -> int:
+        """Delete pools nobody has read since ``accessed_before``. Return how many were deleted."""
+        last_used_at = func.coalesce(VotunaRecommendationPool.last_accessed_at, VotunaRecommendationPool.computed_at)
+        query = db.query(VotunaRecommendationPool).filter(last_used_at < accessed_before)
+        deleted = query.delete(synchronize_session=False)
+        db.commit()
+        return deleted
+
+
+votuna_recommendation_pool_crud = VotunaRecommendationPoolCRUD(VotunaRecommendationPool)
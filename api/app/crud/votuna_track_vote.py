@@ -70,6 +70,20 @@ class VotunaTrackVoteCRUD(BaseCRUD[VotunaTrackVote, VotunaTrackSuggestionCreate,
         )
         return {user_id: reaction for user_id, reaction in rows}
 
+    def get_reactions_by_suggestion_ids(self, db: Session, suggestion_ids: list[int]) -> dict[int, dict[int, str]]:
+        """Return suggestion_id -> (user_id -> reaction) for many suggestions in one query."""
+        reactions: dict[int, dict[int, str]] = {suggestion_id: {} for suggestion_id in suggestion_ids}
+        if not suggestion_ids:
+            return reactions
+        rows = (
+            db.query(VotunaTrackVote.suggestion_id, VotunaTrackVote.user_id, VotunaTrackVote.reaction)
+            .filter(VotunaTrackVote.suggestion_id.in_(suggestion_ids))
+            .all()
+        )
+        for suggestion_id, user_id, reaction in rows:
+            reactions[suggestion_id][user_id] = reaction
+        return reactions
+
     def list_reactor_display_names(
         self,
         db: Session,
@@ -0,0 +1,103 @@
+"""Per-request SQL statement counting hooked into SQLAlchemy engine events."""
+
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import re
+import threading
+import time
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.utils.request_timing import current_request_timings
+
+_PLACEHOLDER_LIST_PATTERN = re.compile(r"\(\s*(?:\?|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%\(\w+\)s|:\w+))+\s*\)")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_QUERY_STARTED_AT_KEY = "votuna_query_started_at"
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("db_query_stats", default=None)
+_install_lock = threading.Lock()
+_installed = False
+
+
+def statement_shape(statement: str) -> str:
+    """Collapse whitespace and expanded IN-lists so repeats of one query compare equal."""
+    collapsed = _WHITESPACE_PATTERN.sub(" ", statement).strip()
+    return _PLACEHOLDER_LIST_PATTERN.sub("(?)", collapsed)
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, statement: str, elapsed_seconds: float) -> None:
+        shape = statement_shape(statement)
+        with self._lock:
+            self.count += 1
+            self.total_seconds += elapsed_seconds
+            self.shapes[shape] += 1
+
+    def repeated_shapes(self, threshold: int) -> list[tuple[str, int]]:
+        """Return statement shapes executed at least ``threshold`` times, most repeated first."""
+        with self._lock:
+            return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count statements executed in this context, including sync work run in threadpools it spawns."""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool):
+    if _current_stats.get() is not None or current_request_timings() is not None:
+        conn.info.setdefault(_QUERY_STARTED_AT_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool):
+    started = conn.info.get(_QUERY_STARTED_AT_KEY)
+    if not started:
+        return
+    elapsed_seconds = time.perf_counter() - started.pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed_seconds)
+    timings = current_request_timings()
+    if timings is not None:
+        timings.record("db", elapsed_seconds)
+
+
+def _handle_error(exception_context: Any) -> None:
+    connection = exception_context.connection
+    started = connection.info.get(_QUERY_STARTED_AT_KEY) if connection is not None else None
+    if started:
+        started.pop()
+
+
+def install_query_hooks() -> None:
+    """Register the statement hooks on every engine. Safe to call more than once."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+        _installed = True
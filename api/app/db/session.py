@@ -3,8 +3,11 @@ from sqlalchemy.orm import Session, sessionmaker
 from typing import Generator
 
 from app.config.settings import settings
+from app.db.query_stats import install_query_hooks
 from app.models.base import BaseModel
 
+install_query_hooks()
+
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.DATABASE_URL,
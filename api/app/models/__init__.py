@@ -5,6 +5,8 @@ from app.models.votuna_playlist import VotunaPlaylist
 from app.models.votuna_playlist_settings import VotunaPlaylistSettings
 from app.models.votuna_members import VotunaPlaylistMember
 from app.models.votuna_invites import VotunaPlaylistInvite
+from app.models.votuna_management_jobs import VotunaManagementJob
+from app.models.votuna_recommendation_pools import VotunaRecommendationPool
 from app.models.votuna_suggestions import VotunaTrackSuggestion
 from app.models.votuna_track_additions import VotunaTrackAddition
 from app.models.votuna_track_recommendation_declines import VotunaTrackRecommendationDecline
@@ -18,6 +20,8 @@ __all__ = [
     "VotunaPlaylistSettings",
     "VotunaPlaylistMember",
     "VotunaPlaylistInvite",
+    "VotunaManagementJob",
+    "VotunaRecommendationPool",
     "VotunaTrackSuggestion",
     "VotunaTrackAddition",
     "VotunaTrackRecommendationDecline",
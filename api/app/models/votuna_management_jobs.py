@@ -0,0 +1,41 @@
+"""Persisted background jobs for playlist management transfers."""
+
+from datetime import datetime
+from typing import Any, TYPE_CHECKING
+
+from sqlalchemy import JSON, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import BaseModel
+
+if TYPE_CHECKING:
+    from app.models.votuna_playlist import VotunaPlaylist
+
+
+class VotunaManagementJob(BaseModel):
+    """Queued or running management transfer and its progress counters."""
+
+    __tablename__ = "votuna_management_jobs"
+
+    playlist_id: Mapped[int] = mapped_column(
+        ForeignKey("votuna_playlists.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    requested_by_user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    status: Mapped[str] = mapped_column(default="queued", nullable=False, index=True)
+    request_payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    total_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    processed_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    added_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    failed_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    unmatched_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    result: Mapped[dict[str, Any] | None] = mapped_column(JSON)
+    checkpoint: Mapped[dict[str, Any] | None] = mapped_column(JSON)
+    error: Mapped[str | None]
+    lease_token: Mapped[str | None]
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), index=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    playlist: Mapped["VotunaPlaylist"] = relationship(back_populates="management_jobs")
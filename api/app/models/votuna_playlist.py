@@ -11,8 +11,10 @@ from app.models.base import BaseModel
 if TYPE_CHECKING:
     from app.models.user import User
     from app.models.votuna_invites import VotunaPlaylistInvite
+    from app.models.votuna_management_jobs import VotunaManagementJob
     from app.models.votuna_members import VotunaPlaylistMember
     from app.models.votuna_playlist_settings import VotunaPlaylistSettings
+    from app.models.votuna_recommendation_pools import VotunaRecommendationPool
     from app.models.votuna_suggestions import VotunaTrackSuggestion
     from app.models.votuna_track_additions import VotunaTrackAddition
     from app.models.votuna_track_recommendation_declines import VotunaTrackRecommendationDecline
@@ -61,3 +63,12 @@ class VotunaPlaylist(BaseModel):
         back_populates="playlist",
         cascade="all, delete-orphan",
     )
+    management_jobs: Mapped[list["VotunaManagementJob"]] = relationship(
+        back_populates="playlist",
+        cascade="all, delete-orphan",
+    )
+    recommendation_pool: Mapped["VotunaRecommendationPool | None"] = relationship(
+        back_populates="playlist",
+        uselist=False,
+        cascade="all, delete-orphan",
+    )
@@ -0,0 +1,32 @@
+"""Precomputed recommendation candidate pools for Votuna playlists."""
+
+from datetime import datetime
+from typing import Any, TYPE_CHECKING
+
+from sqlalchemy import JSON, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import BaseModel
+
+if TYPE_CHECKING:
+    from app.models.votuna_playlist import VotunaPlaylist
+
+
+class VotunaRecommendationPool(BaseModel):
+    """Ranked related-track candidates for one playlist, shared by all members."""
+
+    __tablename__ = "votuna_recommendation_pools"
+
+    playlist_id: Mapped[int] = mapped_column(
+        ForeignKey("votuna_playlists.id", ondelete="CASCADE"), nullable=False, unique=True, index=True
+    )
+    provider: Mapped[str] = mapped_column(nullable=False)
+    tracks_fingerprint: Mapped[str] = mapped_column(nullable=False)
+    track_count: Mapped[int | None] = mapped_column(nullable=True)
+    seed_track_ids: Mapped[list[str]] = mapped_column(JSON, nullable=False)
+    candidates: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False)
+    is_stale: Mapped[bool] = mapped_column(default=False, nullable=False, index=True)
+    computed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    last_accessed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
+
+    playlist: Mapped["VotunaPlaylist"] = relationship(back_populates="recommendation_pool")
@@ -31,16 +31,22 @@ from app.schemas.votuna_playlist_management import (
     ManagementFacetsRequest,
     ManagementFacetsResponse,
     ManagementFailedItem,
+    ManagementJobCreate,
+    ManagementJobOut,
+    ManagementJobStatus,
+    ManagementJobUpdate,
     ManagementPremiumCleanupResponse,
     ManagementPlaylistRef,
     ManagementPlaylistSummary,
     ManagementPreviewResponse,
     ManagementProviderPlaylistRef,
     ManagementSelectionMode,
+    ManagementDuplicateMatch,
     ManagementSourceTracksRequest,
     ManagementSourceTracksResponse,
     ManagementShuffleResponse,
     ManagementShuffleStatus,
+    ManagementTransferCheckpoint,
     ManagementTransferRequest,
     ManagementVotunaPlaylistRef,
 )
@@ -58,6 +64,8 @@ from app.schemas.votuna_suggestion import (
     VotunaTrackReactionUpdate,
     VotunaTrackRecommendationDeclineCreate,
     VotunaTrackRecommendationDeclineUpdate,
+    VotunaRecommendationPoolCreate,
+    VotunaRecommendationPoolUpdate,
     VotunaTrackSuggestionCreate,
     VotunaTrackSuggestionUpdate,
     VotunaTrackSuggestionOut,
@@ -106,16 +114,22 @@ __all__ = [
     "ManagementFacetsRequest",
     "ManagementFacetsResponse",
     "ManagementFailedItem",
+    "ManagementJobCreate",
+    "ManagementJobOut",
+    "ManagementJobStatus",
+    "ManagementJobUpdate",
     "ManagementPremiumCleanupResponse",
     "ManagementPlaylistRef",
     "ManagementPlaylistSummary",
     "ManagementPreviewResponse",
     "ManagementProviderPlaylistRef",
     "ManagementSelectionMode",
+    "ManagementDuplicateMatch",
     "ManagementSourceTracksRequest",
     "ManagementSourceTracksResponse",
     "ManagementShuffleResponse",
     "ManagementShuffleStatus",
+    "ManagementTransferCheckpoint",
     "ManagementTransferRequest",
     "ManagementVotunaPlaylistRef",
     "TieBreakMode",
@@ -129,6 +143,8 @@ __all__ = [
     "VotunaTrackReactionUpdate",
     "VotunaTrackRecommendationDeclineCreate",
     "VotunaTrackRecommendationDeclineUpdate",
+    "VotunaRecommendationPoolCreate",
+    "VotunaRecommendationPoolUpdate",
     "VotunaTrackSuggestionCreate",
     "VotunaTrackSuggestionUpdate",
     "VotunaTrackSuggestionOut",
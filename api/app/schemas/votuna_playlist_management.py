@@ -1,14 +1,17 @@
 """Schemas for playlist management transfer flows."""
 
-from typing import Annotated, Literal
+from datetime import datetime
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.schemas.votuna_playlist import MusicProvider, ProviderTrackOut
 
 ManagementDirection = Literal["import_to_current", "export_from_current"]
 ManagementSelectionMode = Literal["all", "genre", "artist", "songs"]
+ManagementDuplicateMatch = Literal["track_id", "fingerprint"]
 ManagementShuffleStatus = Literal["completed", "partial_failure"]
+ManagementJobStatus = Literal["queued", "running", "completed", "failed"]
 
 
 class ManagementProviderPlaylistRef(BaseModel):
@@ -69,6 +72,8 @@ class ManagementTransferRequest(BaseModel):
     destination_create: ManagementDestinationCreate | None = None
     selection_mode: ManagementSelectionMode = "all"
     selection_values: list[str] = Field(default_factory=list)
+    duplicate_match: ManagementDuplicateMatch = "track_id"
+    preview_token: str | None = None
 
 
 class ManagementPlaylistSummary(BaseModel):
@@ -85,9 +90,13 @@ class ManagementPreviewResponse(BaseModel):
     matched_count: int
     to_add_count: int
     duplicate_count: int
+    unmatched_count: int = 0
     max_tracks_per_action: int
+    exceeds_max_tracks_per_action: bool = False
     matched_sample: list[ProviderTrackOut] = Field(default_factory=list)
     duplicate_sample: list[ProviderTrackOut] = Field(default_factory=list)
+    unmatched_sample: list[ProviderTrackOut] = Field(default_factory=list)
+    preview_token: str | None = None
 
 
 class ManagementFailedItem(BaseModel):
@@ -104,6 +113,20 @@ class ManagementExecuteResponse(BaseModel):
     skipped_duplicate_count: int
     failed_count: int
     failed_items: list[ManagementFailedItem] = Field(default_factory=list)
+    unmatched_count: int = 0
+    unmatched_track_ids: list[str] = Field(default_factory=list)
+
+
+class ManagementTransferCheckpoint(BaseModel):
+    source: ManagementPlaylistSummary
+    destination: ManagementPlaylistSummary
+    destination_is_created: bool = False
+    matched_count: int
+    skipped_duplicate_count: int
+    to_add_track_ids: list[str] = Field(default_factory=list)
+    added_track_ids: list[str] = Field(default_factory=list)
+    failed_items: list[ManagementFailedItem] = Field(default_factory=list)
+    unmatched_track_ids: list[str] = Field(default_factory=list)
 
 
 class ManagementPremiumCleanupResponse(BaseModel):
@@ -123,3 +146,41 @@ class ManagementShuffleResponse(BaseModel):
     moved_items: int
     max_items: int | None = None
     error: str | None = None
+
+
+class ManagementJobCreate(BaseModel):
+    playlist_id: int
+    requested_by_user_id: int
+    request_payload: dict[str, Any]
+
+
+class ManagementJobUpdate(BaseModel):
+    status: ManagementJobStatus | None = None
+    total_count: int | None = None
+    processed_count: int | None = None
+    added_count: int | None = None
+    failed_count: int | None = None
+    unmatched_count: int | None = None
+    result: dict[str, Any] | None = None
+    checkpoint: dict[str, Any] | None = None
+    error: str | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+
+class ManagementJobOut(BaseModel):
+    id: int
+    playlist_id: int
+    status: ManagementJobStatus
+    total_count: int
+    processed_count: int
+    added_count: int
+    failed_count: int
+    unmatched_count: int = 0
+    result: ManagementExecuteResponse | None = None
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,7 +1,7 @@
 """Votuna suggestion schemas"""
 
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 from pydantic import BaseModel, ConfigDict, Field
 
 SuggestionReaction = Literal["up", "down"]
@@ -55,6 +55,28 @@ class VotunaTrackRecommendationDeclineUpdate(BaseModel):
     declined_at: datetime | None = None
 
 
+class VotunaRecommendationPoolCreate(BaseModel):
+    playlist_id: int
+    provider: str
+    tracks_fingerprint: str
+    track_count: int | None = None
+    seed_track_ids: list[str]
+    candidates: list[dict[str, Any]]
+    computed_at: datetime
+    last_accessed_at: datetime | None = None
+
+
+class VotunaRecommendationPoolUpdate(BaseModel):
+    provider: str | None = None
+    tracks_fingerprint: str | None = None
+    track_count: int | None = None
+    seed_track_ids: list[str] | None = None
+    candidates: list[dict[str, Any]] | None = None
+    is_stale: bool | None = None
+    computed_at: datetime | None = None
+    last_accessed_at: datetime | None = None
+
+
 class VotunaTrackSuggestionOut(BaseModel):
     id: int
     playlist_id: int
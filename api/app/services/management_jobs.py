@@ -0,0 +1,138 @@
+"""In-process worker pool for persisted management transfer jobs."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+
+from sqlalchemy.orm import Session
+
+from app.crud.votuna_management_job import votuna_management_job_crud
+from app.models.votuna_management_jobs import VotunaManagementJob
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], Session]
+JobHandler = Callable[[Session, VotunaManagementJob], Awaitable[None]]
+
+JOB_POLL_INTERVAL_SECONDS = 5.0
+JOB_STALE_AFTER_SECONDS = 10 * 60.0
+JOB_HEARTBEAT_INTERVAL_SECONDS = 60.0
+
+
+class ManagementJobLeaseLost(Exception):
+    """Raised when a worker writes to a job another worker has reclaimed."""
+
+
+class ManagementJobWorkerPool:
+    """Claim queued jobs from the database and run them on a fixed number of workers.
+
+    Jobs are claimed through the database, so any number of API or dedicated
+    worker processes can run a pool against the same table. While a job runs its
+    lease is heartbeated from a separate session, so long listing or matching
+    phases never look stale; writes go through the lease, so a worker whose job
+    was reclaimed stops writing. ``notify`` wakes idle workers in this process
+    right after a job is submitted.
+    """
+
+    def __init__(self, handler: JobHandler):
+        self._handler = handler
+        self._session_factory: SessionFactory | None = None
+        self._wakeup = asyncio.Event()
+        self._workers: list[asyncio.Task[None]] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def start(self, session_factory: SessionFactory, concurrency: int) -> None:
+        if self._workers or concurrency <= 0:
+            return
+        self._session_factory = session_factory
+        self._wakeup = asyncio.Event()
+        self._workers = [
+            asyncio.create_task(self._worker_loop(), name=f"management-job-worker-{index}")
+            for index in range(concurrency)
+        ]
+        logger.info("Started %s management job worker(s)", concurrency)
+
+    async def stop(self) -> None:
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    def notify(self) -> None:
+        if self._workers:
+            self._wakeup.set()
+
+    async def run_next(self, session_factory: SessionFactory) -> bool:
+        """Claim and run one job. Return whether a job was found."""
+        db = session_factory()
+        try:
+            stale_before = datetime.now(timezone.utc) - timedelta(seconds=JOB_STALE_AFTER_SECONDS)
+            job = votuna_management_job_crud.claim_next(db, stale_before=stale_before)
+            if job is None:
+                return False
+            lease_token = job.lease_token
+            heartbeat = asyncio.create_task(self._heartbeat(session_factory, job.id, lease_token))
+            try:
+                await self._handler(db, job)
+            except ManagementJobLeaseLost:
+                logger.warning("Management job %s was reclaimed by another worker; dropping this run", job.id)
+                db.rollback()
+            except Exception:
+                logger.exception("Management job %s crashed", job.id)
+                db.rollback()
+                votuna_management_job_crud.update_leased(
+                    db,
+                    job,
+                    {
+                        "status": "failed",
+                        "error": "Transfer failed unexpectedly",
+                        "finished_at": datetime.now(timezone.utc),
+                    },
+                    lease_token=lease_token,
+                )
+            finally:
+                heartbeat.cancel()
+                await asyncio.gather(heartbeat, return_exceptions=True)
+            return True
+        finally:
+            db.close()
+
+    async def _heartbeat(self, session_factory: SessionFactory, job_id: int, lease_token: str | None) -> None:
+        while True:
+            await asyncio.sleep(JOB_HEARTBEAT_INTERVAL_SECONDS)
+            db = session_factory()
+            try:
+                alive = votuna_management_job_crud.heartbeat(db, job_id, lease_token=lease_token)
+            except Exception:
+                logger.exception("Management job %s failed to heartbeat", job_id)
+                db.rollback()
+                continue
+            finally:
+                db.close()
+            if not alive:
+                logger.warning("Management job %s lost its lease", job_id)
+                return
+
+    async def _worker_loop(self) -> None:
+        assert self._session_factory is not None
+        while True:
+            try:
+                found = await self.run_next(self._session_factory)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Management job worker failed to poll for jobs")
+                found = False
+            if found:
+                continue
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=JOB_POLL_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
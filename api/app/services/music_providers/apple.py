@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import aclosing
 import hashlib
 import time
-from typing import Any, Sequence
+from typing import Any, AsyncIterator, Sequence
 from urllib.parse import parse_qs, quote, urlparse
 
 import httpx
@@ -20,7 +21,9 @@ from app.services.music_providers.base import (
     ProviderShuffleResult,
     ProviderTrack,
     ProviderUser,
+    intern_label,
 )
+from app.services.music_providers.pagination import prefetch_pages
 
 
 class AppleMusicProvider(MusicProviderClient):
@@ -29,6 +32,7 @@ class AppleMusicProvider(MusicProviderClient):
     _DEVELOPER_TOKEN_SKEW_SECONDS = 300
     _TRACK_COUNT_CACHE_TTL_SECONDS = 300.0
     _TRACK_COUNT_HYDRATION_CONCURRENCY = 4
+    _ISRC_FILTER_LIMIT = 25
     _TRACK_TYPES = {"library-songs", "library-music-videos", "songs", "music-videos"}
 
     _developer_token_lock = asyncio.Lock()
@@ -294,6 +298,31 @@ class AppleMusicProvider(MusicProviderClient):
         async with self._track_count_cache_lock:
             self._playlist_track_count_cache.pop(cache_key, None)
 
+    async def _get_json(
+        self,
+        client: httpx.AsyncClient,
+        headers: dict[str, str],
+        url: str,
+        params: dict[str, Any] | None,
+    ) -> Any:
+        response = await client.get(url, headers=headers, params=params)
+        self._raise_for_status(response)
+        return response.json()
+
+    def _iter_pages(
+        self,
+        client: httpx.AsyncClient,
+        headers: dict[str, str],
+        url: str,
+        params: dict[str, Any],
+    ) -> AsyncIterator[Any]:
+        return prefetch_pages(
+            lambda page_url, page_params: self._get_json(client, headers, page_url, page_params),
+            url,
+            params,
+            self._next_url_from_payload,
+        )
+
     async def _count_playlist_tracks(
         self,
         client: httpx.AsyncClient,
@@ -306,16 +335,16 @@ class AppleMusicProvider(MusicProviderClient):
             return cached_track_count
 
         count = 0
-        next_url: str | None = f"/v1/me/library/playlists/{playlist_id}/tracks"
-        params: dict[str, Any] | None = {"limit": 100, "offset": 0}
+        pages = self._iter_pages(
+            client,
+            headers,
+            f"/v1/me/library/playlists/{playlist_id}/tracks",
+            {"limit": 100, "offset": 0},
+        )
         try:
-            while next_url:
-                response = await client.get(next_url, headers=headers, params=params)
-                self._raise_for_status(response)
-                payload = response.json()
-                count += len(self._extract_data_list(payload))
-                next_url = self._next_url_from_payload(payload)
-                params = None
+            async with aclosing(pages):
+                async for payload in pages:
+                    count += len(self._extract_data_list(payload))
         except ProviderAuthError:
             raise
         except ProviderAPIError:
@@ -441,31 +470,30 @@ class AppleMusicProvider(MusicProviderClient):
         title_value = attributes.get("name") or attributes.get("title")
         title = title_value if isinstance(title_value, str) and title_value.strip() else "Untitled"
         track_url = attributes.get("url") if isinstance(attributes.get("url"), str) else None
+        raw_duration = attributes.get("durationInMillis")
+        raw_isrc = attributes.get("isrc")
         return ProviderTrack(
             provider_track_id=track_id,
             title=title,
             artist=attributes.get("artistName") if isinstance(attributes.get("artistName"), str) else None,
-            genre=genre,
+            genre=intern_label(genre),
             artwork_url=self._format_artwork_url(attributes.get("artwork")),
             url=track_url,
+            duration_ms=raw_duration if isinstance(raw_duration, int) and raw_duration > 0 else None,
+            isrc=raw_isrc.strip().upper() if isinstance(raw_isrc, str) and raw_isrc.strip() else None,
         )
 
     async def list_playlists(self) -> Sequence[ProviderPlaylist]:
         playlists: list[ProviderPlaylist] = []
-        next_url: str | None = "/v1/me/library/playlists"
-        params: dict[str, Any] | None = {"limit": 100, "offset": 0}
         async with httpx.AsyncClient(base_url=self.base_url, timeout=self._REQUEST_TIMEOUT_SECONDS) as client:
             headers = await self._headers()
-            while next_url:
-                response = await client.get(next_url, headers=headers, params=params)
-                self._raise_for_status(response)
-                payload = response.json()
-                for item in self._extract_data_list(payload):
-                    mapped = self._to_provider_playlist(item)
-                    if mapped:
-                        playlists.append(mapped)
-                next_url = self._next_url_from_payload(payload)
-                params = None
+            pages = self._iter_pages(client, headers, "/v1/me/library/playlists", {"limit": 100, "offset": 0})
+            async with aclosing(pages):
+                async for payload in pages:
+                    for item in self._extract_data_list(payload):
+                        mapped = self._to_provider_playlist(item)
+                        if mapped:
+                            playlists.append(mapped)
             await self._hydrate_missing_playlist_track_counts(client, headers, playlists)
         return playlists
 
@@ -602,20 +630,20 @@ class AppleMusicProvider(MusicProviderClient):
         if not playlist_id:
             raise ProviderAPIError("Playlist id is required", status_code=400)
         tracks: list[ProviderTrack] = []
-        next_url: str | None = f"/v1/me/library/playlists/{playlist_id}/tracks"
-        params: dict[str, Any] | None = {"limit": 100, "offset": 0}
         async with httpx.AsyncClient(base_url=self.base_url, timeout=self._REQUEST_TIMEOUT_SECONDS) as client:
             headers = await self._headers()
-            while next_url:
-                response = await client.get(next_url, headers=headers, params=params)
-                self._raise_for_status(response)
-                payload = response.json()
-                for item in self._extract_data_list(payload):
-                    mapped = self._to_provider_track(item)
-                    if mapped:
-                        tracks.append(mapped)
-                next_url = self._next_url_from_payload(payload)
-                params = None
+            pages = self._iter_pages(
+                client,
+                headers,
+                f"/v1/me/library/playlists/{playlist_id}/tracks",
+                {"limit": 100, "offset": 0},
+            )
+            async with aclosing(pages):
+                async for payload in pages:
+                    for item in self._extract_data_list(payload):
+                        mapped = self._to_provider_track(item)
+                        if mapped:
+                            tracks.append(mapped)
         return tracks
 
     async def add_tracks(self, provider_playlist_id: str, track_ids: Sequence[str]) -> None:
@@ -698,6 +726,27 @@ class AppleMusicProvider(MusicProviderClient):
                 tracks.append(mapped)
         return tracks
 
+    async def lookup_tracks_by_isrc(self, isrcs: Sequence[str]) -> Sequence[ProviderTrack]:
+        normalized_isrcs = list(dict.fromkeys(isrc.strip().upper() for isrc in isrcs if isrc and isrc.strip()))
+        if not normalized_isrcs:
+            return []
+        tracks: list[ProviderTrack] = []
+        async with httpx.AsyncClient(base_url=self.base_url, timeout=self._REQUEST_TIMEOUT_SECONDS) as client:
+            headers = await self._headers()
+            for index in range(0, len(normalized_isrcs), self._ISRC_FILTER_LIMIT):
+                chunk = normalized_isrcs[index : index + self._ISRC_FILTER_LIMIT]
+                payload = await self._get_json(
+                    client,
+                    headers,
+                    f"/v1/catalog/{self.storefront}/songs",
+                    {"filter[isrc]": ",".join(chunk)},
+                )
+                for item in self._extract_data_list(payload):
+                    mapped = self._to_provider_track(item)
+                    if mapped:
+                        tracks.append(mapped)
+        return tracks
+
     async def related_tracks(
         self,
         provider_track_id: str,
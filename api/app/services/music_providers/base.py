@@ -1,7 +1,8 @@
 """Base classes for music provider integrations."""
 
 from dataclasses import dataclass
-from typing import Literal, Sequence
+import sys
+from typing import Any, Literal, Sequence
 
 
 class ProviderAuthError(Exception):
@@ -16,7 +17,13 @@ class ProviderAPIError(Exception):
         self.status_code = status_code
 
 
-@dataclass
+def intern_label(value: Any) -> Any:
+    """Intern a low-cardinality text label (genre, access level) so cached tracks share one copy."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Playlists stay mutable: Apple Music fills in ``track_count`` after listing them.
+@dataclass(slots=True)
 class ProviderPlaylist:
     provider: str
     provider_playlist_id: str
@@ -26,9 +33,14 @@ class ProviderPlaylist:
     url: str | None = None
     track_count: int | None = None
     is_public: bool | None = None
+    # Opaque version that changes on every edit, for providers that expose one (Spotify).
+    snapshot_id: str | None = None
 
 
-@dataclass
+# Thousands of these are shared between the playlist and track metadata caches, so they are slotted and must be
+# treated as read-only. Not ``frozen``: that routes every field through ``object.__setattr__`` and roughly triples
+# construction time on the per-item parsers.
+@dataclass(slots=True)
 class ProviderTrack:
     provider_track_id: str
     title: str
@@ -37,6 +49,8 @@ class ProviderTrack:
     artwork_url: str | None = None
     url: str | None = None
     access: str | None = None
+    duration_ms: int | None = None
+    isrc: str | None = None
 
 
 @dataclass
@@ -102,6 +116,10 @@ class MusicProviderClient:
         """Search tracks by free-text query."""
         raise NotImplementedError
 
+    async def lookup_tracks_by_isrc(self, isrcs: Sequence[str]) -> Sequence[ProviderTrack]:
+        """Return catalog tracks for a batch of ISRCs; providers without batch lookup raise."""
+        raise NotImplementedError
+
     async def related_tracks(
         self,
         provider_track_id: str,
@@ -0,0 +1,74 @@
+"""Metrics for calls made through user-scoped provider clients."""
+
+from __future__ import annotations
+
+import asyncio
+from contextvars import ContextVar
+import time
+from typing import Awaitable, Callable, TypeVar
+
+from app.services.music_providers.base import ProviderAPIError, ProviderAuthError
+from app.utils.metrics import metrics_registry
+from app.utils.request_timing import record_timing
+
+T = TypeVar("T")
+
+provider_calls_total = metrics_registry.counter(
+    "votuna_provider_calls_total",
+    "Provider client method calls by outcome.",
+    ("provider", "method", "status"),
+)
+provider_call_duration_seconds = metrics_registry.histogram(
+    "votuna_provider_call_duration_seconds",
+    "Provider client method latency, including token refreshes and retries.",
+    ("provider", "method"),
+)
+provider_call_retries_total = metrics_registry.counter(
+    "votuna_provider_call_retries_total",
+    "Provider requests retried within one client method call.",
+    ("provider", "method", "reason"),
+)
+
+_current_call: ContextVar[tuple[str, str] | None] = ContextVar("provider_metrics_current_call", default=None)
+
+
+def _status_label(exc: BaseException | None) -> str:
+    if exc is None:
+        return "ok"
+    if isinstance(exc, ProviderAuthError):
+        return "auth_error"
+    if isinstance(exc, ProviderAPIError):
+        return str(exc.status_code) if exc.status_code is not None else "error"
+    if isinstance(exc, NotImplementedError):
+        return "unsupported"
+    if isinstance(exc, asyncio.CancelledError):
+        return "cancelled"
+    return "error"
+
+
+async def observe_provider_call(provider: str, method: str, operation: Callable[[], Awaitable[T]]) -> T:
+    """Run ``operation`` as one ``provider``/``method`` call, recording its count, latency and outcome.
+
+    The latency is also added to the current request's ``provider`` timing.
+    """
+    token = _current_call.set((provider, method))
+    started_at = time.perf_counter()
+    error: BaseException | None = None
+    try:
+        return await operation()
+    except BaseException as exc:
+        error = exc
+        raise
+    finally:
+        _current_call.reset(token)
+        elapsed_seconds = time.perf_counter() - started_at
+        record_timing("provider", elapsed_seconds)
+        provider_call_duration_seconds.observe(elapsed_seconds, provider=provider, method=method)
+        provider_calls_total.inc(provider=provider, method=method, status=_status_label(error))
+
+
+def record_provider_retry(provider: str, reason: str) -> None:
+    """Count a retried request, attributed to the client method currently being observed."""
+    current = _current_call.get()
+    method = current[1] if current is not None and current[0] == provider else "unknown"
+    provider_call_retries_total.inc(provider=provider, method=method, reason=reason)
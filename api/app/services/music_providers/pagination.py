@@ -0,0 +1,39 @@
+"""Shared pagination helpers for provider integrations."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+PageFetcher = Callable[[str, dict[str, Any] | None], Awaitable[Any]]
+NextUrlResolver = Callable[[Any], str | None]
+
+
+async def prefetch_pages(
+    fetch_page: PageFetcher,
+    first_url: str,
+    first_params: dict[str, Any] | None,
+    next_url_from_payload: NextUrlResolver,
+) -> AsyncIterator[Any]:
+    """Yield page payloads, fetching page k+1 while the caller maps page k.
+
+    At most one page is requested ahead of the consumer. The pending request is
+    cancelled when the consumer stops early or raises, so callers should iterate
+    inside ``contextlib.aclosing`` to release it promptly.
+    """
+    pending: asyncio.Task[Any] | None = asyncio.create_task(fetch_page(first_url, first_params))
+    try:
+        while pending is not None:
+            payload = await pending
+            pending = None
+            next_url = next_url_from_payload(payload)
+            if next_url:
+                pending = asyncio.create_task(fetch_page(next_url, None))
+            yield payload
+    finally:
+        if pending is not None:
+            if not pending.done():
+                pending.cancel()
+            elif not pending.cancelled():
+                # Mark a failed prefetch as retrieved; the consumer never asked for it.
+                pending.exception()
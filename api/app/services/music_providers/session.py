@@ -16,6 +16,9 @@ from app.crud.user import user_crud
 from app.models.user import User
 from app.services.music_providers.base import MusicProviderClient, ProviderAuthError
 from app.services.music_providers.factory import get_music_provider
+from app.services.music_providers.metrics import observe_provider_call, record_provider_retry
+from app.services.music_providers.track_cache import remember_tracks
+from app.utils.request_timing import timed
 from app.utils.token_expiry import coerce_expires_at, expires_at_from_payload
 
 logger = logging.getLogger(__name__)
@@ -283,13 +286,15 @@ class ProviderClientWithRefresh:
         if not force and not _is_expired(self._user.token_expires_at):
             return False
         if self._provider == "soundcloud":
-            next_access_token = await refresh_soundcloud_access_token(self._user, self._db)
+            refresh = refresh_soundcloud_access_token
         elif self._provider == "spotify":
-            next_access_token = await refresh_spotify_access_token(self._user, self._db)
+            refresh = refresh_spotify_access_token
         elif self._provider == "tidal":
-            next_access_token = await refresh_tidal_access_token(self._user, self._db)
+            refresh = refresh_tidal_access_token
         else:
             return False
+        with timed("token_refresh"):
+            next_access_token = await refresh(self._user, self._db)
         if not next_access_token:
             return False
         self._client = get_music_provider(self._provider, next_access_token)
@@ -302,17 +307,24 @@ class ProviderClientWithRefresh:
         if not inspect.iscoroutinefunction(target):
             return target
 
-        async def _wrapped(*args, **kwargs):
+        async def _call(*args, **kwargs):
             await self._refresh_access_token(force=False)
             current = getattr(self._client, name)
             try:
-                return await current(*args, **kwargs)
+                result = await current(*args, **kwargs)
             except ProviderAuthError:
                 refreshed = await self._refresh_access_token(force=True)
                 if not refreshed:
                     raise
+                record_provider_retry(self._provider, "auth_refresh")
                 retry = getattr(self._client, name)
-                return await retry(*args, **kwargs)
+                result = await retry(*args, **kwargs)
+            # Catalog metadata is not user-specific; share it with every other session.
+            remember_tracks(self._provider, result)
+            return result
+
+        async def _wrapped(*args, **kwargs):
+            return await observe_provider_call(self._provider, name, lambda: _call(*args, **kwargs))
 
         return _wrapped
 
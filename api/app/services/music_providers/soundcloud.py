@@ -15,6 +15,7 @@ from app.services.music_providers.base import (
     ProviderShuffleResult,
     ProviderAuthError,
     ProviderAPIError,
+    intern_label,
 )
 
 logger = logging.getLogger(__name__)
@@ -216,14 +217,19 @@ class SoundcloudProvider(MusicProviderClient):
         user = user_payload if isinstance(user_payload, dict) else {}
         raw_access = payload.get("access")
         access = raw_access.strip().lower() if isinstance(raw_access, str) and raw_access.strip() else None
+        raw_duration = payload.get("duration")
+        publisher_payload = payload.get("publisher_metadata")
+        raw_isrc = publisher_payload.get("isrc") if isinstance(publisher_payload, dict) else None
         return ProviderTrack(
             provider_track_id=track_id_value,
             title=payload.get("title") or "Untitled",
             artist=user.get("username"),
-            genre=payload.get("genre"),
+            genre=intern_label(payload.get("genre")),
             artwork_url=payload.get("artwork_url") or user.get("avatar_url"),
             url=payload.get("permalink_url"),
-            access=access,
+            access=intern_label(access),
+            duration_ms=raw_duration if isinstance(raw_duration, int) and raw_duration > 0 else None,
+            isrc=raw_isrc.strip().upper() if isinstance(raw_isrc, str) and raw_isrc.strip() else None,
         )
 
     def _to_provider_playlist(self, payload: Any) -> ProviderPlaylist | None:
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import aclosing
 import hashlib
 import random
 import time
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
+from functools import partial
 from typing import Any, Awaitable, Callable, Coroutine, Sequence, TypeVar
 from urllib.parse import urlparse
 
@@ -23,6 +25,8 @@ from app.services.music_providers.base import (
     ProviderTrack,
     ProviderUser,
 )
+from app.services.music_providers.metrics import record_provider_retry
+from app.services.music_providers.pagination import prefetch_pages
 
 T = TypeVar("T")
 
@@ -130,6 +134,7 @@ class SpotifyProvider(MusicProviderClient):
                 return response
             if attempt >= self._MAX_RATE_LIMIT_RETRIES:
                 return response
+            record_provider_retry("spotify", "rate_limit")
             retry_after_seconds = self._parse_retry_after_seconds(response.headers.get("Retry-After"))
             sleep_seconds = retry_after_seconds if retry_after_seconds is not None else 1.0
             bounded_sleep_seconds = min(max(sleep_seconds, 0.25), self._MAX_RATE_LIMIT_WAIT_SECONDS)
@@ -284,6 +289,7 @@ class SpotifyProvider(MusicProviderClient):
         external_urls = payload.get("external_urls")
         playlist_url = external_urls.get("spotify") if isinstance(external_urls, dict) else None
         is_public = payload.get("public") if isinstance(payload.get("public"), bool) else None
+        snapshot_id = payload.get("snapshot_id")
         return ProviderPlaylist(
             provider=self.provider,
             provider_playlist_id=playlist_id,
@@ -293,6 +299,7 @@ class SpotifyProvider(MusicProviderClient):
             url=playlist_url if isinstance(playlist_url, str) else None,
             track_count=track_count,
             is_public=is_public,
+            snapshot_id=snapshot_id if isinstance(snapshot_id, str) and snapshot_id else None,
         )
 
     def _to_provider_track(self, payload: Any) -> ProviderTrack | None:
@@ -316,6 +323,9 @@ class SpotifyProvider(MusicProviderClient):
             artwork_url = self._first_image_url(album_payload.get("images"))
         external_urls = payload.get("external_urls")
         track_url = external_urls.get("spotify") if isinstance(external_urls, dict) else None
+        raw_duration = payload.get("duration_ms")
+        external_ids = payload.get("external_ids")
+        raw_isrc = external_ids.get("isrc") if isinstance(external_ids, dict) else None
         return ProviderTrack(
             provider_track_id=track_id,
             title=payload.get("name") or "Untitled",
@@ -323,6 +333,8 @@ class SpotifyProvider(MusicProviderClient):
             genre=None,
             artwork_url=artwork_url,
             url=track_url if isinstance(track_url, str) else None,
+            duration_ms=raw_duration if isinstance(raw_duration, int) and raw_duration > 0 else None,
+            isrc=raw_isrc.strip().upper() if isinstance(raw_isrc, str) and raw_isrc.strip() else None,
         )
 
     def _to_provider_user(self, payload: Any) -> ProviderUser | None:
@@ -377,6 +389,25 @@ class SpotifyProvider(MusicProviderClient):
             return len(items)
         raise ProviderAPIError("Unable to determine playlist item count", status_code=502)
 
+    async def _get_json(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: dict[str, Any] | None,
+    ) -> Any:
+        response = await self._request_with_rate_limit_retry(
+            lambda: client.get(url, headers=self._headers(), params=params)
+        )
+        self._raise_for_status(response)
+        return response.json()
+
+    @staticmethod
+    def _next_url_from_payload(payload: Any) -> str | None:
+        if not isinstance(payload, dict):
+            return None
+        raw_next = payload.get("next")
+        return raw_next if isinstance(raw_next, str) and raw_next else None
+
     async def list_playlists(self) -> Sequence[ProviderPlaylist]:
         cache_key = self._playlist_cache_key()
         cached_playlists = self._get_cached_list(
@@ -389,27 +420,22 @@ class SpotifyProvider(MusicProviderClient):
 
         async def fetch_playlists() -> list[Any]:
             playlists: list[ProviderPlaylist] = []
-            next_url: str | None = "/me/playlists"
-            params: dict[str, int] | None = {"limit": 50}
             async with httpx.AsyncClient(base_url=self.base_url, timeout=self._REQUEST_TIMEOUT_SECONDS) as client:
-                while next_url is not None:
-                    request_url = next_url
-                    response = await self._request_with_rate_limit_retry(
-                        lambda: client.get(request_url, headers=self._headers(), params=params)
-                    )
-                    self._raise_for_status(response)
-                    payload = response.json()
-                    if not isinstance(payload, dict):
-                        break
-                    items = payload.get("items")
-                    if isinstance(items, list):
+                pages = prefetch_pages(
+                    partial(self._get_json, client),
+                    "/me/playlists",
+                    {"limit": 50},
+                    self._next_url_from_payload,
+                )
+                async with aclosing(pages):
+                    async for payload in pages:
+                        items = payload.get("items") if isinstance(payload, dict) else None
+                        if not isinstance(items, list):
+                            continue
                         for item in items:
                             mapped = self._to_provider_playlist(item)
                             if mapped:
                                 playlists.append(mapped)
-                    raw_next = payload.get("next")
-                    next_url = raw_next if isinstance(raw_next, str) and raw_next else None
-                    params = None
             self._set_cached_list(self._playlists_cache, cache_key, playlists)
             return playlists
 
@@ -527,20 +553,18 @@ class SpotifyProvider(MusicProviderClient):
 
         async def fetch_tracks() -> list[Any]:
             tracks: list[ProviderTrack] = []
-            next_url: str | None = f"/playlists/{playlist_id}/items"
-            params: dict[str, int | str] | None = {"limit": 100, "offset": 0}
             async with httpx.AsyncClient(base_url=self.base_url, timeout=self._REQUEST_TIMEOUT_SECONDS) as client:
-                while next_url is not None:
-                    request_url = next_url
-                    response = await self._request_with_rate_limit_retry(
-                        lambda: client.get(request_url, headers=self._headers(), params=params)
-                    )
-                    self._raise_for_status(response)
-                    payload = response.json()
-                    if not isinstance(payload, dict):
-                        break
-                    items = payload.get("items")
-                    if isinstance(items, list):
+                pages = prefetch_pages(
+                    partial(self._get_json, client),
+                    f"/playlists/{playlist_id}/items",
+                    {"limit": 100, "offset": 0},
+                    self._next_url_from_payload,
+                )
+                async with aclosing(pages):
+                    async for payload in pages:
+                        items = payload.get("items") if isinstance(payload, dict) else None
+                        if not isinstance(items, list):
+                            continue
                         for item in items:
                             if not isinstance(item, dict):
                                 continue
@@ -552,9 +576,6 @@ class SpotifyProvider(MusicProviderClient):
                             mapped = self._to_provider_track(track_payload)
                             if mapped:
                                 tracks.append(mapped)
-                    raw_next = payload.get("next")
-                    next_url = raw_next if isinstance(raw_next, str) and raw_next else None
-                    params = None
             self._set_cached_list(self._tracks_cache, cache_key, tracks)
             return tracks
 
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import aclosing
 from dataclasses import dataclass
+from functools import partial
 import random
+import re
 from typing import Any, Sequence
 from urllib.parse import quote, urlparse
 from uuid import UUID
@@ -19,7 +23,12 @@ from app.services.music_providers.base import (
     ProviderShuffleResult,
     ProviderTrack,
     ProviderUser,
+    intern_label,
 )
+from app.services.music_providers.pagination import prefetch_pages
+from app.services.music_providers.track_cache import track_metadata_cache
+
+_ISO_DURATION_PATTERN = re.compile(r"PT(?:(\d+(?:\.\d+)?)H)?(?:(\d+(?:\.\d+)?)M)?(?:(\d+(?:\.\d+)?)S)?")
 
 
 @dataclass
@@ -33,6 +42,8 @@ class TidalProvider(MusicProviderClient):
     provider = "tidal"
     _REQUEST_TIMEOUT_SECONDS = 15
     _TRACK_TYPES = {"tracks", "videos"}
+    _TRACK_FILTER_LIMIT = 20
+    _HYDRATION_CONCURRENCY = 4
 
     def __init__(self, access_token: str):
         super().__init__(access_token)
@@ -44,6 +55,18 @@ class TidalProvider(MusicProviderClient):
         cleaned = value.strip()
         return cleaned or None
 
+    @staticmethod
+    def _parse_duration_ms(value: Any) -> int | None:
+        """Parse an ISO 8601 duration such as ``PT3M42S`` into milliseconds."""
+        if not isinstance(value, str):
+            return None
+        match = _ISO_DURATION_PATTERN.fullmatch(value.strip())
+        if not match or not any(match.groups()):
+            return None
+        hours, minutes, seconds = (float(part) if part else 0.0 for part in match.groups())
+        duration_ms = int(round((hours * 3600 + minutes * 60 + seconds) * 1000))
+        return duration_ms or None
+
     @staticmethod
     def _is_uuid(value: str) -> bool:
         try:
@@ -440,16 +463,29 @@ class TidalProvider(MusicProviderClient):
         )
         if not track_url:
             track_url = f"https://listen.tidal.com/{path_resource}/{quote(track_id, safe='')}"
+        raw_isrc = attributes.get("isrc")
 
         return ProviderTrack(
             provider_track_id=track_id,
             title=title.strip(),
             artist=", ".join(artist_names) if artist_names else None,
-            genre=self._extract_genre(resource, included_index),
+            genre=intern_label(self._extract_genre(resource, included_index)),
             artwork_url=artwork_url,
             url=track_url,
+            duration_ms=self._parse_duration_ms(attributes.get("duration")),
+            isrc=raw_isrc.strip().upper() if isinstance(raw_isrc, str) and raw_isrc.strip() else None,
         )
 
+    async def _get_json(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: dict[str, Any] | None,
+    ) -> Any:
+        response = await client.get(url, headers=self._headers(), params=params)
+        self._raise_for_status(response)
+        return response.json()
+
     async def _fetch_current_user_id(self, client: httpx.AsyncClient) -> str:
         response = await client.get("/users/me", headers=self._headers())
         self._raise_for_status(response)
@@ -466,23 +502,19 @@ class TidalProvider(MusicProviderClient):
         playlists: list[ProviderPlaylist] = []
         async with httpx.AsyncClient(base_url=self.base_url, timeout=self._REQUEST_TIMEOUT_SECONDS) as client:
             user_id = await self._fetch_current_user_id(client)
-            next_url: str | None = "/playlists"
-            params: dict[str, Any] | None = {
+            params: dict[str, Any] = {
                 **self._params(),
                 "include": "coverArt",
                 "filter[owners.id]": user_id,
             }
-            while next_url:
-                response = await client.get(next_url, headers=self._headers(), params=params)
-                self._raise_for_status(response)
-                payload = response.json()
-                included_index = self._extract_included_index(payload)
-                for item in self._extract_data_list(payload):
-                    mapped = self._to_provider_playlist(item, included_index)
-                    if mapped:
-                        playlists.append(mapped)
-                next_url = self._next_url_from_payload(payload)
-                params = None
+            pages = prefetch_pages(partial(self._get_json, client), "/playlists", params, self._next_url_from_payload)
+            async with aclosing(pages):
+                async for payload in pages:
+                    included_index = self._extract_included_index(payload)
+                    for item in self._extract_data_list(payload):
+                        mapped = self._to_provider_playlist(item, included_index)
+                        if mapped:
+                            playlists.append(mapped)
         return playlists
 
     async def get_playlist(self, provider_playlist_id: str) -> ProviderPlaylist:
@@ -622,54 +654,90 @@ class TidalProvider(MusicProviderClient):
         enrich_track_metadata: bool = False,
     ) -> list[_TidalPlaylistItem]:
         items: list[_TidalPlaylistItem] = []
-        next_url: str | None = f"/playlists/{playlist_id}/relationships/items"
-        params: dict[str, Any] | None = {
+        hydration_tasks: list[asyncio.Task[None]] = []
+        params: dict[str, Any] = {
             **self._params(),
             "include": "tracks,videos,artists,albums,albums.coverArt",
         }
-        while next_url:
-            response = await client.get(next_url, headers=self._headers(), params=params)
-            self._raise_for_status(response)
-            payload = response.json()
-            included_index = self._extract_included_index(payload)
-            for entry in self._extract_data_list(payload):
-                resource_id = self._clean_id(str(entry.get("id") or ""))
-                resource_type = str(entry.get("type") or "").lower()
-                if not resource_id or resource_type not in self._TRACK_TYPES:
-                    continue
-                resource = included_index.get((resource_type, resource_id))
-                mapped_track = self._to_provider_track(resource or entry, included_index)
-                if enrich_track_metadata and (
-                    not isinstance(resource, dict) or not isinstance(resource.get("attributes"), dict)
-                ):
-                    try:
-                        mapped_track = await self._get_track(resource_id, resource_type)
-                    except ProviderAPIError:
-                        pass
-                if not mapped_track:
-                    mapped_track = ProviderTrack(
-                        provider_track_id=resource_id,
-                        title=resource_id,
-                        artist=None,
-                        genre=None,
-                        artwork_url=None,
-                        url=f"https://listen.tidal.com/{'video' if resource_type == 'videos' else 'track'}/{resource_id}",
-                    )
-                raw_meta = entry.get("meta")
-                meta = raw_meta if isinstance(raw_meta, dict) else {}
-                raw_item_id = meta.get("itemId")
-                item_id = raw_item_id.strip() if isinstance(raw_item_id, str) and raw_item_id.strip() else None
-                items.append(
-                    _TidalPlaylistItem(
-                        track=mapped_track,
-                        item_id=item_id,
-                        resource_type=resource_type,
-                    )
-                )
-            next_url = self._next_url_from_payload(payload)
-            params = None
+        pages = prefetch_pages(
+            partial(self._get_json, client),
+            f"/playlists/{playlist_id}/relationships/items",
+            params,
+            self._next_url_from_payload,
+        )
+        try:
+            async with aclosing(pages):
+                async for payload in pages:
+                    included_index = self._extract_included_index(payload)
+                    page_missing_items: list[_TidalPlaylistItem] = []
+                    for entry in self._extract_data_list(payload):
+                        resource_id = self._clean_id(str(entry.get("id") or ""))
+                        resource_type = str(entry.get("type") or "").lower()
+                        if not resource_id or resource_type not in self._TRACK_TYPES:
+                            continue
+                        resource = included_index.get((resource_type, resource_id))
+                        mapped_track = self._to_provider_track(resource or entry, included_index)
+                        if not mapped_track:
+                            path_resource = "video" if resource_type == "videos" else "track"
+                            mapped_track = ProviderTrack(
+                                provider_track_id=resource_id,
+                                title=resource_id,
+                                artist=None,
+                                genre=None,
+                                artwork_url=None,
+                                url=f"https://listen.tidal.com/{path_resource}/{resource_id}",
+                            )
+                        raw_meta = entry.get("meta")
+                        meta = raw_meta if isinstance(raw_meta, dict) else {}
+                        raw_item_id = meta.get("itemId")
+                        item_id = raw_item_id.strip() if isinstance(raw_item_id, str) and raw_item_id.strip() else None
+                        item = _TidalPlaylistItem(
+                            track=mapped_track,
+                            item_id=item_id,
+                            resource_type=resource_type,
+                        )
+                        items.append(item)
+                        if enrich_track_metadata and (
+                            not isinstance(resource, dict) or not isinstance(resource.get("attributes"), dict)
+                        ):
+                            page_missing_items.append(item)
+                    if page_missing_items:
+                        # Hydrate this page in the background while the next page is fetched.
+                        hydration_tasks.append(asyncio.create_task(self._hydrate_playlist_items(page_missing_items)))
+            if hydration_tasks:
+                await asyncio.gather(*hydration_tasks)
+        except BaseException:
+            for task in hydration_tasks:
+                task.cancel()
+            raise
         return items
 
+    async def _hydrate_playlist_items(self, items: Sequence[_TidalPlaylistItem]) -> None:
+        track_items = [item for item in items if item.resource_type == "tracks"]
+        video_items = [item for item in items if item.resource_type == "videos"]
+        semaphore = asyncio.Semaphore(self._HYDRATION_CONCURRENCY)
+
+        async def hydrate_tracks() -> None:
+            if not track_items:
+                return
+            try:
+                hydrated = await self._get_tracks_bulk([item.track.provider_track_id for item in track_items])
+            except ProviderAPIError:
+                return
+            for item in track_items:
+                hydrated_track = hydrated.get(item.track.provider_track_id)
+                if hydrated_track:
+                    item.track = hydrated_track
+
+        async def hydrate_video(item: _TidalPlaylistItem) -> None:
+            async with semaphore:
+                try:
+                    item.track = await self._get_track(item.track.provider_track_id, item.resource_type)
+                except ProviderAPIError:
+                    pass
+
+        await asyncio.gather(hydrate_tracks(), *(hydrate_video(item) for item in video_items))
+
     async def list_tracks(self, provider_playlist_id: str) -> Sequence[ProviderTrack]:
         playlist_id = self._normalize_playlist_id(provider_playlist_id)
         if not playlist_id:
@@ -977,27 +1045,79 @@ class TidalProvider(MusicProviderClient):
         if not normalized_ids:
             return {}
 
+        hydrated = track_metadata_cache.get_many(self.provider, normalized_ids)
+        missing_ids = [track_id for track_id in normalized_ids if track_id not in hydrated]
+        if not missing_ids:
+            return hydrated
+
+        chunks = [
+            missing_ids[index : index + self._TRACK_FILTER_LIMIT]
+            for index in range(0, len(missing_ids), self._TRACK_FILTER_LIMIT)
+        ]
+        semaphore = asyncio.Semaphore(self._HYDRATION_CONCURRENCY)
         async with httpx.AsyncClient(base_url=self.base_url, timeout=self._REQUEST_TIMEOUT_SECONDS) as client:
-            response = await client.get(
-                "/tracks",
-                headers=self._headers(),
-                params={
-                    **self._params(),
-                    "filter[id]": ",".join(normalized_ids),
-                    "include": "artists,albums,albums.coverArt",
-                },
-            )
-            self._raise_for_status(response)
-            payload = response.json()
 
-        included_index = self._extract_included_index(payload)
-        hydrated: dict[str, ProviderTrack] = {}
-        for item in self._extract_data_list(payload):
-            mapped = self._to_provider_track(item, included_index)
-            if mapped:
-                hydrated[mapped.provider_track_id] = mapped
+            async def fetch_chunk(chunk: list[str]) -> Any:
+                async with semaphore:
+                    response = await client.get(
+                        "/tracks",
+                        headers=self._headers(),
+                        params={
+                            **self._params(),
+                            "filter[id]": ",".join(chunk),
+                            "include": "artists,albums,albums.coverArt",
+                        },
+                    )
+                    self._raise_for_status(response)
+                    return response.json()
+
+            payloads = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+
+        fetched: list[ProviderTrack] = []
+        for payload in payloads:
+            included_index = self._extract_included_index(payload)
+            for item in self._extract_data_list(payload):
+                mapped = self._to_provider_track(item, included_index)
+                if mapped:
+                    fetched.append(mapped)
+                    hydrated[mapped.provider_track_id] = mapped
+        track_metadata_cache.put_many(self.provider, fetched)
         return hydrated
 
+    async def lookup_tracks_by_isrc(self, isrcs: Sequence[str]) -> Sequence[ProviderTrack]:
+        normalized_isrcs = list(dict.fromkeys(isrc.strip().upper() for isrc in isrcs if isrc and isrc.strip()))
+        if not normalized_isrcs:
+            return []
+        chunks = [
+            normalized_isrcs[index : index + self._TRACK_FILTER_LIMIT]
+            for index in range(0, len(normalized_isrcs), self._TRACK_FILTER_LIMIT)
+        ]
+        semaphore = asyncio.Semaphore(self._HYDRATION_CONCURRENCY)
+        async with httpx.AsyncClient(base_url=self.base_url, timeout=self._REQUEST_TIMEOUT_SECONDS) as client:
+
+            async def fetch_chunk(chunk: list[str]) -> Any:
+                async with semaphore:
+                    return await self._get_json(
+                        client,
+                        "/tracks",
+                        {
+                            **self._params(),
+                            "filter[isrc]": ",".join(chunk),
+                            "include": "artists,albums,albums.coverArt",
+                        },
+                    )
+
+            payloads = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+
+        tracks: list[ProviderTrack] = []
+        for payload in payloads:
+            included_index = self._extract_included_index(payload)
+            for item in self._extract_data_list(payload):
+                mapped = self._to_provider_track(item, included_index)
+                if mapped:
+                    tracks.append(mapped)
+        return tracks
+
     async def related_tracks(
         self,
         provider_track_id: str,
@@ -1009,8 +1129,7 @@ class TidalProvider(MusicProviderClient):
             return []
         safe_limit = max(1, min(limit, 50))
         safe_offset = max(0, offset)
-        next_url: str | None = f"/tracks/{track_id}/relationships/similarTracks"
-        params: dict[str, Any] | None = {
+        params: dict[str, Any] = {
             **self._params(),
             "include": "tracks,artists,albums,albums.coverArt",
         }
@@ -1019,59 +1138,68 @@ class TidalProvider(MusicProviderClient):
         skipped = 0
         seen_ids: set[str] = set()
         async with httpx.AsyncClient(base_url=self.base_url, timeout=self._REQUEST_TIMEOUT_SECONDS) as client:
-            while next_url and collected < safe_limit:
-                response = await client.get(next_url, headers=self._headers(), params=params)
-                self._raise_for_status(response)
-                payload = response.json()
-                included_index = self._extract_included_index(payload)
-                missing_track_metadata_ids: list[str] = []
-                candidate_tracks: list[tuple[ProviderTrack, str, bool]] = []
-                for entry in self._extract_data_list(payload):
-                    item_type = str(entry.get("type") or "").lower()
-                    if item_type not in self._TRACK_TYPES:
-                        continue
-                    item_id = self._clean_id(str(entry.get("id") or ""))
-                    if not item_id or item_id in seen_ids:
-                        continue
-                    seen_ids.add(item_id)
-                    resource = included_index.get((item_type, item_id))
-                    mapped = self._to_provider_track(resource or entry, included_index)
-                    if not mapped:
-                        continue
-                    needs_metadata = mapped.artist is None or mapped.artwork_url is None
-                    if needs_metadata and item_type == "tracks":
-                        missing_track_metadata_ids.append(mapped.provider_track_id)
-                    candidate_tracks.append((mapped, item_type, needs_metadata))
-
-                hydrated_tracks: dict[str, ProviderTrack] = {}
-                if missing_track_metadata_ids:
-                    try:
-                        hydrated_tracks = await self._get_tracks_bulk(missing_track_metadata_ids)
-                    except ProviderAPIError:
-                        hydrated_tracks = {}
-
-                for mapped, item_type, needs_metadata in candidate_tracks:
-                    hydrated = hydrated_tracks.get(mapped.provider_track_id)
-                    if hydrated:
-                        mapped = hydrated
-                    elif needs_metadata and item_type != "tracks":
+            pages = prefetch_pages(
+                partial(self._get_json, client),
+                f"/tracks/{track_id}/relationships/similarTracks",
+                params,
+                self._next_url_from_payload,
+            )
+            async with aclosing(pages):
+                async for payload in pages:
+                    included_index = self._extract_included_index(payload)
+                    missing_track_metadata_ids: list[str] = []
+                    candidate_tracks: list[tuple[ProviderTrack, str, bool]] = []
+                    for entry in self._extract_data_list(payload):
+                        item_type = str(entry.get("type") or "").lower()
+                        if item_type not in self._TRACK_TYPES:
+                            continue
+                        item_id = self._clean_id(str(entry.get("id") or ""))
+                        if not item_id or item_id in seen_ids:
+                            continue
+                        seen_ids.add(item_id)
+                        resource = included_index.get((item_type, item_id))
+                        mapped = self._to_provider_track(resource or entry, included_index)
+                        if not mapped:
+                            continue
+                        needs_metadata = mapped.artist is None or mapped.artwork_url is None
+                        if needs_metadata and item_type == "tracks":
+                            missing_track_metadata_ids.append(mapped.provider_track_id)
+                        candidate_tracks.append((mapped, item_type, needs_metadata))
+
+                    hydrated_tracks: dict[str, ProviderTrack] = {}
+                    if missing_track_metadata_ids:
                         try:
-                            mapped = await self._get_track(mapped.provider_track_id, item_type)
+                            hydrated_tracks = await self._get_tracks_bulk(missing_track_metadata_ids)
                         except ProviderAPIError:
-                            pass
-                    if skipped < safe_offset:
-                        skipped += 1
-                        continue
-                    results.append(mapped)
-                    collected += 1
+                            hydrated_tracks = {}
+
+                    for mapped, item_type, needs_metadata in candidate_tracks:
+                        hydrated = hydrated_tracks.get(mapped.provider_track_id)
+                        if hydrated:
+                            mapped = hydrated
+                        elif needs_metadata and item_type != "tracks":
+                            try:
+                                mapped = await self._get_track(mapped.provider_track_id, item_type)
+                            except ProviderAPIError:
+                                pass
+                        if skipped < safe_offset:
+                            skipped += 1
+                            continue
+                        results.append(mapped)
+                        collected += 1
+                        if collected >= safe_limit:
+                            break
                     if collected >= safe_limit:
                         break
-                next_url = self._next_url_from_payload(payload)
-                params = None
         return results
 
     async def _get_track(self, track_id: str, track_type: str) -> ProviderTrack:
         resource_name = "videos" if track_type == "videos" else "tracks"
+        # Video ids live in their own namespace, so only tracks go through the shared cache.
+        if resource_name == "tracks":
+            cached = track_metadata_cache.get(self.provider, track_id)
+            if cached is not None:
+                return cached
         async with httpx.AsyncClient(base_url=self.base_url, timeout=self._REQUEST_TIMEOUT_SECONDS) as client:
             response = await client.get(
                 f"/{resource_name}/{track_id}",
@@ -1088,6 +1216,8 @@ class TidalProvider(MusicProviderClient):
         mapped = self._to_provider_track(data[0], included_index) if data else None
         if not mapped:
             raise ProviderAPIError("Unable to load track", status_code=404)
+        if resource_name == "tracks":
+            track_metadata_cache.put(self.provider, mapped)
         return mapped
 
     async def resolve_track_url(self, url: str) -> ProviderTrack:
@@ -0,0 +1,124 @@
+"""Process-wide cache of catalog track metadata shared across users."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import sys
+import threading
+import time
+from typing import Any, Iterable
+
+from app.services.music_providers.base import ProviderTrack
+from app.utils.metrics import metrics_registry
+
+TRACK_METADATA_CACHE_MAX_ENTRIES = 10_000
+TRACK_METADATA_CACHE_TTL_SECONDS = 6 * 60 * 60.0
+
+track_metadata_cache_lookups_total = metrics_registry.counter(
+    "votuna_track_metadata_cache_lookups_total",
+    "Catalog track metadata cache lookups by result.",
+    ("provider", "result"),
+)
+
+
+@dataclass
+class TrackMetadataCacheStats:
+    hits: int
+    misses: int
+    size: int
+
+
+class TrackMetadataCache:
+    """Bounded LRU cache of ``ProviderTrack`` metadata keyed by (provider, track id).
+
+    Only tracks carrying both an artist and artwork are stored, so sparse
+    placeholders never satisfy a later hydration lookup.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], tuple[float, ProviderTrack]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def is_cacheable(track: Any) -> bool:
+        return (
+            isinstance(track, ProviderTrack)
+            and bool(track.provider_track_id)
+            and track.artist is not None
+            and track.artwork_url is not None
+        )
+
+    def get(self, provider: str, track_id: str) -> ProviderTrack | None:
+        track = self._lookup(provider, track_id)
+        track_metadata_cache_lookups_total.inc(provider=provider, result="miss" if track is None else "hit")
+        return track
+
+    def _lookup(self, provider: str, track_id: str) -> ProviderTrack | None:
+        key = (provider, track_id)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                self._misses += 1
+                return None
+            expires_at, track = cached
+            if expires_at <= now:
+                self._entries.pop(key, None)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return track
+
+    def get_many(self, provider: str, track_ids: Iterable[str]) -> dict[str, ProviderTrack]:
+        found: dict[str, ProviderTrack] = {}
+        for track_id in track_ids:
+            track = self.get(provider, track_id)
+            if track is not None:
+                found[track_id] = track
+        return found
+
+    def put(self, provider: str, track: ProviderTrack) -> None:
+        self.put_many(provider, [track])
+
+    def put_many(self, provider: str, tracks: Iterable[Any]) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds
+        provider = sys.intern(provider)
+        with self._lock:
+            for track in tracks:
+                if not self.is_cacheable(track):
+                    continue
+                key = (provider, track.provider_track_id)
+                self._entries[key] = (expires_at, track)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> TrackMetadataCacheStats:
+        with self._lock:
+            return TrackMetadataCacheStats(hits=self._hits, misses=self._misses, size=len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+track_metadata_cache = TrackMetadataCache(
+    max_entries=TRACK_METADATA_CACHE_MAX_ENTRIES,
+    ttl_seconds=TRACK_METADATA_CACHE_TTL_SECONDS,
+)
+
+
+def remember_tracks(provider: str, result: Any) -> None:
+    """Store any complete tracks found in a provider call result."""
+    if isinstance(result, ProviderTrack):
+        track_metadata_cache.put(provider, result)
+    elif isinstance(result, (list, tuple)):
+        track_metadata_cache.put_many(provider, result)
@@ -0,0 +1,304 @@
+"""Precomputed recommendation candidate pools and their background refresher."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import hashlib
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Sequence
+
+from sqlalchemy.orm import Session
+
+from app.crud.votuna_recommendation_pool import votuna_recommendation_pool_crud
+from app.services.music_providers.base import MusicProviderClient, ProviderAPIError, ProviderTrack
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], Session]
+PoolRefreshHandler = Callable[[Session, int], Awaitable[None]]
+
+RECOMMENDATION_POOL_SEED_LIMIT = 12
+RECOMMENDATION_RELATED_LIMIT_PER_SEED = 12
+RECOMMENDATION_POOL_FETCH_CONCURRENCY = 3
+RECOMMENDATION_POOL_MAX_AGE_SECONDS = 60 * 60.0
+RECOMMENDATION_POOL_REFRESH_AFTER_SECONDS = 15 * 60.0
+RECOMMENDATION_POOL_REFRESH_BATCH_SIZE = 20
+RECOMMENDATION_POOL_ACTIVE_WINDOW_SECONDS = 24 * 60 * 60.0
+RECOMMENDATION_POOL_ACCESS_TOUCH_SECONDS = 5 * 60.0
+RECOMMENDATION_POOL_IDLE_EXPIRY_SECONDS = 7 * 24 * 60 * 60.0
+RELATED_TRACKS_CACHE_MAX_ENTRIES = 5_000
+RELATED_TRACKS_CACHE_TTL_SECONDS = 6 * 60 * 60.0
+DECLINED_TRACK_FILTER_MAX_ENTRIES = 4_096
+DECLINED_TRACK_FILTER_TTL_SECONDS = 10 * 60.0
+
+
+class RelatedTracksCache:
+    """Bounded LRU of provider related-track results keyed by (provider, seed track id).
+
+    Related tracks depend only on the seed, so every playlist and member that
+    shares a seed reuses one provider response. Seeds the provider rejected are
+    cached as empty results.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], tuple[float, tuple[ProviderTrack, ...]]] = OrderedDict()
+
+    def get(self, key: tuple[str, str]) -> tuple[ProviderTrack, ...] | None:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            expires_at, tracks = cached
+            if expires_at <= now:
+                self._entries.pop(key, None)
+                return None
+            self._entries.move_to_end(key)
+            return tracks
+
+    def put(self, key: tuple[str, str], tracks: Sequence[ProviderTrack]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, tuple(tracks))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+related_tracks_cache = RelatedTracksCache(
+    max_entries=RELATED_TRACKS_CACHE_MAX_ENTRIES,
+    ttl_seconds=RELATED_TRACKS_CACHE_TTL_SECONDS,
+)
+
+
+class DeclinedTrackFilter:
+    """Per-(playlist, user) sets of declined track ids, loaded once and updated in place.
+
+    Declines recorded by this process are added to the cached set directly.
+    Entries expire so declines written by other processes show up eventually.
+    Returned sets are shared; callers must only read them.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[int, int], tuple[float, set[str]]] = OrderedDict()
+
+    def get_or_load(self, key: tuple[int, int], loader: Callable[[], set[str]]) -> set[str]:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] > now:
+                self._entries.move_to_end(key)
+                return cached[1]
+        track_ids = set(loader())
+        with self._lock:
+            self._entries[key] = (now + self.ttl_seconds, track_ids)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return track_ids
+
+    def add(self, key: tuple[int, int], track_id: str) -> None:
+        """Record a new decline in the cached set; uncached keys pick it up on their next load."""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                cached[1].add(track_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+declined_track_filter = DeclinedTrackFilter(
+    max_entries=DECLINED_TRACK_FILTER_MAX_ENTRIES,
+    ttl_seconds=DECLINED_TRACK_FILTER_TTL_SECONDS,
+)
+
+
+def distinct_track_ids(tracks: Sequence[ProviderTrack]) -> list[str]:
+    track_ids: list[str] = []
+    seen: set[str] = set()
+    for track in tracks:
+        track_id = (track.provider_track_id or "").strip()
+        if not track_id or track_id in seen:
+            continue
+        seen.add(track_id)
+        track_ids.append(track_id)
+    return track_ids
+
+
+def tracks_fingerprint(track_ids: Sequence[str]) -> str:
+    """Hash the playlist's track set so pools can be tied to the listing they came from."""
+    return hashlib.sha256("\n".join(sorted(set(track_ids))).encode("utf-8")).hexdigest()
+
+
+def _track_to_candidate(track: ProviderTrack) -> dict[str, Any]:
+    return {
+        "provider_track_id": track.provider_track_id,
+        "title": track.title,
+        "artist": track.artist,
+        "genre": track.genre,
+        "artwork_url": track.artwork_url,
+        "url": track.url,
+        "access": track.access,
+        "seed_track_ids": [],
+    }
+
+
+async def build_candidate_pool(
+    client: MusicProviderClient,
+    current_tracks: Sequence[ProviderTrack],
+    *,
+    provider: str,
+) -> dict[str, Any]:
+    """Fetch related tracks for the playlist's leading seeds and collect them into a pool.
+
+    Each candidate records which seeds produced it, so a request can rank the
+    pool for any subset of seeds without calling the provider. Related tracks
+    come from ``related_tracks_cache`` when another playlist used the same seed
+    recently. Seeds the provider rejects with 400/404 are skipped; other
+    provider errors propagate.
+    """
+    track_ids = distinct_track_ids(current_tracks)
+    seed_track_ids = track_ids[:RECOMMENDATION_POOL_SEED_LIMIT]
+    existing_track_ids = set(track_ids)
+    semaphore = asyncio.Semaphore(RECOMMENDATION_POOL_FETCH_CONCURRENCY)
+
+    async def fetch_related(seed_track_id: str) -> Sequence[ProviderTrack]:
+        cache_key = (provider, seed_track_id)
+        cached = related_tracks_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        async with semaphore:
+            try:
+                related_tracks = await client.related_tracks(
+                    seed_track_id,
+                    limit=RECOMMENDATION_RELATED_LIMIT_PER_SEED,
+                    offset=0,
+                )
+            except ProviderAPIError as exc:
+                if exc.status_code not in {400, 404}:
+                    raise
+                related_tracks = []
+        related_tracks_cache.put(cache_key, related_tracks)
+        return related_tracks
+
+    outcomes = await asyncio.gather(*(fetch_related(seed) for seed in seed_track_ids), return_exceptions=True)
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+
+    candidates_by_id: dict[str, dict[str, Any]] = {}
+    for seed_track_id, related_tracks in zip(seed_track_ids, outcomes):
+        for track in related_tracks:  # type: ignore[union-attr]
+            track_id = (track.provider_track_id or "").strip()
+            if not track_id or track_id in existing_track_ids:
+                continue
+            candidate = candidates_by_id.get(track_id)
+            if candidate is None:
+                candidate = _track_to_candidate(track)
+                candidates_by_id[track_id] = candidate
+            if seed_track_id not in candidate["seed_track_ids"]:
+                candidate["seed_track_ids"].append(seed_track_id)
+
+    return {
+        "tracks_fingerprint": tracks_fingerprint(track_ids),
+        "seed_track_ids": seed_track_ids,
+        "candidates": list(candidates_by_id.values()),
+    }
+
+
+def rank_candidates(candidates: Sequence[dict[str, Any]], seed_track_ids: Sequence[str]) -> list[dict[str, Any]]:
+    """Order pool candidates by how many of ``seed_track_ids`` produced them, then by earliest seed."""
+    seed_positions = {seed_track_id: index for index, seed_track_id in enumerate(seed_track_ids)}
+    scored: list[tuple[int, int, str, dict[str, Any]]] = []
+    for candidate in candidates:
+        positions = [seed_positions[seed] for seed in candidate.get("seed_track_ids", []) if seed in seed_positions]
+        if not positions:
+            continue
+        scored.append((-len(positions), min(positions), candidate["provider_track_id"], candidate))
+    scored.sort(key=lambda entry: entry[:3])
+    return [candidate for _score, _first_seed, _track_id, candidate in scored]
+
+
+class RecommendationPoolRefresher:
+    """Periodically rebuild recommendation pools that are stale or old and still being read.
+
+    Pools are created on first request; this loop keeps recently read ones warm
+    so later requests only filter and page over stored candidates, and deletes
+    pools nobody has read for a week instead of rebuilding them forever.
+    """
+
+    def __init__(self, handler: PoolRefreshHandler):
+        self._handler = handler
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self, session_factory: SessionFactory, interval_seconds: float) -> None:
+        if self._task is not None or interval_seconds <= 0:
+            return
+        self._task = asyncio.create_task(
+            self._loop(session_factory, interval_seconds),
+            name="recommendation-pool-refresher",
+        )
+        logger.info("Started recommendation pool refresher every %ss", interval_seconds)
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    async def run_once(self, session_factory: SessionFactory) -> int:
+        """Refresh one batch of due pools. Return how many were attempted."""
+        db = session_factory()
+        try:
+            now = datetime.now(timezone.utc)
+            expired = votuna_recommendation_pool_crud.delete_idle(
+                db,
+                accessed_before=now - timedelta(seconds=RECOMMENDATION_POOL_IDLE_EXPIRY_SECONDS),
+            )
+            if expired:
+                logger.info("Expired %s idle recommendation pools", expired)
+            playlist_ids = votuna_recommendation_pool_crud.list_due_playlist_ids(
+                db,
+                computed_before=now - timedelta(seconds=RECOMMENDATION_POOL_REFRESH_AFTER_SECONDS),
+                accessed_after=now - timedelta(seconds=RECOMMENDATION_POOL_ACTIVE_WINDOW_SECONDS),
+                limit=RECOMMENDATION_POOL_REFRESH_BATCH_SIZE,
+            )
+            for playlist_id in playlist_ids:
+                try:
+                    await self._handler(db, playlist_id)
+                except Exception:
+                    logger.exception("Recommendation pool refresh failed for playlist %s", playlist_id)
+                    db.rollback()
+            return len(playlist_ids)
+        finally:
+            db.close()
+
+    async def _loop(self, session_factory: SessionFactory, interval_seconds: float) -> None:
+        while True:
+            try:
+                await self.run_once(session_factory)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Recommendation pool refresher failed to poll")
+            await asyncio.sleep(interval_seconds)
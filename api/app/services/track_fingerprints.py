@@ -0,0 +1,135 @@
+"""Normalized track fingerprints for spotting the same song under different track ids."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import re
+import unicodedata
+from typing import Iterable
+
+from app.services.music_providers.base import ProviderTrack
+
+DURATION_BUCKET_MS = 2_000
+
+_FEATURING_SEGMENT_PATTERN = re.compile(r"[(\[][^)\]]*\b(?:feat|ft|featuring|with)\b\.?[^)\]]*[)\]]")
+_FEATURING_TAIL_PATTERN = re.compile(r"\s+(?:feat|ft|featuring)\b\.?.*$")
+_REMASTER_SEGMENT_PATTERN = re.compile(
+    r"(?:[(\[][^)\]]*\bremaster(?:ed)?\b[^)\]]*[)\]]|\s+-\s+[^-]*\bremaster(?:ed)?\b.*$)"
+)
+_ARTIST_SEPARATOR_PATTERN = re.compile(r"\s*(?:,|&|;|/|\bfeat\b\.?|\bft\b\.?|\bfeaturing\b|\bwith\b)\s*")
+_NON_ALPHANUMERIC_PATTERN = re.compile(r"[^0-9a-z]+")
+
+
+def _fold(value: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", value.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def _squash(value: str) -> str:
+    return _NON_ALPHANUMERIC_PATTERN.sub(" ", value).strip()
+
+
+def normalize_title(title: str | None) -> str:
+    """Lowercase ``title`` and drop featuring credits, remaster tags and punctuation."""
+    if not title:
+        return ""
+    folded = _fold(title)
+    folded = _FEATURING_SEGMENT_PATTERN.sub(" ", folded)
+    folded = _REMASTER_SEGMENT_PATTERN.sub(" ", folded)
+    folded = _FEATURING_TAIL_PATTERN.sub("", folded)
+    return _squash(folded)
+
+
+def primary_artist(artist: str | None) -> str:
+    """Return the normalized first credited artist."""
+    if not artist:
+        return ""
+    for part in _ARTIST_SEPARATOR_PATTERN.split(_fold(artist)):
+        normalized = _squash(part)
+        if normalized:
+            return normalized
+    return ""
+
+
+@dataclass(frozen=True)
+class TrackFingerprint:
+    title: str
+    artist: str
+    duration_bucket: int | None
+    isrc: str | None
+
+    @property
+    def song_key(self) -> tuple[str, str] | None:
+        if not self.title or not self.artist:
+            return None
+        return (self.title, self.artist)
+
+
+def fingerprint_track(track: ProviderTrack) -> TrackFingerprint:
+    duration_bucket = None
+    if track.duration_ms is not None and track.duration_ms > 0:
+        duration_bucket = track.duration_ms // DURATION_BUCKET_MS
+    isrc = track.isrc.strip().upper() if track.isrc and track.isrc.strip() else None
+    return TrackFingerprint(
+        title=normalize_title(track.title),
+        artist=primary_artist(track.artist),
+        duration_bucket=duration_bucket,
+        isrc=isrc,
+    )
+
+
+class TrackFingerprintIndex:
+    """Hashed lookup of track fingerprints.
+
+    Tracks match on ISRC, or on normalized title plus primary artist when their
+    durations fall in the same or an adjacent bucket. A track with no known
+    duration matches on title and artist alone.
+    """
+
+    def __init__(self, tracks: Iterable[ProviderTrack] = ()):
+        self._isrcs: set[str] = set()
+        self._duration_buckets_by_song: dict[tuple[str, str], set[int | None]] = {}
+        for track in tracks:
+            self.add(track)
+
+    def add(self, track: ProviderTrack) -> TrackFingerprint:
+        fingerprint = fingerprint_track(track)
+        self.add_fingerprint(fingerprint)
+        return fingerprint
+
+    def add_fingerprint(self, fingerprint: TrackFingerprint) -> None:
+        if fingerprint.isrc:
+            self._isrcs.add(fingerprint.isrc)
+        song_key = fingerprint.song_key
+        if song_key is not None:
+            self._duration_buckets_by_song.setdefault(song_key, set()).add(fingerprint.duration_bucket)
+
+    def matches(self, track: ProviderTrack) -> bool:
+        return self.matches_fingerprint(fingerprint_track(track))
+
+    def matches_fingerprint(self, fingerprint: TrackFingerprint) -> bool:
+        if fingerprint.isrc and fingerprint.isrc in self._isrcs:
+            return True
+        song_key = fingerprint.song_key
+        if song_key is None:
+            return False
+        buckets = self._duration_buckets_by_song.get(song_key)
+        if not buckets:
+            return False
+        bucket = fingerprint.duration_bucket
+        if bucket is None or None in buckets:
+            return True
+        return bool(buckets.intersection((bucket - 1, bucket, bucket + 1)))
+
+
+def dedupe_tracks_by_fingerprint(tracks: Iterable[ProviderTrack]) -> list[ProviderTrack]:
+    """Keep the first track of each fingerprint group, preserving order."""
+    index = TrackFingerprintIndex()
+    deduped: list[ProviderTrack] = []
+    for track in tracks:
+        fingerprint = fingerprint_track(track)
+        if index.matches_fingerprint(fingerprint):
+            continue
+        index.add_fingerprint(fingerprint)
+        deduped.append(track)
+    return deduped
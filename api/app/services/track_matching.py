@@ -0,0 +1,170 @@
+"""Resolve tracks from one provider onto another provider's catalog."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Sequence
+
+from app.services.music_providers.base import MusicProviderClient, ProviderAPIError, ProviderTrack
+from app.services.track_fingerprints import TrackFingerprintIndex, fingerprint_track
+
+logger = logging.getLogger(__name__)
+
+TRACK_MATCH_CACHE_MAX_ENTRIES = 20_000
+TRACK_MATCH_CACHE_TTL_SECONDS = 6 * 60 * 60.0
+TRACK_MATCH_MISS_TTL_SECONDS = 30 * 60.0
+TRACK_MATCH_SEARCH_CONCURRENCY = 4
+TRACK_MATCH_SEARCH_LIMIT = 5
+
+_MISSING = object()
+
+
+class TrackMatchCache:
+    """Bounded LRU of cross-provider match results, including confirmed misses.
+
+    Keys are (source provider, source track id, target provider). Misses expire
+    sooner than hits so catalog additions are picked up.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, miss_ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.miss_ttl_seconds = miss_ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str, str], tuple[float, ProviderTrack | None]] = OrderedDict()
+
+    def get(self, key: tuple[str, str, str]) -> ProviderTrack | None | object:
+        """Return the cached match, ``None`` for a cached miss, or ``_MISSING``."""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return _MISSING
+            expires_at, match = cached
+            if expires_at <= now:
+                self._entries.pop(key, None)
+                return _MISSING
+            self._entries.move_to_end(key)
+            return match
+
+    def put(self, key: tuple[str, str, str], match: ProviderTrack | None) -> None:
+        ttl_seconds = self.ttl_seconds if match is not None else self.miss_ttl_seconds
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, match)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+track_match_cache = TrackMatchCache(
+    max_entries=TRACK_MATCH_CACHE_MAX_ENTRIES,
+    ttl_seconds=TRACK_MATCH_CACHE_TTL_SECONDS,
+    miss_ttl_seconds=TRACK_MATCH_MISS_TTL_SECONDS,
+)
+
+
+@dataclass
+class TrackMatchResult:
+    source_track: ProviderTrack
+    target_track: ProviderTrack | None
+
+
+def _search_query(track: ProviderTrack) -> str:
+    fingerprint = fingerprint_track(track)
+    parts = [fingerprint.title or track.title, fingerprint.artist or (track.artist or "")]
+    return " ".join(part for part in parts if part).strip()
+
+
+def _pick_candidate(source_track: ProviderTrack, candidates: Sequence[ProviderTrack]) -> ProviderTrack | None:
+    source_index = TrackFingerprintIndex([source_track])
+    for candidate in candidates:
+        if candidate.provider_track_id and source_index.matches(candidate):
+            return candidate
+    return None
+
+
+async def match_tracks(
+    tracks: Sequence[ProviderTrack],
+    *,
+    source_provider: str,
+    target_client: MusicProviderClient,
+    target_provider: str,
+) -> list[TrackMatchResult]:
+    """Resolve ``tracks`` on ``target_client`` in order.
+
+    Cached results are used first. Remaining tracks with an ISRC are looked up
+    in batches when the target supports it; everything else falls back to a
+    bounded number of concurrent searches verified by fingerprint. Provider
+    auth errors propagate; other provider errors leave the track unmatched
+    without caching the miss.
+    """
+    results: dict[str, ProviderTrack | None] = {}
+    pending: list[ProviderTrack] = []
+    seen_ids: set[str] = set()
+    for track in tracks:
+        if not track.provider_track_id or track.provider_track_id in seen_ids:
+            continue
+        seen_ids.add(track.provider_track_id)
+        cached = track_match_cache.get((source_provider, track.provider_track_id, target_provider))
+        if cached is _MISSING:
+            pending.append(track)
+        else:
+            results[track.provider_track_id] = cached  # type: ignore[assignment]
+
+    isrc_tracks = [track for track in pending if track.isrc]
+    if isrc_tracks:
+        try:
+            found = await target_client.lookup_tracks_by_isrc([track.isrc for track in isrc_tracks if track.isrc])
+        except NotImplementedError:
+            found = []
+        except ProviderAPIError as exc:
+            logger.warning("ISRC lookup on %s failed: %s", target_provider, exc)
+            found = []
+        by_isrc: dict[str, ProviderTrack] = {}
+        for candidate in found:
+            if candidate.isrc and candidate.provider_track_id:
+                by_isrc.setdefault(candidate.isrc.strip().upper(), candidate)
+        for track in isrc_tracks:
+            match = by_isrc.get((track.isrc or "").strip().upper())
+            if match is not None:
+                results[track.provider_track_id] = match
+                track_match_cache.put((source_provider, track.provider_track_id, target_provider), match)
+
+    search_tracks = [track for track in pending if track.provider_track_id not in results]
+    semaphore = asyncio.Semaphore(TRACK_MATCH_SEARCH_CONCURRENCY)
+
+    async def search_one(track: ProviderTrack) -> None:
+        query = _search_query(track)
+        if not query:
+            results[track.provider_track_id] = None
+            return
+        async with semaphore:
+            try:
+                candidates = await target_client.search_tracks(query, limit=TRACK_MATCH_SEARCH_LIMIT)
+            except ProviderAPIError as exc:
+                logger.warning("Track search on %s failed for %r: %s", target_provider, query, exc)
+                results[track.provider_track_id] = None
+                return
+        match = _pick_candidate(track, candidates)
+        results[track.provider_track_id] = match
+        track_match_cache.put((source_provider, track.provider_track_id, target_provider), match)
+
+    outcomes = await asyncio.gather(*(search_one(track) for track in search_tracks), return_exceptions=True)
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+
+    return [
+        TrackMatchResult(source_track=track, target_track=results.get(track.provider_track_id))
+        for track in tracks
+        if track.provider_track_id
+    ]
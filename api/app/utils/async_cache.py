@@ -0,0 +1,86 @@
+"""Short-lived async result cache with in-flight request deduplication."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Callable, Coroutine, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def _identity(value: V) -> V:
+    return value
+
+
+class SingleFlightTTLCache(Generic[K, V]):
+    """Cache coroutine results for ``ttl_seconds`` and share concurrent computations.
+
+    Callers asking for the same key while a computation is running await that
+    computation instead of starting their own. Failures are never cached.
+    ``copy_value`` is applied to every value handed out so callers cannot mutate
+    the cached copy.
+    """
+
+    def __init__(self, ttl_seconds: float, copy_value: Callable[[V], V] = _identity):
+        self.ttl_seconds = ttl_seconds
+        self._copy_value = copy_value
+        self._lock = asyncio.Lock()
+        self._entries: dict[K, tuple[float, V]] = {}
+        self._inflight: dict[K, asyncio.Task[V]] = {}
+
+    def _prune(self, now: float) -> None:
+        expired_keys = [key for key, (expires_at, _value) in self._entries.items() if expires_at <= now]
+        for key in expired_keys:
+            self._entries.pop(key, None)
+
+    async def run(self, key: K, operation: Callable[[], Coroutine[Any, Any, V]]) -> V:
+        now = time.monotonic()
+        cached_entry = self._entries.get(key)
+        if cached_entry and cached_entry[0] > now:
+            return self._copy_value(cached_entry[1])
+
+        created_task = False
+        async with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            cached_entry = self._entries.get(key)
+            if cached_entry and cached_entry[0] > now:
+                return self._copy_value(cached_entry[1])
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.create_task(operation())
+                self._inflight[key] = task
+                created_task = True
+
+        try:
+            value = await task
+        except Exception:
+            if created_task:
+                async with self._lock:
+                    if self._inflight.get(key) is task:
+                        self._inflight.pop(key, None)
+            raise
+
+        if created_task:
+            async with self._lock:
+                if self._inflight.get(key) is task:
+                    self._inflight.pop(key, None)
+                self._entries[key] = (time.monotonic() + self.ttl_seconds, self._copy_value(value))
+
+        return self._copy_value(value)
+
+    async def invalidate(self, predicate: Callable[[K], bool]) -> None:
+        """Drop cached values and cancel running computations whose key matches."""
+        async with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                self._entries.pop(key, None)
+            for key in [key for key in self._inflight if predicate(key)]:
+                task = self._inflight.pop(key, None)
+                if task and not task.done():
+                    task.cancel()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
@@ -0,0 +1,66 @@
+"""JSON responses that skip FastAPI's ``jsonable_encoder`` round trip for large payloads.
+
+Endpoints opt in by returning these instead of plain models. Pydantic payloads are
+validated and dumped to JSON bytes by pydantic-core in a single pass; other payloads
+are rendered with orjson when it is installed. The route's ``response_model`` still
+documents the schema, but FastAPI does not re-validate a returned ``Response``.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+from typing import Any, Iterable, Mapping
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+from app.utils.request_timing import timed
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when available and compact stdlib json otherwise."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+@functools.cache
+def model_list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Return the shared ``TypeAdapter`` for ``list[model]``; building one compiles a schema."""
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+def model_list_response(
+    model: type[BaseModel],
+    items: Iterable[Any],
+    *,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """Validate ``items`` as ``list[model]`` and dump them straight to JSON bytes.
+
+    Items may be ``model`` instances (not revalidated), dicts, or objects whose
+    attributes match the model's fields.
+    """
+    adapter = model_list_adapter(model)
+    with timed("serialize"):
+        values = adapter.validate_python(list(items), from_attributes=True)
+        body = adapter.dump_json(values)
+    return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+def model_response(value: BaseModel, *, headers: Mapping[str, str] | None = None) -> Response:
+    """Dump one (possibly large, nested) model straight to JSON bytes."""
+    with timed("serialize"):
+        body = value.model_dump_json()
+    return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=headers)
@@ -0,0 +1,104 @@
+"""Per-request timing breakdown shared through a contextvar."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Iterator
+
+# Phase name -> Server-Timing description of what is counted.
+TIMING_PHASE_UNITS = {
+    "db": "queries",
+    "provider": "calls",
+    "token_refresh": "refreshes",
+    "serialize": None,
+}
+
+
+@dataclass
+class RequestTimings:
+    """Summed duration and count per phase for one request.
+
+    Phases can overlap (provider calls run concurrently, token refreshes happen
+    inside provider calls), so durations are totals rather than a partition of
+    the request's wall time.
+    """
+
+    started_at: float = field(default_factory=time.perf_counter)
+    durations: dict[str, float] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+    endpoint_finished_at: float | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            self.durations[phase] = self.durations.get(phase, 0.0) + seconds
+            self.counts[phase] = self.counts.get(phase, 0) + 1
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def server_timing(self) -> str:
+        """Render the phases plus the total as a ``Server-Timing`` header value."""
+        with self._lock:
+            durations = dict(self.durations)
+            counts = dict(self.counts)
+        entries: list[str] = []
+        for phase, unit in TIMING_PHASE_UNITS.items():
+            if phase not in durations and phase != "db":
+                continue
+            entry = f"{phase};dur={durations.get(phase, 0.0) * 1000:.2f}"
+            if unit:
+                entry += f';desc="{counts.get(phase, 0)} {unit}"'
+            entries.append(entry)
+        entries.append(f"total;dur={self.elapsed_ms():.2f}")
+        return ", ".join(entries)
+
+    def log_fields(self) -> list[str]:
+        with self._lock:
+            durations = dict(self.durations)
+            counts = dict(self.counts)
+        fields: list[str] = []
+        for phase, unit in TIMING_PHASE_UNITS.items():
+            if phase not in durations:
+                continue
+            fields.append(f"{phase}_ms={durations[phase] * 1000:.2f}")
+            if unit:
+                fields.append(f"{phase}_count={counts.get(phase, 0)}")
+        return fields
+
+
+_current_timings: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def current_request_timings() -> RequestTimings | None:
+    return _current_timings.get()
+
+
+@contextmanager
+def track_request_timings() -> Iterator[RequestTimings]:
+    timings = RequestTimings()
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+
+def record_timing(phase: str, seconds: float) -> None:
+    """Add ``seconds`` to ``phase`` for the current request, if one is being timed."""
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.record(phase, seconds)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(phase, time.perf_counter() - started_at)
@@ -0,0 +1 @@
+"""Load-test harness that drives the API against fake music provider servers."""
@@ -0,0 +1,728 @@
+"""Fake SoundCloud, Spotify, Apple Music and TIDAL HTTP APIs for load tests.
+
+One Starlette app serves every provider under its own prefix (``/soundcloud``,
+``/spotify/v1``, ``/apple`` and ``/tidal/v2``) so the provider clients only need
+their ``*_API_BASE_URL`` settings pointed at it. Responses follow the payload
+shapes the clients parse, tracks come from a deterministic catalog, playlists are
+mutable, and every request is counted per (provider, method, route template).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+import threading
+import uuid
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Mount, Route
+
+PROVIDERS = ("soundcloud", "spotify", "apple", "tidal")
+CATALOG_SIZE = 50_000
+RELATED_TRACK_OFFSET = 10_000
+_ARTIST_COUNT = 997
+_GENRES = ("House", "Techno", "UKG", "Drum & Bass", "Ambient", "Disco", "Hip-Hop", "Indie")
+_TIDAL_ITEM_NAMESPACE = uuid.UUID("6f0c0b7e-3f47-4d1e-9a55-8d3b9b1f0c11")
+
+Handler = Callable[[Request], Awaitable[Response]]
+
+
+@dataclass
+class FakeProviderConfig:
+    """Behavior knobs shared by every fake provider."""
+
+    latency_ms: float = 40.0
+    # Largest page returned by paginated endpoints, whatever ``limit`` the client asks for.
+    page_size: int = 100
+    # Every Nth request (across all providers) is answered with a 429. 0 disables.
+    rate_limit_every: int = 0
+    retry_after_seconds: float = 0.0
+    related_per_track: int = 25
+    search_results: int = 25
+
+
+@dataclass(frozen=True)
+class CatalogTrack:
+    index: int
+    title: str
+    artist_index: int
+    artist: str
+    genre: str
+    isrc: str
+    duration_ms: int
+
+    @property
+    def album_index(self) -> int:
+        return self.index // 10
+
+
+@functools.lru_cache(maxsize=CATALOG_SIZE)
+def catalog_track(index: int) -> CatalogTrack:
+    """Return the catalog track at ``index``; the same index always yields the same track."""
+    index %= CATALOG_SIZE
+    artist_index = (index * 7919) % _ARTIST_COUNT
+    return CatalogTrack(
+        index=index,
+        title=f"Benchmark Track {index:05d}",
+        artist_index=artist_index,
+        artist=f"Benchmark Artist {artist_index:03d}",
+        genre=_GENRES[index % len(_GENRES)],
+        isrc=f"QZBEN{index:07d}",
+        duration_ms=150_000 + (index % 180) * 1000,
+    )
+
+
+def track_id(provider: str, index: int) -> str:
+    """Return the provider-side track id for a catalog index."""
+    if provider == "spotify":
+        return f"bench{index:017d}"
+    if provider == "apple":
+        return f"i.bench{index:09d}"
+    return str(100_000 + index)
+
+
+def track_index(provider: str, value: Any) -> int | None:
+    """Map a provider-side track id (or Spotify URI) back to its catalog index."""
+    raw = str(value or "").strip()
+    if provider == "spotify":
+        raw = raw.rsplit(":", 1)[-1]
+        digits = raw[len("bench") :] if raw.startswith("bench") else ""
+    elif provider == "apple":
+        digits = raw[len("i.bench") :] if raw.startswith("i.bench") else ""
+    else:
+        digits = str(int(raw) - 100_000) if raw.isdigit() and int(raw) >= 100_000 else ""
+    if not digits.isdigit():
+        return None
+    index = int(digits)
+    return index if index < CATALOG_SIZE else None
+
+
+def related_indexes(seed_index: int, count: int) -> list[int]:
+    """Return the deterministic "related" tracks for a seed; neighbouring seeds share some results.
+
+    They live well past the low indexes seeded playlists use, so they are not filtered
+    out as tracks the playlist already has.
+    """
+    base = RELATED_TRACK_OFFSET + (seed_index // 2) * 37
+    return [(base + step * 11) % CATALOG_SIZE for step in range(count)]
+
+
+def search_indexes(query: str, count: int) -> list[int]:
+    start = zlib.crc32(query.strip().lower().encode("utf-8")) % CATALOG_SIZE
+    return [(start + offset) % CATALOG_SIZE for offset in range(count)]
+
+
+@dataclass
+class FakePlaylist:
+    provider: str
+    playlist_id: str
+    title: str
+    track_indexes: list[int] = field(default_factory=list)
+
+
+class FakeProviderState:
+    """Playlists and request counters shared by the fake provider routes.
+
+    Counters are read from the load generator's thread while the fake server
+    updates them from its own, so access goes through a lock.
+    """
+
+    def __init__(self, config: FakeProviderConfig | None = None) -> None:
+        self.config = config or FakeProviderConfig()
+        self.playlists: dict[tuple[str, str], FakePlaylist] = {}
+        self._calls: Counter[tuple[str, str, str]] = Counter()
+        self._rate_limited: Counter[str] = Counter()
+        self._request_count = 0
+        self._playlist_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def create_playlist(self, provider: str, title: str, track_indexes: Iterable[int] = ()) -> str:
+        """Create a provider playlist holding ``track_indexes`` and return its provider id."""
+        number = next(self._playlist_ids)
+        if provider == "spotify":
+            playlist_id = f"benchpl{number:015d}"
+        elif provider == "apple":
+            playlist_id = f"p.bench{number:09d}"
+        elif provider == "tidal":
+            playlist_id = str(uuid.UUID(int=number))
+        else:
+            playlist_id = str(900_000 + number)
+        self.playlists[(provider, playlist_id)] = FakePlaylist(
+            provider=provider,
+            playlist_id=playlist_id,
+            title=title,
+            track_indexes=list(track_indexes),
+        )
+        return playlist_id
+
+    def playlist(self, provider: str, playlist_id: str) -> FakePlaylist | None:
+        return self.playlists.get((provider, playlist_id))
+
+    def record_call(self, provider: str, method: str, route: str) -> bool:
+        """Count one request and return whether it should be rate limited."""
+        with self._lock:
+            self._calls[(provider, method, route)] += 1
+            self._request_count += 1
+            every = self.config.rate_limit_every
+            limited = every > 0 and self._request_count % every == 0
+            if limited:
+                self._rate_limited[provider] += 1
+            return limited
+
+    def call_counts(self) -> Counter[tuple[str, str, str]]:
+        with self._lock:
+            return Counter(self._calls)
+
+    def rate_limited_counts(self) -> Counter[str]:
+        with self._lock:
+            return Counter(self._rate_limited)
+
+
+def _not_found() -> JSONResponse:
+    return JSONResponse({"errors": [{"status": "404", "detail": "Not found"}]}, status_code=404)
+
+
+def _int_param(request: Request, name: str, default: int) -> int:
+    try:
+        return max(0, int(request.query_params.get(name, default)))
+    except ValueError:
+        return default
+
+
+def _artwork_url(kind: str, index: int) -> str:
+    return f"https://images.benchmark.invalid/{kind}/{index:05d}/500x500.jpg"
+
+
+# SoundCloud ---------------------------------------------------------------
+
+
+def _soundcloud_user(artist_index: int) -> dict[str, Any]:
+    slug = f"benchmark-artist-{artist_index:03d}"
+    return {
+        "id": 700_000 + artist_index,
+        "kind": "user",
+        "username": f"Benchmark Artist {artist_index:03d}",
+        "permalink": slug,
+        "permalink_url": f"https://soundcloud.com/{slug}",
+        "avatar_url": _artwork_url("avatars", artist_index),
+    }
+
+
+def soundcloud_track_payload(index: int) -> dict[str, Any]:
+    """Return the SoundCloud API track object for a catalog index."""
+    track = catalog_track(index)
+    provider_id = int(track_id("soundcloud", track.index))
+    return {
+        "kind": "track",
+        "id": provider_id,
+        "urn": f"soundcloud:tracks:{provider_id}",
+        "title": track.title,
+        "description": f"{track.title} by {track.artist}",
+        "user": _soundcloud_user(track.artist_index),
+        "genre": track.genre,
+        "artwork_url": _artwork_url("tracks", track.index),
+        "permalink_url": f"https://soundcloud.com/benchmark-artist-{track.artist_index:03d}/track-{track.index:05d}",
+        "access": "playable",
+        "duration": track.duration_ms,
+        "playback_count": track.index * 13,
+        "publisher_metadata": {"isrc": track.isrc, "artist": track.artist},
+    }
+
+
+def _soundcloud_playlist(playlist: FakePlaylist) -> dict[str, Any]:
+    return {
+        "kind": "playlist",
+        "id": int(playlist.playlist_id),
+        "title": playlist.title,
+        "description": None,
+        "sharing": "public",
+        "permalink_url": f"https://soundcloud.com/benchmark/sets/{playlist.playlist_id}",
+        "artwork_url": None,
+        "user": _soundcloud_user(0),
+        "track_count": len(playlist.track_indexes),
+        "tracks": [soundcloud_track_payload(index) for index in playlist.track_indexes],
+    }
+
+
+# Spotify ------------------------------------------------------------------
+
+
+def spotify_track_payload(index: int) -> dict[str, Any]:
+    """Return the Spotify Web API track object for a catalog index."""
+    track = catalog_track(index)
+    provider_id = track_id("spotify", track.index)
+    return {
+        "type": "track",
+        "id": provider_id,
+        "uri": f"spotify:track:{provider_id}",
+        "name": track.title,
+        "artists": [
+            {
+                "type": "artist",
+                "id": f"benchartist{track.artist_index:011d}",
+                "name": track.artist,
+            }
+        ],
+        "album": {
+            "type": "album",
+            "id": f"benchalbum{track.album_index:012d}",
+            "name": f"Benchmark Album {track.album_index:04d}",
+            "images": [
+                {"url": _artwork_url("albums", track.album_index), "height": 640, "width": 640},
+                {"url": _artwork_url("albums-small", track.album_index), "height": 300, "width": 300},
+            ],
+        },
+        "external_urls": {"spotify": f"https://open.spotify.com/track/{provider_id}"},
+        "external_ids": {"isrc": track.isrc},
+        "duration_ms": track.duration_ms,
+        "popularity": track.index % 100,
+    }
+
+
+def _spotify_playlist(playlist: FakePlaylist) -> dict[str, Any]:
+    return {
+        "type": "playlist",
+        "id": playlist.playlist_id,
+        "name": playlist.title,
+        "description": "",
+        "public": True,
+        "images": [],
+        "owner": {"id": "benchmark-owner"},
+        "external_urls": {"spotify": f"https://open.spotify.com/playlist/{playlist.playlist_id}"},
+        "items": {"total": len(playlist.track_indexes)},
+    }
+
+
+# Apple Music --------------------------------------------------------------
+
+
+def apple_song_payload(index: int) -> dict[str, Any]:
+    """Return the Apple Music API song resource for a catalog index."""
+    track = catalog_track(index)
+    provider_id = track_id("apple", track.index)
+    return {
+        "id": provider_id,
+        "type": "library-songs",
+        "attributes": {
+            "name": track.title,
+            "artistName": track.artist,
+            "albumName": f"Benchmark Album {track.album_index:04d}",
+            "genreNames": [track.genre],
+            "artwork": {
+                "url": f"https://images.benchmark.invalid/albums/{track.album_index:05d}/{{w}}x{{h}}bb.jpg",
+                "width": 1200,
+                "height": 1200,
+            },
+            "durationInMillis": track.duration_ms,
+            "isrc": track.isrc,
+            "playParams": {"id": provider_id, "kind": "song", "isLibrary": True},
+        },
+    }
+
+
+def _apple_playlist(playlist: FakePlaylist) -> dict[str, Any]:
+    # Library playlists carry no track count, just like the real API.
+    return {
+        "id": playlist.playlist_id,
+        "type": "library-playlists",
+        "attributes": {
+            "name": playlist.title,
+            "description": {"standard": ""},
+            "isPublic": False,
+            "canEdit": True,
+        },
+    }
+
+
+# TIDAL --------------------------------------------------------------------
+
+
+def _tidal_track(index: int) -> dict[str, Any]:
+    track = catalog_track(index)
+    minutes, seconds = divmod(track.duration_ms // 1000, 60)
+    return {
+        "id": track_id("tidal", track.index),
+        "type": "tracks",
+        "attributes": {
+            "title": track.title,
+            "isrc": track.isrc,
+            "duration": f"PT{minutes}M{seconds}S",
+            "explicit": False,
+            "popularity": (track.index % 100) / 100,
+        },
+        "relationships": {
+            "artists": {"data": [{"id": str(track.artist_index), "type": "artists"}]},
+            "albums": {"data": [{"id": str(track.album_index), "type": "albums"}]},
+        },
+    }
+
+
+def tidal_included_payload(indexes: Iterable[int]) -> list[dict[str, Any]]:
+    """Return the track, artist, album and artwork resources a page of tracks references."""
+    included: list[dict[str, Any]] = []
+    seen: set[tuple[str, int]] = set()
+    for index in indexes:
+        track = catalog_track(index)
+        included.append(_tidal_track(index))
+        if ("artists", track.artist_index) not in seen:
+            seen.add(("artists", track.artist_index))
+            included.append(
+                {
+                    "id": str(track.artist_index),
+                    "type": "artists",
+                    "attributes": {"name": track.artist},
+                }
+            )
+        if ("albums", track.album_index) not in seen:
+            seen.add(("albums", track.album_index))
+            included.append(
+                {
+                    "id": str(track.album_index),
+                    "type": "albums",
+                    "attributes": {"title": f"Benchmark Album {track.album_index:04d}"},
+                    "relationships": {"coverArt": {"data": [{"id": str(track.album_index), "type": "artworks"}]}},
+                }
+            )
+            included.append(
+                {
+                    "id": str(track.album_index),
+                    "type": "artworks",
+                    "attributes": {
+                        "files": [
+                            {
+                                "href": _artwork_url("albums", track.album_index),
+                                "meta": {"width": 640, "height": 640},
+                            }
+                        ]
+                    },
+                }
+            )
+    return included
+
+
+def _tidal_playlist(playlist: FakePlaylist) -> dict[str, Any]:
+    return {
+        "id": playlist.playlist_id,
+        "type": "playlists",
+        "attributes": {
+            "name": playlist.title,
+            "description": "",
+            "numberOfItems": len(playlist.track_indexes),
+            "accessType": "PUBLIC",
+        },
+        "relationships": {"coverArt": {"data": []}},
+    }
+
+
+def _tidal_item_id(playlist: FakePlaylist, position: int) -> str:
+    return str(uuid.uuid5(_TIDAL_ITEM_NAMESPACE, f"{playlist.playlist_id}:{position}"))
+
+
+class FakeProviderApp:
+    """Build the Starlette app serving every fake provider from one ``FakeProviderState``."""
+
+    def __init__(self, state: FakeProviderState) -> None:
+        self.state = state
+
+    def build(self) -> Starlette:
+        return Starlette(
+            routes=[
+                Mount(
+                    "/soundcloud",
+                    routes=[
+                        self._route("soundcloud", "GET", "/playlists/{playlist_id}", self._soundcloud_get_playlist),
+                        self._route("soundcloud", "PUT", "/playlists/{playlist_id}", self._soundcloud_put_playlist),
+                        self._route("soundcloud", "GET", "/tracks", self._soundcloud_search),
+                        self._route("soundcloud", "GET", "/tracks/{track_id}/related", self._soundcloud_related),
+                    ],
+                ),
+                Mount(
+                    "/spotify/v1",
+                    routes=[
+                        self._route("spotify", "GET", "/playlists/{playlist_id}", self._spotify_get_playlist),
+                        self._route("spotify", "GET", "/playlists/{playlist_id}/items", self._spotify_list_items),
+                        self._route("spotify", "POST", "/playlists/{playlist_id}/items", self._spotify_add_items),
+                        self._route("spotify", "GET", "/search", self._spotify_search),
+                    ],
+                ),
+                Mount(
+                    "/apple",
+                    routes=[
+                        self._route(
+                            "apple",
+                            "GET",
+                            "/v1/me/library/playlists/{playlist_id}",
+                            self._apple_get_playlist,
+                        ),
+                        self._route(
+                            "apple",
+                            "GET",
+                            "/v1/me/library/playlists/{playlist_id}/tracks",
+                            self._apple_list_tracks,
+                        ),
+                        self._route(
+                            "apple",
+                            "POST",
+                            "/v1/me/library/playlists/{playlist_id}/tracks",
+                            self._apple_add_tracks,
+                        ),
+                        self._route("apple", "GET", "/v1/catalog/{storefront}/search", self._apple_search),
+                    ],
+                ),
+                Mount(
+                    "/tidal/v2",
+                    routes=[
+                        self._route("tidal", "GET", "/playlists/{playlist_id}", self._tidal_get_playlist),
+                        self._route(
+                            "tidal",
+                            "GET",
+                            "/playlists/{playlist_id}/relationships/items",
+                            self._tidal_list_items,
+                        ),
+                        self._route(
+                            "tidal",
+                            "POST",
+                            "/playlists/{playlist_id}/relationships/items",
+                            self._tidal_add_items,
+                        ),
+                        self._route("tidal", "GET", "/tracks", self._tidal_get_tracks),
+                        self._route(
+                            "tidal",
+                            "GET",
+                            "/tracks/{track_id}/relationships/similarTracks",
+                            self._tidal_similar_tracks,
+                        ),
+                        self._route("tidal", "GET", "/searchResults/{query}", self._tidal_search),
+                    ],
+                ),
+            ]
+        )
+
+    def _route(self, provider: str, method: str, path: str, handler: Handler) -> Route:
+        config = self.state.config
+
+        async def endpoint(request: Request) -> Response:
+            if config.latency_ms > 0:
+                await asyncio.sleep(config.latency_ms / 1000)
+            if self.state.record_call(provider, method, path):
+                return JSONResponse(
+                    {"error": "rate_limited", "message": "Too many requests"},
+                    status_code=429,
+                    headers={"Retry-After": f"{config.retry_after_seconds:g}"},
+                )
+            return await handler(request)
+
+        return Route(path, endpoint, methods=[method])
+
+    def _page(self, request: Request, indexes: list[int], *, offset_param: str = "offset") -> tuple[list[int], int]:
+        """Return one page of ``indexes`` and the offset of the next page (0 when it is the last)."""
+        offset = _int_param(request, offset_param, 0)
+        limit = min(_int_param(request, "limit", self.state.config.page_size) or 1, self.state.config.page_size)
+        page = indexes[offset : offset + limit]
+        next_offset = offset + limit if offset + limit < len(indexes) else 0
+        return page, next_offset
+
+    # SoundCloud
+
+    async def _soundcloud_get_playlist(self, request: Request) -> Response:
+        playlist = self.state.playlist("soundcloud", request.path_params["playlist_id"])
+        if playlist is None:
+            return _not_found()
+        return JSONResponse(_soundcloud_playlist(playlist))
+
+    async def _soundcloud_put_playlist(self, request: Request) -> Response:
+        playlist = self.state.playlist("soundcloud", request.path_params["playlist_id"])
+        if playlist is None:
+            return _not_found()
+        payload = await request.json()
+        refs = ((payload.get("playlist") or {}).get("tracks") or []) if isinstance(payload, dict) else []
+        indexes = [track_index("soundcloud", ref.get("id")) for ref in refs if isinstance(ref, dict)]
+        playlist.track_indexes = [index for index in indexes if index is not None]
+        return JSONResponse(_soundcloud_playlist(playlist))
+
+    async def _soundcloud_search(self, request: Request) -> Response:
+        limit = min(_int_param(request, "limit", 10), self.state.config.search_results)
+        query = request.query_params.get("q", "")
+        return JSONResponse([soundcloud_track_payload(index) for index in search_indexes(query, limit)])
+
+    async def _soundcloud_related(self, request: Request) -> Response:
+        seed = track_index("soundcloud", request.path_params["track_id"])
+        if seed is None:
+            return _not_found()
+        related = related_indexes(seed, self.state.config.related_per_track)
+        page, _ = self._page(request, related)
+        return JSONResponse({"collection": [soundcloud_track_payload(index) for index in page], "next_href": None})
+
+    # Spotify
+
+    async def _spotify_get_playlist(self, request: Request) -> Response:
+        playlist = self.state.playlist("spotify", request.path_params["playlist_id"])
+        if playlist is None:
+            return _not_found()
+        return JSONResponse(_spotify_playlist(playlist))
+
+    async def _spotify_list_items(self, request: Request) -> Response:
+        playlist = self.state.playlist("spotify", request.path_params["playlist_id"])
+        if playlist is None:
+            return _not_found()
+        page, next_offset = self._page(request, playlist.track_indexes)
+        next_url = str(request.url.include_query_params(offset=next_offset, limit=len(page))) if next_offset else None
+        return JSONResponse(
+            {
+                "items": [{"item": spotify_track_payload(index), "is_local": False} for index in page],
+                "total": len(playlist.track_indexes),
+                "offset": _int_param(request, "offset", 0),
+                "next": next_url,
+            }
+        )
+
+    async def _spotify_add_items(self, request: Request) -> Response:
+        playlist = self.state.playlist("spotify", request.path_params["playlist_id"])
+        if playlist is None:
+            return _not_found()
+        payload = await request.json()
+        uris = payload.get("uris") if isinstance(payload, dict) else None
+        indexes = [track_index("spotify", uri) for uri in uris or []]
+        playlist.track_indexes.extend(index for index in indexes if index is not None)
+        return JSONResponse({"snapshot_id": f"snapshot-{len(playlist.track_indexes)}"}, status_code=201)
+
+    async def _spotify_search(self, request: Request) -> Response:
+        limit = min(_int_param(request, "limit", 10), self.state.config.search_results)
+        indexes = search_indexes(request.query_params.get("q", ""), limit)
+        return JSONResponse({"tracks": {"items": [spotify_track_payload(index) for index in indexes]}})
+
+    # Apple Music
+
+    async def _apple_get_playlist(self, request: Request) -> Response:
+        playlist = self.state.playlist("apple", request.path_params["playlist_id"])
+        if playlist is None:
+            return _not_found()
+        return JSONResponse({"data": [_apple_playlist(playlist)]})
+
+    async def _apple_list_tracks(self, request: Request) -> Response:
+        playlist = self.state.playlist("apple", request.path_params["playlist_id"])
+        if playlist is None:
+            return _not_found()
+        page, next_offset = self._page(request, playlist.track_indexes)
+        body: dict[str, Any] = {
+            "data": [apple_song_payload(index) for index in page],
+            "meta": {"total": len(playlist.track_indexes)},
+        }
+        if next_offset:
+            body["next"] = f"/v1/me/library/playlists/{playlist.playlist_id}/tracks?offset={next_offset}"
+        return JSONResponse(body)
+
+    async def _apple_add_tracks(self, request: Request) -> Response:
+        playlist = self.state.playlist("apple", request.path_params["playlist_id"])
+        if playlist is None:
+            return _not_found()
+        payload = await request.json()
+        items = payload.get("data") if isinstance(payload, dict) else None
+        indexes = [track_index("apple", item.get("id")) for item in items or [] if isinstance(item, dict)]
+        playlist.track_indexes.extend(index for index in indexes if index is not None)
+        return Response(status_code=204)
+
+    async def _apple_search(self, request: Request) -> Response:
+        limit = min(_int_param(request, "limit", 10), self.state.config.search_results)
+        indexes = search_indexes(request.query_params.get("term", ""), limit)
+        return JSONResponse({"results": {"songs": {"data": [apple_song_payload(index) for index in indexes]}}})
+
+    # TIDAL
+
+    async def _tidal_get_playlist(self, request: Request) -> Response:
+        playlist = self.state.playlist("tidal", request.path_params["playlist_id"])
+        if playlist is None:
+            return _not_found()
+        return JSONResponse({"data": _tidal_playlist(playlist), "included": []})
+
+    async def _tidal_list_items(self, request: Request) -> Response:
+        playlist = self.state.playlist("tidal", request.path_params["playlist_id"])
+        if playlist is None:
+            return _not_found()
+        offset = _int_param(request, "page[cursor]", 0)
+        page, next_offset = self._page(request, playlist.track_indexes, offset_param="page[cursor]")
+        body: dict[str, Any] = {
+            "data": [
+                {
+                    "id": track_id("tidal", index),
+                    "type": "tracks",
+                    "meta": {"itemId": _tidal_item_id(playlist, offset + position)},
+                }
+                for position, index in enumerate(page)
+            ],
+            "included": tidal_included_payload(page),
+            "links": {"self": request.url.path},
+        }
+        if next_offset:
+            body["links"]["next"] = f"/playlists/{playlist.playlist_id}/relationships/items?page[cursor]={next_offset}"
+        return JSONResponse(body)
+
+    async def _tidal_add_items(self, request: Request) -> Response:
+        playlist = self.state.playlist("tidal", request.path_params["playlist_id"])
+        if playlist is None:
+            return _not_found()
+        payload = await request.json()
+        items = payload.get("data") if isinstance(payload, dict) else None
+        indexes = [track_index("tidal", item.get("id")) for item in items or [] if isinstance(item, dict)]
+        added = [index for index in indexes if index is not None]
+        meta = payload.get("meta") if isinstance(payload, dict) else None
+        if isinstance(meta, dict) and meta.get("positionBefore"):
+            playlist.track_indexes[:0] = added
+        else:
+            playlist.track_indexes.extend(added)
+        return Response(status_code=201)
+
+    async def _tidal_get_tracks(self, request: Request) -> Response:
+        raw_ids = request.query_params.get("filter[id]", "")
+        candidates = (track_index("tidal", value) for value in raw_ids.split(","))
+        indexes = [index for index in candidates if index is not None]
+        return JSONResponse(
+            {
+                "data": [_tidal_track(index) for index in indexes],
+                "included": [item for item in tidal_included_payload(indexes) if item["type"] != "tracks"],
+            }
+        )
+
+    async def _tidal_similar_tracks(self, request: Request) -> Response:
+        seed = track_index("tidal", request.path_params["track_id"])
+        if seed is None:
+            return _not_found()
+        related = related_indexes(seed, self.state.config.related_per_track)
+        page, next_offset = self._page(request, related, offset_param="page[cursor]")
+        body: dict[str, Any] = {
+            "data": [{"id": track_id("tidal", index), "type": "tracks"} for index in page],
+            "included": tidal_included_payload(page),
+            "links": {"self": request.url.path},
+        }
+        if next_offset:
+            body["links"][
+                "next"
+            ] = f"/tracks/{request.path_params['track_id']}/relationships/similarTracks?page[cursor]={next_offset}"
+        return JSONResponse(body)
+
+    async def _tidal_search(self, request: Request) -> Response:
+        indexes = search_indexes(request.path_params["query"], self.state.config.search_results)
+        return JSONResponse(
+            {
+                "data": {
+                    "id": request.path_params["query"],
+                    "type": "searchResults",
+                    "relationships": {
+                        "tracks": {"data": [{"id": track_id("tidal", index), "type": "tracks"} for index in indexes]}
+                    },
+                },
+                "included": tidal_included_payload(indexes),
+            }
+        )
+
+
+def build_fake_provider_app(state: FakeProviderState) -> Starlette:
+    """Return the ASGI app serving every fake provider API from ``state``."""
+    return FakeProviderApp(state).build()
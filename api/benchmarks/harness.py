@@ -0,0 +1,342 @@
+"""Servers, seed data and latency bookkeeping shared by the load-test scenarios.
+
+Import this module only after ``DATABASE_URL`` and the other settings read at
+import time are in the environment (``benchmarks.run`` takes care of that).
+"""
+
+from __future__ import annotations
+
+import math
+import socket
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import httpx
+import uvicorn
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp
+
+import app.models  # noqa: F401
+from app.auth.jwt import create_access_token
+from app.config.settings import settings
+from app.crud.user import user_crud
+from app.crud.votuna_playlist import votuna_playlist_crud
+from app.crud.votuna_playlist_member import votuna_playlist_member_crud
+from app.crud.votuna_playlist_settings import votuna_playlist_settings_crud
+from app.crud.votuna_track_suggestion import votuna_track_suggestion_crud
+from app.crud.votuna_track_vote import votuna_track_vote_crud
+from app.db.session import Base, SessionLocal
+from benchmarks.fake_providers import FakeProviderState, catalog_track, track_id
+
+SERVER_START_TIMEOUT_SECONDS = 10.0
+PROVIDER_PREFIXES = {
+    "soundcloud": "/soundcloud",
+    "spotify": "/spotify/v1",
+    "apple": "/apple",
+    "tidal": "/tidal/v2",
+}
+
+
+class BackgroundServer:
+    """Serve an ASGI app with uvicorn from a daemon thread on an ephemeral localhost port."""
+
+    def __init__(self, asgi_app: ASGIApp, *, lifespan: str = "auto") -> None:
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(("127.0.0.1", 0))
+        host, port = self._socket.getsockname()
+        self.base_url = f"http://{host}:{port}"
+        config = uvicorn.Config(asgi_app, log_level="warning", access_log=False, lifespan=lifespan)
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(
+            target=self._server.run,
+            kwargs={"sockets": [self._socket]},
+            daemon=True,
+        )
+
+    def __enter__(self) -> "BackgroundServer":
+        self._thread.start()
+        deadline = time.monotonic() + SERVER_START_TIMEOUT_SECONDS
+        while not self._server.started:
+            if not self._thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError(f"Server on {self.base_url} failed to start")
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.should_exit = True
+        self._thread.join(SERVER_START_TIMEOUT_SECONDS)
+        self._socket.close()
+
+
+def point_providers_at(base_url: str) -> None:
+    """Send every provider client to the fake provider server at ``base_url``."""
+    settings.SOUNDCLOUD_API_BASE_URL = f"{base_url}{PROVIDER_PREFIXES['soundcloud']}"
+    settings.SPOTIFY_API_BASE_URL = f"{base_url}{PROVIDER_PREFIXES['spotify']}"
+    settings.APPLE_MUSIC_API_BASE_URL = f"{base_url}{PROVIDER_PREFIXES['apple']}"
+    settings.TIDAL_API_BASE_URL = f"{base_url}{PROVIDER_PREFIXES['tidal']}"
+    settings.APPLE_MUSIC_DEVELOPER_TOKEN = "benchmark-developer-token"
+
+
+def use_sqlite_database(path: str) -> Engine:
+    """Rebind every session to a fresh SQLite file so no PostgreSQL server is needed."""
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    SessionLocal.configure(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@dataclass(frozen=True)
+class BenchUser:
+    id: int
+    token: str
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+@dataclass
+class Workspace:
+    """A Votuna playlist backed by a fake provider playlist, with an owner and members."""
+
+    provider: str
+    owner: BenchUser
+    members: list[BenchUser]
+    playlist_id: int
+    provider_playlist_id: str
+
+    @property
+    def everyone(self) -> list[BenchUser]:
+        return [self.owner, *self.members]
+
+
+class Seeder:
+    """Create benchmark users and playlists directly through the CRUD layer."""
+
+    def __init__(self, provider: str, fake_state: FakeProviderState) -> None:
+        self.provider = provider
+        self.fake_state = fake_state
+        # Unique per run so repeated runs against the same database do not collide.
+        self.run_id = uuid.uuid4().hex[:8]
+        self._user_numbers = iter(range(1_000_000))
+
+    def create_user(self) -> BenchUser:
+        number = next(self._user_numbers)
+        with SessionLocal() as db:
+            user = user_crud.create(
+                db,
+                {
+                    "auth_provider": self.provider,
+                    "provider_user_id": f"bench-{self.run_id}-{number}",
+                    "email": f"bench-{self.run_id}-{number}@example.com",
+                    "first_name": "Bench",
+                    "last_name": f"User {number}",
+                    "display_name": f"Bench User {number}",
+                    "avatar_url": None,
+                    "permalink_url": None,
+                    "access_token": f"bench-access-token-{number}",
+                    "refresh_token": None,
+                    "token_expires_at": datetime.now(timezone.utc) + timedelta(days=30),
+                    "last_login_at": datetime.now(timezone.utc),
+                    "is_active": True,
+                },
+            )
+            return BenchUser(id=user.id, token=create_access_token(str(user.id)))
+
+    def create_workspace(
+        self,
+        *,
+        owner: BenchUser | None = None,
+        member_count: int,
+        track_indexes: list[int],
+        title: str = "Benchmark Playlist",
+    ) -> Workspace:
+        owner = owner or self.create_user()
+        members = [self.create_user() for _ in range(member_count)]
+        provider_playlist_id = self.fake_state.create_playlist(self.provider, title, track_indexes)
+        with SessionLocal() as db:
+            playlist = votuna_playlist_crud.create(
+                db,
+                {
+                    "owner_user_id": owner.id,
+                    "provider": self.provider,
+                    "provider_playlist_id": provider_playlist_id,
+                    "title": title,
+                    "description": None,
+                    "image_url": None,
+                    "is_active": True,
+                    "last_synced_at": datetime.now(timezone.utc),
+                },
+            )
+            votuna_playlist_settings_crud.create(
+                db,
+                {
+                    "playlist_id": playlist.id,
+                    "required_vote_percent": 60,
+                    "tie_break_mode": "add",
+                },
+            )
+            for user, role in [(owner, "owner"), *((member, "member") for member in members)]:
+                votuna_playlist_member_crud.create(
+                    db,
+                    {
+                        "playlist_id": playlist.id,
+                        "user_id": user.id,
+                        "role": role,
+                        "joined_at": datetime.now(timezone.utc),
+                    },
+                )
+            playlist_id = playlist.id
+        return Workspace(
+            provider=self.provider,
+            owner=owner,
+            members=members,
+            playlist_id=playlist_id,
+            provider_playlist_id=provider_playlist_id,
+        )
+
+    def create_pending_suggestions(self, workspace: Workspace, track_indexes: list[int]) -> None:
+        """Add pending suggestions from the owner, each with the owner's upvote, like the page shows."""
+        with SessionLocal() as db:
+            for index in track_indexes:
+                track = catalog_track(index)
+                suggestion = votuna_track_suggestion_crud.create(
+                    db,
+                    {
+                        "playlist_id": workspace.playlist_id,
+                        "provider_track_id": track_id(self.provider, index),
+                        "track_title": track.title,
+                        "track_artist": track.artist,
+                        "track_artwork_url": None,
+                        "track_url": None,
+                        "suggested_by_user_id": workspace.owner.id,
+                        "status": "pending",
+                    },
+                )
+                votuna_track_vote_crud.set_reaction(db, suggestion.id, workspace.owner.id, "up")
+
+
+def percentile(sorted_samples: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of already sorted samples."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_samples)))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    label: str
+    count: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class LatencyRecorder:
+    """Time API requests per label and count responses with an error status."""
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self.client = client
+        self._samples: dict[str, list[float]] = defaultdict(list)
+        self._errors: Counter[str] = Counter()
+        self.error_statuses: Counter[tuple[str, int]] = Counter()
+
+    def record(self, label: str, elapsed_ms: float, *, status_code: int | None = None) -> None:
+        self._samples[label].append(elapsed_ms)
+        if status_code is not None and status_code >= 400:
+            self._errors[label] += 1
+            self.error_statuses[(label, status_code)] += 1
+
+    async def request(self, label: str, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self.client.request(method, url, **kwargs)
+        self.record(label, (time.perf_counter() - started) * 1000, status_code=response.status_code)
+        return response
+
+    def summaries(self) -> list[LatencySummary]:
+        summaries = []
+        for label, samples in self._samples.items():
+            ordered = sorted(samples)
+            summaries.append(
+                LatencySummary(
+                    label=label,
+                    count=len(ordered),
+                    errors=self._errors[label],
+                    p50_ms=percentile(ordered, 50),
+                    p95_ms=percentile(ordered, 95),
+                    p99_ms=percentile(ordered, 99),
+                    max_ms=ordered[-1],
+                )
+            )
+        return summaries
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    wall_seconds: float
+    latencies: list[LatencySummary]
+    provider_calls: Counter[tuple[str, str, str]]
+    rate_limited: Counter[str]
+    notes: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "latencies": [
+                {
+                    "label": summary.label,
+                    "count": summary.count,
+                    "errors": summary.errors,
+                    "p50_ms": round(summary.p50_ms, 2),
+                    "p95_ms": round(summary.p95_ms, 2),
+                    "p99_ms": round(summary.p99_ms, 2),
+                    "max_ms": round(summary.max_ms, 2),
+                }
+                for summary in self.latencies
+            ],
+            "provider_calls": [
+                {"provider": provider, "method": method, "route": route, "count": count}
+                for (provider, method, route), count in sorted(self.provider_calls.items())
+            ],
+            "rate_limited": dict(self.rate_limited),
+            "notes": list(self.notes),
+        }
+
+
+def format_result(result: ScenarioResult) -> str:
+    """Render one scenario's latencies and provider call counts as a plain-text table."""
+    lines = [f"== {result.name} ({result.wall_seconds:.2f}s wall)"]
+    label_width = max([len("request"), *(len(summary.label) for summary in result.latencies)])
+    lines.append(
+        f"  {'request':<{label_width}}  {'count':>6}  {'errors':>6}  {'p50 ms':>8}  {'p95 ms':>8}  {'p99 ms':>8}"
+        f"  {'max ms':>8}"
+    )
+    for summary in result.latencies:
+        lines.append(
+            f"  {summary.label:<{label_width}}  {summary.count:>6}  {summary.errors:>6}  {summary.p50_ms:>8.1f}"
+            f"  {summary.p95_ms:>8.1f}  {summary.p99_ms:>8.1f}  {summary.max_ms:>8.1f}"
+        )
+    total_calls = sum(result.provider_calls.values())
+    lines.append(f"  provider calls: {total_calls}")
+    for (provider, method, route), count in sorted(result.provider_calls.items()):
+        lines.append(f"    {count:>6}  {provider} {method} {route}")
+    for provider, count in sorted(result.rate_limited.items()):
+        lines.append(f"    {count:>6}  {provider} answered with 429")
+    for note in result.notes:
+        lines.append(f"  note: {note}")
+    return "\n".join(lines)
@@ -0,0 +1,266 @@
+"""Load-test scenarios: playlist page loads, voting storms, recommendation paging and a 500-track transfer."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import random
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+import httpx
+
+from app.api.v1.routes.votuna.suggestions import RECOMMENDATION_CURSOR_HEADER
+from benchmarks.fake_providers import FakeProviderState, catalog_track, track_id
+from benchmarks.harness import BenchUser, LatencyRecorder, ScenarioResult, Seeder
+
+RECOMMENDATIONS_UNSUPPORTED = {"spotify", "apple"}
+# Catalog indexes used for suggestions and transfers start well past any seeded playlist.
+SUGGESTION_TRACK_OFFSET = 30_000
+TRANSFER_TRACK_OFFSET = 40_000
+
+
+@dataclass
+class ScenarioOptions:
+    iterations: int = 5
+    concurrency: int = 2
+    members: int = 4
+    playlist_size: int = 200
+    pending_suggestions: int = 20
+    recommendation_pages: int = 5
+    recommendation_page_size: int = 10
+    transfer_size: int = 500
+
+
+@dataclass
+class ScenarioContext:
+    recorder: LatencyRecorder
+    seeder: Seeder
+    options: ScenarioOptions
+
+    @property
+    def provider(self) -> str:
+        return self.seeder.provider
+
+
+Scenario = Callable[[ScenarioContext], Awaitable[list[str]]]
+
+
+def _playlist_url(playlist_id: int, suffix: str = "") -> str:
+    return f"/api/v1/votuna/playlists/{playlist_id}{suffix}"
+
+
+async def page_load(ctx: ScenarioContext) -> list[str]:
+    """Every member opens the playlist page, which fires the page's API requests in parallel."""
+    options = ctx.options
+    workspace = ctx.seeder.create_workspace(
+        member_count=options.members,
+        track_indexes=list(range(options.playlist_size)),
+    )
+    ctx.seeder.create_pending_suggestions(
+        workspace,
+        list(range(SUGGESTION_TRACK_OFFSET, SUGGESTION_TRACK_OFFSET + options.pending_suggestions)),
+    )
+    page_requests = [
+        ("GET /users/me", "/api/v1/users/me"),
+        ("GET /votuna/playlists", "/api/v1/votuna/playlists"),
+        ("GET /votuna/playlists/{id}", _playlist_url(workspace.playlist_id)),
+        ("GET /votuna/playlists/{id}/tracks", _playlist_url(workspace.playlist_id, "/tracks")),
+        ("GET /votuna/playlists/{id}/suggestions", _playlist_url(workspace.playlist_id, "/suggestions")),
+        ("GET /votuna/playlists/{id}/members", _playlist_url(workspace.playlist_id, "/members")),
+    ]
+    semaphore = asyncio.Semaphore(options.concurrency)
+
+    async def load_page(user: BenchUser) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            responses = await asyncio.gather(
+                *(ctx.recorder.request(label, "GET", url, headers=user.headers) for label, url in page_requests)
+            )
+            worst_status = max(response.status_code for response in responses)
+            ctx.recorder.record("page (all requests)", (time.perf_counter() - started) * 1000, status_code=worst_status)
+
+    for _ in range(options.iterations):
+        await asyncio.gather(*(load_page(user) for user in workspace.everyone))
+    return []
+
+
+async def voting_storm(ctx: ScenarioContext) -> list[str]:
+    """The owner suggests a batch of tracks and every member votes on each of them at once."""
+    options = ctx.options
+    workspace = ctx.seeder.create_workspace(
+        member_count=max(1, options.members),
+        track_indexes=list(range(options.playlist_size)),
+    )
+    next_index = itertools.count(SUGGESTION_TRACK_OFFSET)
+    semaphore = asyncio.Semaphore(options.concurrency)
+    shuffler = random.Random(0)
+    accepted = 0
+    total = 0
+
+    async def suggest(index: int) -> httpx.Response:
+        track = catalog_track(index)
+        async with semaphore:
+            return await ctx.recorder.request(
+                "POST /votuna/playlists/{id}/suggestions",
+                "POST",
+                _playlist_url(workspace.playlist_id, "/suggestions"),
+                headers=workspace.owner.headers,
+                json={
+                    "provider_track_id": track_id(ctx.provider, index),
+                    "track_title": track.title,
+                    "track_artist": track.artist,
+                },
+            )
+
+    async def vote(user: BenchUser, suggestion_id: int) -> httpx.Response:
+        async with semaphore:
+            return await ctx.recorder.request(
+                "PUT /votuna/suggestions/{id}/reaction",
+                "PUT",
+                f"/api/v1/votuna/suggestions/{suggestion_id}/reaction",
+                headers=user.headers,
+                json={"reaction": "up"},
+            )
+
+    for _ in range(options.iterations):
+        created = await asyncio.gather(*(suggest(next(next_index)) for _ in range(options.concurrency)))
+        suggestion_ids = [response.json()["id"] for response in created if response.status_code == 200]
+        ballots = [(member, suggestion_id) for suggestion_id in suggestion_ids for member in workspace.members]
+        shuffler.shuffle(ballots)
+        results = await asyncio.gather(*(vote(member, suggestion_id) for member, suggestion_id in ballots))
+        bodies = [response.json() for response in results if response.status_code == 200]
+        resolved = {body["id"]: body["status"] for body in bodies if body.get("status") != "pending"}
+        total += len(suggestion_ids)
+        accepted += sum(1 for value in resolved.values() if value == "accepted")
+    return [f"{accepted} of {total} suggestions were accepted after every member voted"]
+
+
+async def recommendation_paging(ctx: ScenarioContext) -> list[str]:
+    """Every member pages through recommendations by following the cursor header."""
+    options = ctx.options
+    workspace = ctx.seeder.create_workspace(
+        member_count=options.members,
+        track_indexes=list(range(options.playlist_size)),
+    )
+    url = _playlist_url(workspace.playlist_id, "/tracks/recommendations")
+    semaphore = asyncio.Semaphore(options.concurrency)
+
+    async def browse(user: BenchUser) -> None:
+        async with semaphore:
+            cursor: str | None = None
+            for page in range(options.recommendation_pages):
+                params: dict[str, str | int] = {"limit": options.recommendation_page_size}
+                if cursor:
+                    params["cursor"] = cursor
+                label = "GET recommendations (first page)" if page == 0 else "GET recommendations (next page)"
+                response = await ctx.recorder.request(label, "GET", url, headers=user.headers, params=params)
+                cursor = response.headers.get(RECOMMENDATION_CURSOR_HEADER)
+                if response.status_code >= 400 or not cursor:
+                    break
+
+    for _ in range(options.iterations):
+        await asyncio.gather(*(browse(user) for user in workspace.everyone))
+    if ctx.provider in RECOMMENDATIONS_UNSUPPORTED:
+        return [f"{ctx.provider} has no related-tracks API, so every recommendation page is empty"]
+    return []
+
+
+async def transfer(ctx: ScenarioContext) -> list[str]:
+    """Preview and execute an import of a ``transfer_size``-track provider playlist into an empty one."""
+    options = ctx.options
+    owner = ctx.seeder.create_user()
+    source_playlist_id = ctx.seeder.fake_state.create_playlist(
+        ctx.provider,
+        "Benchmark Transfer Source",
+        range(TRANSFER_TRACK_OFFSET, TRANSFER_TRACK_OFFSET + options.transfer_size),
+    )
+    destinations = [
+        ctx.seeder.create_workspace(owner=owner, member_count=0, track_indexes=[], title=f"Benchmark Transfer {number}")
+        for number in range(options.iterations)
+    ]
+    request_payload = {
+        "direction": "import_to_current",
+        "counterparty": {
+            "kind": "provider",
+            "provider": ctx.provider,
+            "provider_playlist_id": source_playlist_id,
+        },
+        "selection_mode": "all",
+    }
+    semaphore = asyncio.Semaphore(options.concurrency)
+    added_counts: list[int] = []
+
+    async def run_transfer(playlist_id: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            preview = await ctx.recorder.request(
+                "POST management/preview",
+                "POST",
+                _playlist_url(playlist_id, "/management/preview"),
+                headers=owner.headers,
+                json=request_payload,
+            )
+            preview_token = preview.json().get("preview_token") if preview.status_code == 200 else None
+            execute = await ctx.recorder.request(
+                "POST management/execute",
+                "POST",
+                _playlist_url(playlist_id, "/management/execute"),
+                headers=owner.headers,
+                json={**request_payload, "preview_token": preview_token},
+            )
+            ctx.recorder.record(
+                "transfer (preview + execute)",
+                (time.perf_counter() - started) * 1000,
+                status_code=max(preview.status_code, execute.status_code),
+            )
+            if execute.status_code == 200:
+                added_counts.append(execute.json().get("added_count", 0))
+
+    await asyncio.gather(*(run_transfer(destination.playlist_id) for destination in destinations))
+    return [f"transfers added {sorted(added_counts)} tracks (expected {options.transfer_size} each)"]
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "page_load": page_load,
+    "voting_storm": voting_storm,
+    "recommendation_paging": recommendation_paging,
+    "transfer": transfer,
+}
+
+
+async def run_scenarios(
+    names: list[str],
+    *,
+    api_base_url: str,
+    seeder: Seeder,
+    fake_state: FakeProviderState,
+    options: ScenarioOptions,
+) -> list[ScenarioResult]:
+    """Run the named scenarios one after another against the API server at ``api_base_url``."""
+    results: list[ScenarioResult] = []
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(base_url=api_base_url, timeout=120, limits=limits) as client:
+        for name in names:
+            recorder = LatencyRecorder(client)
+            calls_before = fake_state.call_counts()
+            rate_limited_before = fake_state.rate_limited_counts()
+            started = time.perf_counter()
+            notes = await SCENARIOS[name](ScenarioContext(recorder=recorder, seeder=seeder, options=options))
+            wall_seconds = time.perf_counter() - started
+            notes.extend(
+                f"{count} x HTTP {status_code} from {label}"
+                for (label, status_code), count in sorted(recorder.error_statuses.items())
+            )
+            results.append(
+                ScenarioResult(
+                    name=name,
+                    wall_seconds=wall_seconds,
+                    latencies=recorder.summaries(),
+                    provider_calls=fake_state.call_counts() - calls_before,
+                    rate_limited=fake_state.rate_limited_counts() - rate_limited_before,
+                    notes=notes,
+                )
+            )
+    return results
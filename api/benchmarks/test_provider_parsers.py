@@ -0,0 +1,201 @@
+"""Micro-benchmarks for the per-item provider payload parsers.
+
+Payloads are 1k and 10k item listings in each provider's wire format, built from
+the deterministic fake provider catalog and round-tripped through JSON so they
+look exactly like decoded API responses.
+
+    cd api
+    python -m pytest benchmarks -q                                    # time and measure every parser
+    python -m pytest benchmarks -q --benchmark-autosave                # save a baseline under .benchmarks/
+    python -m pytest benchmarks -q --benchmark-compare --benchmark-compare-fail=median:15%
+    python -m pytest benchmarks -q --benchmark-disable                 # allocation budgets only, one round each
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+from typing import Any
+
+import pytest
+
+from app.services.music_providers.apple import AppleMusicProvider
+from app.services.music_providers.soundcloud import SoundcloudProvider
+from app.services.music_providers.spotify import SpotifyProvider
+from app.services.music_providers.tidal import TidalProvider
+from app.services.music_providers.track_cache import TrackMetadataCache
+from benchmarks.fake_providers import (
+    apple_song_payload,
+    soundcloud_track_payload,
+    spotify_track_payload,
+    tidal_included_payload,
+    track_id,
+)
+
+ITEM_COUNTS = (1_000, 10_000)
+# Peak traced bytes per item while a parser maps a whole listing, about 20% above what the
+# parsers allocated once tracks were slotted (they started at about 1.5x the unslotted figures).
+# tracemalloc counts are deterministic, so unlike timings these can fail a run on any machine.
+PEAK_BYTES_PER_ITEM_BUDGETS = {
+    "soundcloud_track_reference": 430,
+    "soundcloud_to_provider_track": 275,
+    "spotify_to_provider_track": 210,
+    "apple_to_provider_track": 340,
+    "tidal_extract_included_index": 385,
+    "tidal_to_provider_track": 350,
+}
+CACHED_PLAYLIST_TRACKS = 10_000
+# Bytes each cached track keeps alive in a ``TrackMetadataCache`` filled from a 10k-track playlist,
+# about 10% above what tracks retain now that they are slotted (unslotted they retained 512/400/510/518).
+CACHED_BYTES_PER_TRACK_BUDGETS = {
+    "soundcloud": 450,
+    "spotify": 390,
+    "apple": 510,
+    "tidal": 520,
+}
+
+
+def _decoded(payload: Any) -> Any:
+    return json.loads(json.dumps(payload))
+
+
+@functools.lru_cache(maxsize=None)
+def _listing(provider: str, items: int) -> Any:
+    indexes = range(items)
+    if provider == "soundcloud":
+        return _decoded([soundcloud_track_payload(index) for index in indexes])
+    if provider == "spotify":
+        return _decoded([spotify_track_payload(index) for index in indexes])
+    if provider == "apple":
+        return _decoded([apple_song_payload(index) for index in indexes])
+    return _decoded(
+        {
+            "data": [
+                {"id": track_id("tidal", index), "type": "tracks", "meta": {"itemId": f"item-{index}"}}
+                for index in indexes
+            ],
+            "included": tidal_included_payload(indexes),
+        }
+    )
+
+
+def _check_budget(name: str, peak_bytes_per_item: float) -> None:
+    budget = PEAK_BYTES_PER_ITEM_BUDGETS[name]
+    assert peak_bytes_per_item <= budget, (
+        f"{name} allocated {peak_bytes_per_item:.0f} bytes per item at peak (budget {budget}); "
+        "if the increase is intended, raise the budget in this module"
+    )
+
+
+@pytest.mark.parametrize("items", ITEM_COUNTS)
+def test_soundcloud_track_reference(parser_benchmark, items):
+    payload = _listing("soundcloud", items)
+
+    def mapper(tracks: list[dict[str, Any]]) -> list[Any]:
+        return [SoundcloudProvider._extract_track_reference_from_payload(track) for track in tracks]
+
+    measurement = parser_benchmark(mapper, payload, items)
+    _check_budget("soundcloud_track_reference", measurement.peak_bytes_per_item)
+
+
+@pytest.mark.parametrize("items", ITEM_COUNTS)
+def test_soundcloud_to_provider_track(parser_benchmark, items):
+    payload = _listing("soundcloud", items)
+    provider = SoundcloudProvider("benchmark-token")
+
+    def mapper(tracks: list[dict[str, Any]]) -> list[Any]:
+        return [provider._to_provider_track(track) for track in tracks]
+
+    measurement = parser_benchmark(mapper, payload, items)
+    _check_budget("soundcloud_to_provider_track", measurement.peak_bytes_per_item)
+
+
+@pytest.mark.parametrize("items", ITEM_COUNTS)
+def test_spotify_to_provider_track(parser_benchmark, items):
+    payload = _listing("spotify", items)
+    provider = SpotifyProvider("benchmark-token")
+
+    def mapper(tracks: list[dict[str, Any]]) -> list[Any]:
+        return [provider._to_provider_track(track) for track in tracks]
+
+    measurement = parser_benchmark(mapper, payload, items)
+    _check_budget("spotify_to_provider_track", measurement.peak_bytes_per_item)
+
+
+@pytest.mark.parametrize("items", ITEM_COUNTS)
+def test_apple_to_provider_track(parser_benchmark, items):
+    payload = _listing("apple", items)
+    provider = AppleMusicProvider("benchmark-token")
+
+    def mapper(songs: list[dict[str, Any]]) -> list[Any]:
+        return [provider._to_provider_track(song) for song in songs]
+
+    measurement = parser_benchmark(mapper, payload, items)
+    _check_budget("apple_to_provider_track", measurement.peak_bytes_per_item)
+
+
+@pytest.mark.parametrize("items", ITEM_COUNTS)
+def test_tidal_extract_included_index(parser_benchmark, items):
+    payload = _listing("tidal", items)
+
+    measurement = parser_benchmark(TidalProvider._extract_included_index, payload, items)
+    _check_budget("tidal_extract_included_index", measurement.peak_bytes_per_item)
+
+
+@pytest.mark.parametrize("items", ITEM_COUNTS)
+def test_tidal_to_provider_track(parser_benchmark, items):
+    payload = _listing("tidal", items)
+    provider = TidalProvider("benchmark-token")
+    included_index = TidalProvider._extract_included_index(payload)
+
+    def mapper(listing: dict[str, Any]) -> list[Any]:
+        return [
+            provider._to_provider_track(included_index.get(("tracks", entry["id"])) or entry, included_index)
+            for entry in listing["data"]
+        ]
+
+    measurement = parser_benchmark(mapper, payload, items)
+    _check_budget("tidal_to_provider_track", measurement.peak_bytes_per_item)
+
+
+def _track_mapper(provider_name: str) -> Any:
+    if provider_name == "soundcloud":
+        soundcloud = SoundcloudProvider("benchmark-token")
+        return lambda tracks: [soundcloud._to_provider_track(track) for track in tracks]
+    if provider_name == "spotify":
+        spotify = SpotifyProvider("benchmark-token")
+        return lambda tracks: [spotify._to_provider_track(track) for track in tracks]
+    if provider_name == "apple":
+        apple = AppleMusicProvider("benchmark-token")
+        return lambda songs: [apple._to_provider_track(song) for song in songs]
+    tidal = TidalProvider("benchmark-token")
+
+    def map_tidal(listing: dict[str, Any]) -> list[Any]:
+        included_index = TidalProvider._extract_included_index(listing)
+        return [
+            tidal._to_provider_track(included_index.get(("tracks", entry["id"])) or entry, included_index)
+            for entry in listing["data"]
+        ]
+
+    return map_tidal
+
+
+@pytest.mark.parametrize("provider_name", ["soundcloud", "spotify", "apple", "tidal"])
+def test_track_metadata_cache_memory(parser_benchmark, provider_name):
+    payload = _listing(provider_name, CACHED_PLAYLIST_TRACKS)
+    map_tracks = _track_mapper(provider_name)
+
+    def fill_cache(listing: Any) -> TrackMetadataCache:
+        cache = TrackMetadataCache(max_entries=CACHED_PLAYLIST_TRACKS, ttl_seconds=60)
+        # Providers hand the cache a lower-cased copy of their name per request, not a literal.
+        cache.put_many("".join(provider_name), map_tracks(listing))
+        return cache
+
+    cache = fill_cache(payload)
+    assert cache.stats().size == CACHED_PLAYLIST_TRACKS
+    measurement = parser_benchmark(fill_cache, payload, CACHED_PLAYLIST_TRACKS)
+    budget = CACHED_BYTES_PER_TRACK_BUDGETS[provider_name]
+    assert measurement.retained_bytes_per_item <= budget, (
+        f"a cached {provider_name} track keeps {measurement.retained_bytes_per_item:.0f} bytes alive "
+        f"(budget {budget}); if the increase is intended, raise the budget in this module"
+    )
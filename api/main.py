@@ -1,16 +1,21 @@
-from fastapi import FastAPI, Depends, Request, status
+from fastapi import FastAPI, Depends, Header, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from contextlib import asynccontextmanager
 from sqlalchemy import text
 from sqlalchemy.orm import Session
+import hmac
 import logging
 import sys
-import time
 
 from app.api.v1.router import router as v1_router
+from app.api.v1.routes.votuna.management import management_job_workers
+from app.api.v1.routes.votuna.suggestions import RECOMMENDATION_CURSOR_HEADER, recommendation_pool_refresher
 from app.auth.dependencies import AUTH_EXPIRED_HEADER
 from app.config.settings import settings
-from app.db.session import get_db
+from app.db.session import SessionLocal, get_db
+from app.middleware import CompressionMiddleware, RequestObservabilityMiddleware
+from app.utils.metrics import metrics_registry
 
 # Configure structured logging
 logging.basicConfig(
@@ -21,29 +26,19 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def _body_preview_from_response(status_code: int, response) -> str | None:
-    """Return a short, log-safe preview of an error response body."""
-    if status_code < 400:
-        return None
-    raw_body = getattr(response, "body", None)
-    if not isinstance(raw_body, (bytes, bytearray)) or not raw_body:
-        return None
-    preview = raw_body.decode("utf-8", errors="replace").strip().replace("\n", " ")
-    if not preview:
-        return None
-    max_chars = 600
-    return preview if len(preview) <= max_chars else f"{preview[:max_chars]}..."
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle startup and shutdown logging for the application."""
     # Startup
     logger.info("Application starting up")
     logger.info(f"Debug mode: {settings.DEBUG}")
+    management_job_workers.start(SessionLocal, settings.MANAGEMENT_JOB_WORKERS)
+    recommendation_pool_refresher.start(SessionLocal, settings.RECOMMENDATION_POOL_REFRESH_INTERVAL_SECONDS)
     yield
     # Shutdown
     logger.info("Application shutting down")
+    await management_job_workers.stop()
+    await recommendation_pool_refresher.stop()
 
 
 app = FastAPI(
@@ -53,65 +48,9 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-
-@app.middleware("http")
-async def log_non_success_responses(request: Request, call_next):
-    """Log 4xx/5xx responses application-wide for easier production debugging."""
-    started_at = time.perf_counter()
-    try:
-        response = await call_next(request)
-    except Exception:
-        elapsed_ms = (time.perf_counter() - started_at) * 1000
-        logger.exception(
-            "Unhandled exception on %s %s after %.2fms",
-            request.method,
-            request.url.path,
-            elapsed_ms,
-        )
-        raise
-
-    status_code = response.status_code
-    if status_code >= 400:
-        elapsed_ms = (time.perf_counter() - started_at) * 1000
-        body_preview = _body_preview_from_response(status_code, response)
-        log_parts = [
-            f"{request.method} {request.url.path}",
-            f"status={status_code}",
-            f"elapsed_ms={elapsed_ms:.2f}",
-        ]
-        if request.client and request.client.host:
-            log_parts.append(f"client={request.client.host}")
-        if body_preview:
-            log_parts.append(f"body={body_preview}")
-        logger.warning("HTTP response debug: %s", " | ".join(log_parts))
-
-    return response
-
-
-@app.middleware("http")
-async def clear_auth_cookie_on_unauthorized(request, call_next):
-    """Clear auth cookie only when JWT/session auth has actually expired."""
-    cookie_name = settings.AUTH_COOKIE_NAME
-    had_auth_cookie = request.cookies.get(cookie_name) is not None
-    auth_header = request.headers.get("Authorization", "")
-    had_bearer_header = auth_header.lower().startswith("bearer ")
-
-    response = await call_next(request)
-    should_clear_cookie = (
-        response.status_code == status.HTTP_401_UNAUTHORIZED
-        and response.headers.get(AUTH_EXPIRED_HEADER) == "1"
-        and (had_auth_cookie or had_bearer_header)
-    )
-    if should_clear_cookie:
-        response.delete_cookie(
-            cookie_name,
-            path="/",
-            httponly=True,
-            secure=settings.AUTH_COOKIE_SECURE,
-            samesite=settings.AUTH_COOKIE_SAMESITE,
-        )
-    return response
-
+app.add_middleware(RequestObservabilityMiddleware)
+# Outside the observability middleware so its error body preview sees uncompressed bytes.
+app.add_middleware(CompressionMiddleware, minimum_size=settings.RESPONSE_COMPRESSION_MIN_BYTES)
 
 # Add CORS middleware
 app.add_middleware(
@@ -120,7 +59,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
     allow_headers=["Content-Type", "Authorization", "Accept", "Origin"],
-    expose_headers=[AUTH_EXPIRED_HEADER],
+    expose_headers=[AUTH_EXPIRED_HEADER, RECOMMENDATION_CURSOR_HEADER],
 )
 
 
@@ -142,6 +81,26 @@ async def health_check(db: Session = Depends(get_db)):
         return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
 
 
+def require_metrics_token(authorization: str | None = Header(default=None)) -> None:
+    """Allow only scrapers presenting the configured metrics bearer token."""
+    expected = settings.METRICS_BEARER_TOKEN
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_metrics_token)])
+async def metrics():
+    """Expose request and provider call metrics in the Prometheus text format."""
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
+
+
 # Include v1 routes
 app.include_router(v1_router, prefix="/api/v1")
 
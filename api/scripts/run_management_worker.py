@@ -0,0 +1,36 @@
+"""Run management transfer job workers without serving HTTP traffic."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.v1.routes.votuna.management import management_job_workers  # noqa: E402
+from app.db.session import SessionLocal  # noqa: E402
+
+
+async def _run(concurrency: int) -> None:
+    management_job_workers.start(SessionLocal, concurrency)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await management_job_workers.stop()
+
+
+def main() -> int:
+    concurrency = int(os.getenv("MANAGEMENT_JOB_WORKERS", "2"))
+    if concurrency <= 0:
+        print("MANAGEMENT_JOB_WORKERS must be positive for a dedicated worker", flush=True)
+        return 2
+    try:
+        asyncio.run(_run(concurrency))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
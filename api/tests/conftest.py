@@ -1,10 +1,11 @@
 import os
 import uuid
+from contextlib import contextmanager
 from copy import deepcopy
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.pool import StaticPool
 from sqlalchemy.orm import sessionmaker
 
@@ -14,12 +15,17 @@ os.environ.setdefault(
 )
 os.environ.setdefault("AUTH_SECRET_KEY", "test-secret-key-32-characters-long")
 os.environ.setdefault("USER_FILES_DIR", "user_files_test")
+os.environ.setdefault("MANAGEMENT_JOB_WORKERS", "0")
+os.environ.setdefault("RECOMMENDATION_POOL_REFRESH_INTERVAL_SECONDS", "0")
 
+from app.db.query_stats import QueryStats
 from app.db.session import Base, get_db
 import app.models  # noqa: F401
 from main import app
+from app.api.v1.routes.votuna import management, suggestions
 from app.auth.dependencies import get_current_user, get_optional_current_user
-from app.crud.user import user_crud
+from app.auth.jwt import verified_token_cache
+from app.crud.user import user_crud, user_row_cache
 from app.crud.votuna_playlist import votuna_playlist_crud
 from app.crud.votuna_playlist_member import votuna_playlist_member_crud
 from app.crud.votuna_playlist_settings import votuna_playlist_settings_crud
@@ -30,6 +36,10 @@ from app.services.music_providers.base import (
     ProviderTrack,
     ProviderUser,
 )
+from app.services.music_providers.track_cache import track_metadata_cache
+from app.services.recommendation_pool import declined_track_filter, related_tracks_cache
+from app.services.track_matching import track_match_cache
+from app.utils.metrics import metrics_registry
 
 
 class DummyProvider:
@@ -263,6 +273,9 @@ class DummyProvider:
             return []
         return self.search_tracks_results[:limit]
 
+    async def lookup_tracks_by_isrc(self, isrcs):
+        raise NotImplementedError
+
     async def related_tracks(self, provider_track_id: str, limit: int = 25, offset: int = 0):
         if self.fail_related_status_code is not None:
             raise ProviderAPIError(
@@ -395,6 +408,30 @@ class DummyProvider:
 TEST_DATABASE_URL = "sqlite+pysqlite://"
 
 
+@pytest.fixture(autouse=True)
+def _reset_process_caches():
+    caches = (
+        track_metadata_cache,
+        suggestions._recommendation_cache,
+        suggestions._recommendation_cursors,
+        suggestions._pool_track_count_checks,
+        suggestions._track_search_cache,
+        management._preview_plans,
+        management._source_track_indexes,
+        track_match_cache,
+        related_tracks_cache,
+        declined_track_filter,
+        metrics_registry,
+        verified_token_cache,
+        user_row_cache,
+    )
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
 def _create_test_engine():
     """Create an in-memory SQLite engine for tests."""
     return create_engine(
@@ -423,6 +460,34 @@ def db_session(test_engine):
         session.close()
 
 
+@pytest.fixture()
+def query_budget(test_engine):
+    """Return a context manager asserting a block's SQL statement budget.
+
+    ``max_queries`` caps the statements executed inside the block and
+    ``max_repeats`` caps how often one statement shape may run, which is what
+    an N+1 pattern trips first.
+    """
+
+    @contextmanager
+    def _query_budget(max_queries: int, *, max_repeats: int = 2):
+        stats = QueryStats()
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            stats.record(statement, 0.0)
+
+        event.listen(test_engine, "after_cursor_execute", _record)
+        try:
+            yield stats
+        finally:
+            event.remove(test_engine, "after_cursor_execute", _record)
+        repeated = stats.repeated_shapes(max_repeats + 1)
+        assert not repeated, f"Statements repeated more than {max_repeats} times: {repeated}"
+        assert stats.count <= max_queries, f"Ran {stats.count} statements, budget is {max_queries}"
+
+    return _query_budget
+
+
 @pytest.fixture()
 def client(db_session):
     """Provide a TestClient with the DB dependency overridden."""
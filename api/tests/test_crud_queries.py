@@ -3,6 +3,7 @@ import uuid
 
 import pytest
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
 
 from app.crud.user import user_crud
 from app.crud.votuna_playlist import votuna_playlist_crud
@@ -241,3 +242,23 @@ def test_vote_crud_duplicate_vote_raises_integrity_error(db_session, votuna_play
         )
 
     assert votuna_track_vote_crud.count_reactions(db_session, suggestion.id)["total"] == 1
+
+
+def test_user_get_cached_reuses_row_until_updated(test_engine, user, query_budget):
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+    with session_factory() as first:
+        assert user_crud.get_cached(first, user.id).email == user.email
+
+    with session_factory() as second:
+        with query_budget(0):
+            cached = user_crud.get_cached(second, user.id)
+            assert cached.display_name == user.display_name
+            assert cached.is_active is True
+        # Provider credentials are never cached; they load on first access.
+        with query_budget(1):
+            assert cached.access_token == user.access_token
+        user_crud.update(second, cached, {"display_name": "Renamed"})
+
+    with session_factory() as third:
+        with query_budget(1):
+            assert user_crud.get_cached(third, user.id).display_name == "Renamed"
@@ -1,3 +1,9 @@
+import pytest
+
+import main
+from app.config.settings import settings
+
+
 def test_root(client):
     """Ensure the root endpoint returns the welcome payload."""
     response = client.get("/")
@@ -12,3 +18,102 @@ def test_health(client):
     payload = response.json()
     assert payload["status"] == "healthy"
     assert payload["database"] == "connected"
+
+
+METRICS_TOKEN = "scrape-secret"
+
+
+@pytest.fixture
+def metrics_headers(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_BEARER_TOKEN", METRICS_TOKEN)
+    return {"Authorization": f"Bearer {METRICS_TOKEN}"}
+
+
+def test_metrics_reports_route_templates(client, metrics_headers):
+    """Ensure request latency is labelled by route template, not the raw path."""
+    assert client.get("/health").status_code == 200
+    assert client.get("/api/v1/votuna/playlists/12345/tracks/recommendations").status_code in {401, 403}
+
+    response = client.get("/metrics", headers=metrics_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "# TYPE votuna_http_request_duration_seconds histogram" in body
+    assert 'votuna_http_request_duration_seconds_count{method="GET",route="/health",status="200"} 1' in body
+    assert 'route="/api/v1/votuna/playlists/{playlist_id}/tracks/recommendations"' in body
+    assert "/playlists/12345/" not in body
+
+
+def test_metrics_rejects_missing_or_wrong_token(client, metrics_headers):
+    """Ensure scrapers without the configured bearer token are refused."""
+    missing = client.get("/metrics")
+    assert missing.status_code == 401
+    assert missing.headers["www-authenticate"] == "Bearer"
+    assert "votuna_http_request" not in missing.text
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert client.get("/metrics", headers={"Authorization": f"Basic {METRICS_TOKEN}"}).status_code == 401
+
+
+def test_metrics_is_hidden_without_a_configured_token(client, monkeypatch):
+    """Ensure the endpoint stays closed when no metrics token is configured."""
+    monkeypatch.setattr(settings, "METRICS_BEARER_TOKEN", "")
+    assert client.get("/metrics").status_code == 404
+    assert client.get("/metrics", headers={"Authorization": "Bearer "}).status_code == 404
+
+
+def test_server_timing_reports_db_queries(client):
+    """Ensure statements run by the request are counted in the Server-Timing header."""
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert 'desc="1 queries"' in response.headers["server-timing"]
+    assert response.headers["server-timing"].startswith("db;dur=")
+
+
+def test_server_timing_breaks_down_api_requests(auth_client, votuna_playlist, monkeypatch, caplog):
+    """Ensure API routes report serialization time and slow requests log the breakdown."""
+    monkeypatch.setattr(main.settings, "SLOW_REQUEST_LOG_THRESHOLD_MS", 0.001)
+    with caplog.at_level("WARNING", logger="app.middleware"):
+        response = auth_client.get(f"/api/v1/votuna/playlists/{votuna_playlist.id}/suggestions")
+
+    assert response.status_code == 200
+    entries = [entry.strip().split(";")[0] for entry in response.headers["server-timing"].split(",")]
+    assert entries[0] == "db"
+    assert "serialize" in entries
+    assert entries[-1] == "total"
+    slow_logs = [record.getMessage() for record in caplog.records if record.getMessage().startswith("Slow request")]
+    assert slow_logs
+    assert "/api/v1/votuna/playlists/{playlist_id}/suggestions" in slow_logs[0]
+    assert "db_ms=" in slow_logs[0] and "serialize_ms=" in slow_logs[0]
+
+
+def test_error_responses_are_logged_with_body_preview(client, caplog):
+    """Ensure 4xx responses are logged with a preview of the body the client received."""
+    with caplog.at_level("WARNING", logger="app.middleware"):
+        response = client.get("/api/v1/users/me")
+
+    assert response.status_code == 401
+    debug_logs = [record.getMessage() for record in caplog.records if record.getMessage().startswith("HTTP response")]
+    assert len(debug_logs) == 1
+    assert "GET /api/v1/users/me | status=401" in debug_logs[0]
+    assert f"body={response.text}" in debug_logs[0]
+
+
+def test_large_json_responses_are_gzip_compressed(client):
+    """Ensure JSON bodies over the size threshold are compressed for clients that accept gzip."""
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json()["info"]["title"]
+
+
+def test_small_or_unaccepted_responses_are_not_compressed(client, metrics_headers):
+    """Ensure small bodies, non-JSON bodies and clients refusing gzip get identity responses."""
+    assert "content-encoding" not in client.get("/health", headers={"Accept-Encoding": "gzip"}).headers
+    metrics = client.get("/metrics", headers={**metrics_headers, "Accept-Encoding": "gzip"})
+    assert len(metrics.content) >= settings.RESPONSE_COMPRESSION_MIN_BYTES
+    assert "content-encoding" not in metrics.headers
+    refused = client.get("/openapi.json", headers={"Accept-Encoding": "gzip;q=0, identity"})
+    assert "content-encoding" not in refused.headers
+    assert refused.json()["info"]["title"]
@@ -0,0 +1,61 @@
+import asyncio
+from contextlib import aclosing
+from typing import Any
+
+from app.services.music_providers.pagination import prefetch_pages
+
+
+def _next_url(payload: Any) -> str | None:
+    return payload.get("next")
+
+
+def test_prefetch_pages_requests_next_page_before_current_is_consumed():
+    events: list[str] = []
+    pages = {
+        "/page-1": {"items": [1], "next": "/page-2"},
+        "/page-2": {"items": [2], "next": "/page-3"},
+        "/page-3": {"items": [3], "next": None},
+    }
+    seen_params: list[dict[str, Any] | None] = []
+
+    async def fetch_page(url: str, params: dict[str, Any] | None) -> Any:
+        events.append(f"fetch {url}")
+        seen_params.append(params)
+        return pages[url]
+
+    async def run() -> list[int]:
+        items: list[int] = []
+        async with aclosing(prefetch_pages(fetch_page, "/page-1", {"limit": 1}, _next_url)) as iterator:
+            async for payload in iterator:
+                await asyncio.sleep(0)
+                events.append(f"map {payload['items'][0]}")
+                items.extend(payload["items"])
+        return items
+
+    assert asyncio.run(run()) == [1, 2, 3]
+    assert events.index("fetch /page-2") < events.index("map 1")
+    assert events.index("fetch /page-3") < events.index("map 2")
+    assert seen_params == [{"limit": 1}, None, None]
+
+
+def test_prefetch_pages_cancels_pending_request_when_consumer_stops():
+    cancelled: list[str] = []
+
+    async def fetch_page(url: str, params: dict[str, Any] | None) -> Any:
+        if url == "/page-2":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(url)
+                raise
+        return {"next": "/page-2"}
+
+    async def run() -> None:
+        async with aclosing(prefetch_pages(fetch_page, "/page-1", None, _next_url)) as iterator:
+            async for _payload in iterator:
+                await asyncio.sleep(0)
+                break
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert cancelled == ["/page-2"]
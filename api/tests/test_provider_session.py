@@ -3,7 +3,14 @@ import asyncio
 import httpx
 
 from app.crud.user import user_crud
+from app.services.music_providers import ProviderAPIError, ProviderAuthError
 from app.services.music_providers import session as provider_session
+from app.services.music_providers.metrics import (
+    provider_call_duration_seconds,
+    provider_call_retries_total,
+    provider_calls_total,
+)
+from app.utils.request_timing import track_request_timings
 
 
 def test_refresh_spotify_access_token_updates_user_and_preserves_refresh_token(db_session, user, monkeypatch):
@@ -194,3 +201,47 @@ def test_refresh_tidal_access_token_returns_none_on_http_failure(db_session, use
     assert updated_user is not None
     assert updated_user.access_token == "expired-access-token"
     assert updated_user.refresh_token == "existing-refresh-token"
+
+
+def test_provider_client_records_call_metrics(db_session, user, monkeypatch):
+    user = user_crud.update(
+        db_session,
+        user,
+        {"access_token": "stale-access-token", "refresh_token": "refresh-token", "token_expires_at": None},
+    )
+
+    class _FakeProvider:
+        def __init__(self, access_token: str):
+            self.access_token = access_token
+
+        async def list_tracks(self, provider_playlist_id: str):
+            if self.access_token == "stale-access-token":
+                raise ProviderAuthError("expired")
+            return []
+
+        async def related_tracks(self, provider_track_id: str, limit: int = 25, offset: int = 0):
+            raise ProviderAPIError("unavailable", status_code=503)
+
+    async def _refresh(_user, _db):
+        return "fresh-access-token"
+
+    monkeypatch.setattr(provider_session, "get_music_provider", lambda _provider, token: _FakeProvider(token))
+    monkeypatch.setattr(provider_session, "refresh_soundcloud_access_token", _refresh)
+    client = provider_session.ProviderClientWithRefresh("soundcloud", user, db=db_session)
+
+    async def _exercise():
+        await client.list_tracks("playlist-1")
+        try:
+            await client.related_tracks("track-1")
+        except ProviderAPIError:
+            pass
+
+    with track_request_timings() as timings:
+        asyncio.run(_exercise())
+
+    assert timings.counts["provider"] == 2
+    assert timings.counts["token_refresh"] == 1
+    assert provider_calls_total.value(provider="soundcloud", method="list_tracks", status="ok") == 1
+    assert provider_calls_total.value(provider="soundcloud", method="related_tracks", status="503") == 1
+    assert provider_call_retries_total.value(provider="soundcloud", method="list_tracks", reason="auth_refresh") == 1
+    assert provider_call_duration_seconds.count(provider="soundcloud", method="list_tracks") == 1
@@ -106,6 +106,7 @@ def test_get_playlist_and_resolve_playlist_url(monkeypatch):
                         "external_urls": {"spotify": "https://open.spotify.com/playlist/playlist-123"},
                         "items": {"total": 9},
                         "public": True,
+                        "snapshot_id": "MTAsZDVmZjMy",
                     },
                 )
             raise AssertionError(f"Unexpected request to {url}")
@@ -115,6 +116,7 @@ def test_get_playlist_and_resolve_playlist_url(monkeypatch):
     direct = asyncio.run(provider.get_playlist("playlist-123"))
     assert direct.provider_playlist_id == "playlist-123"
     assert direct.title == "Resolved Playlist"
+    assert direct.snapshot_id == "MTAsZDVmZjMy"
 
     resolved = asyncio.run(provider.resolve_playlist_url("https://open.spotify.com/playlist/playlist-123?si=x"))
     assert resolved.provider_playlist_id == "playlist-123"
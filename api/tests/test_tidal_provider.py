@@ -7,6 +7,7 @@ import pytest
 from app.config.settings import settings
 from app.services.music_providers.base import ProviderAPIError, ProviderAuthError
 from app.services.music_providers.tidal import TidalProvider
+from app.services.music_providers.track_cache import track_metadata_cache
 
 
 def _response(method: str, url: str, payload: dict | list, status_code: int = 200) -> httpx.Response:
@@ -331,9 +332,36 @@ def test_list_tracks_add_tracks_and_remove_tracks(monkeypatch):
     }
 
 
+def _hydrated_track_resource(track_id: str, index: int) -> tuple[dict, list[dict]]:
+    resource = {
+        "id": track_id,
+        "type": "tracks",
+        "attributes": {"title": f"Track {index}"},
+        "relationships": {
+            "artists": {"data": [{"type": "artists", "id": f"artist-{index}"}]},
+            "albums": {"data": [{"type": "albums", "id": f"album-{index}"}]},
+        },
+    }
+    included = [
+        {"id": f"artist-{index}", "type": "artists", "attributes": {"name": f"Artist {index}"}},
+        {
+            "id": f"album-{index}",
+            "type": "albums",
+            "relationships": {"coverArt": {"data": [{"type": "artworks", "id": f"art-{index}"}]}},
+        },
+        {
+            "id": f"art-{index}",
+            "type": "artworks",
+            "attributes": {"files": [{"href": f"https://resources.tidal.com/images/art-{index}/640x640.jpg"}]},
+        },
+    ]
+    return resource, included
+
+
 def test_list_tracks_enriches_metadata_when_items_payload_has_only_ids(monkeypatch):
     monkeypatch.setattr(settings, "TIDAL_COUNTRY_CODE", "")
     provider = TidalProvider("access-token")
+    captured: dict[str, list[str]] = {"bulk_filters": []}
 
     class _FakeAsyncClient:
         def __init__(self, *args, **kwargs):
@@ -353,80 +381,150 @@ def test_list_tracks_enriches_metadata_when_items_payload_has_only_ids(monkeypat
                     "https://openapi.tidal.com/v2/playlists/pl-ids/relationships/items",
                     _playlist_items_ids_only_payload(),
                 )
-            if parsed.path == "/tracks/track-1":
+            if parsed.path == "/tracks" and params:
+                captured["bulk_filters"].append(params["filter[id]"])
+                data: list[dict] = []
+                included: list[dict] = []
+                for track_id in params["filter[id]"].split(","):
+                    resource, resource_included = _hydrated_track_resource(track_id, int(track_id.split("-")[-1]))
+                    data.append(resource)
+                    included.extend(resource_included)
+                return _response("GET", "https://openapi.tidal.com/v2/tracks", {"data": data, "included": included})
+            raise AssertionError(f"Unexpected request to {url}")
+
+    monkeypatch.setattr(httpx, "AsyncClient", _FakeAsyncClient)
+
+    tracks = asyncio.run(provider.list_tracks("pl-ids"))
+    assert len(tracks) == 2
+    assert tracks[0].title == "Track 1"
+    assert tracks[0].artist == "Artist 1"
+    assert tracks[0].artwork_url == "https://resources.tidal.com/images/art-1/640x640.jpg"
+    assert tracks[1].title == "Track 2"
+    assert tracks[1].artist == "Artist 2"
+    assert tracks[1].artwork_url == "https://resources.tidal.com/images/art-2/640x640.jpg"
+    assert captured["bulk_filters"] == ["track-1,track-2"]
+
+
+def test_list_tracks_reuses_cached_track_metadata_across_users(monkeypatch):
+    monkeypatch.setattr(settings, "TIDAL_COUNTRY_CODE", "")
+    captured: dict[str, list[str]] = {"bulk_filters": []}
+
+    class _FakeAsyncClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+        async def get(self, url: str, headers: dict, params: dict | None = None):
+            parsed = urlparse(url)
+            if parsed.path == "/playlists/pl-ids/relationships/items":
                 return _response(
                     "GET",
-                    "https://openapi.tidal.com/v2/tracks/track-1",
-                    {
-                        "data": {
-                            "id": "track-1",
-                            "type": "tracks",
-                            "attributes": {"title": "Track One"},
-                            "relationships": {
-                                "artists": {"data": [{"type": "artists", "id": "artist-1"}]},
-                                "albums": {"data": [{"type": "albums", "id": "album-1"}]},
-                            },
-                        },
-                        "included": [
-                            {"id": "artist-1", "type": "artists", "attributes": {"name": "Artist One"}},
-                            {
-                                "id": "album-1",
-                                "type": "albums",
-                                "relationships": {"coverArt": {"data": [{"type": "artworks", "id": "art-1"}]}},
-                            },
-                            {
-                                "id": "art-1",
-                                "type": "artworks",
-                                "attributes": {
-                                    "files": [{"href": "https://resources.tidal.com/images/art-1/640x640.jpg"}]
-                                },
-                            },
-                        ],
-                    },
+                    "https://openapi.tidal.com/v2/playlists/pl-ids/relationships/items",
+                    _playlist_items_ids_only_payload(),
                 )
-            if parsed.path == "/tracks/track-2":
+            if parsed.path == "/tracks" and params:
+                captured["bulk_filters"].append(params["filter[id]"])
+                data: list[dict] = []
+                included: list[dict] = []
+                for track_id in params["filter[id]"].split(","):
+                    resource, resource_included = _hydrated_track_resource(track_id, int(track_id.split("-")[-1]))
+                    data.append(resource)
+                    included.extend(resource_included)
+                return _response("GET", "https://openapi.tidal.com/v2/tracks", {"data": data, "included": included})
+            raise AssertionError(f"Unexpected request to {url}")
+
+    monkeypatch.setattr(httpx, "AsyncClient", _FakeAsyncClient)
+
+    first = asyncio.run(TidalProvider("access-token-a").list_tracks("pl-ids"))
+    second = asyncio.run(TidalProvider("access-token-b").list_tracks("pl-ids"))
+
+    assert [track.title for track in second] == [track.title for track in first] == ["Track 1", "Track 2"]
+    assert captured["bulk_filters"] == ["track-1,track-2"]
+    stats = track_metadata_cache.stats()
+    assert stats.hits == 2
+    assert stats.size == 2
+
+
+def test_list_tracks_hydrates_pages_in_bulk_chunks_and_videos_individually(monkeypatch):
+    monkeypatch.setattr(settings, "TIDAL_COUNTRY_CODE", "")
+    provider = TidalProvider("access-token")
+    captured: dict[str, list[str]] = {"bulk_filters": [], "video_fetches": []}
+    first_page_ids = [f"track-{index}" for index in range(1, 26)]
+
+    class _FakeAsyncClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+        async def get(self, url: str, headers: dict, params: dict | None = None):
+            parsed = urlparse(url)
+            if parsed.path == "/playlists/pl-big/relationships/items":
+                if parsed.query == "page=2":
+                    return _response(
+                        "GET",
+                        url,
+                        {
+                            "data": [
+                                {"id": "video-1", "type": "videos", "meta": {"itemId": "video-item"}},
+                                {"id": "track-26", "type": "tracks", "meta": {"itemId": "item-26"}},
+                            ],
+                            "included": [],
+                            "links": {},
+                        },
+                    )
                 return _response(
                     "GET",
-                    "https://openapi.tidal.com/v2/tracks/track-2",
+                    url,
                     {
-                        "data": {
-                            "id": "track-2",
-                            "type": "tracks",
-                            "attributes": {"title": "Track Two"},
-                            "relationships": {
-                                "artists": {"data": [{"type": "artists", "id": "artist-2"}]},
-                                "albums": {"data": [{"type": "albums", "id": "album-2"}]},
-                            },
-                        },
-                        "included": [
-                            {"id": "artist-2", "type": "artists", "attributes": {"name": "Artist Two"}},
-                            {
-                                "id": "album-2",
-                                "type": "albums",
-                                "relationships": {"coverArt": {"data": [{"type": "artworks", "id": "art-2"}]}},
-                            },
-                            {
-                                "id": "art-2",
-                                "type": "artworks",
-                                "attributes": {
-                                    "files": [{"href": "https://resources.tidal.com/images/art-2/640x640.jpg"}]
-                                },
-                            },
+                        "data": [
+                            {"id": track_id, "type": "tracks", "meta": {"itemId": f"item-{track_id}"}}
+                            for track_id in first_page_ids
                         ],
+                        "included": [],
+                        "links": {"next": "/playlists/pl-big/relationships/items?page=2"},
                     },
                 )
+            if parsed.path == "/tracks" and params:
+                captured["bulk_filters"].append(params["filter[id]"])
+                data: list[dict] = []
+                included: list[dict] = []
+                for track_id in params["filter[id]"].split(","):
+                    resource, resource_included = _hydrated_track_resource(track_id, int(track_id.split("-")[-1]))
+                    data.append(resource)
+                    included.extend(resource_included)
+                return _response("GET", "https://openapi.tidal.com/v2/tracks", {"data": data, "included": included})
+            if parsed.path == "/videos/video-1":
+                captured["video_fetches"].append("video-1")
+                return _response(
+                    "GET",
+                    "https://openapi.tidal.com/v2/videos/video-1",
+                    {"data": {"id": "video-1", "type": "videos", "attributes": {"title": "Video One"}}},
+                )
             raise AssertionError(f"Unexpected request to {url}")
 
     monkeypatch.setattr(httpx, "AsyncClient", _FakeAsyncClient)
 
-    tracks = asyncio.run(provider.list_tracks("pl-ids"))
-    assert len(tracks) == 2
-    assert tracks[0].title == "Track One"
-    assert tracks[0].artist == "Artist One"
-    assert tracks[0].artwork_url == "https://resources.tidal.com/images/art-1/640x640.jpg"
-    assert tracks[1].title == "Track Two"
-    assert tracks[1].artist == "Artist Two"
-    assert tracks[1].artwork_url == "https://resources.tidal.com/images/art-2/640x640.jpg"
+    tracks = asyncio.run(provider.list_tracks("pl-big"))
+    assert [track.provider_track_id for track in tracks] == [*first_page_ids, "video-1", "track-26"]
+    assert tracks[0].artist == "Artist 1"
+    assert tracks[24].artist == "Artist 25"
+    assert tracks[25].title == "Video One"
+    assert tracks[25].url == "https://listen.tidal.com/video/video-1"
+    assert tracks[26].artist == "Artist 26"
+    assert sorted(captured["bulk_filters"]) == sorted(
+        [",".join(first_page_ids[:20]), ",".join(first_page_ids[20:]), "track-26"]
+    )
+    assert captured["video_fetches"] == ["video-1"]
 
 
 def test_add_tracks_omits_position_before_for_empty_playlist(monkeypatch):
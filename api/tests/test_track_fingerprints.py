@@ -0,0 +1,52 @@
+from app.services.music_providers.base import ProviderTrack
+from app.services.track_fingerprints import (
+    TrackFingerprintIndex,
+    dedupe_tracks_by_fingerprint,
+    fingerprint_track,
+    normalize_title,
+    primary_artist,
+)
+
+
+def test_normalize_title_drops_featuring_and_remaster_tags():
+    assert normalize_title("Café Del Mar (feat. Someone) - 2011 Remastered") == "cafe del mar"
+    assert normalize_title("Strobe [Remastered]") == "strobe"
+    assert normalize_title("Strobe (Club Edit)") == "strobe club edit"
+    assert normalize_title("Levels ft. Etta James") == "levels"
+
+
+def test_primary_artist_takes_first_credit():
+    assert primary_artist("Disclosure, Sam Smith") == "disclosure"
+    assert primary_artist("Björk & Friends") == "bjork"
+    assert primary_artist("Avicii feat. Aloe Blacc") == "avicii"
+    assert primary_artist(None) == ""
+
+
+def test_index_matches_isrc_and_adjacent_duration_buckets():
+    index = TrackFingerprintIndex(
+        [
+            ProviderTrack(provider_track_id="a", title="Latch", artist="Disclosure", duration_ms=255_900),
+            ProviderTrack(provider_track_id="b", title="Other", artist="Someone", isrc="gbum71301234"),
+        ]
+    )
+
+    assert index.matches(
+        ProviderTrack(provider_track_id="c", title="Latch (feat. Sam Smith)", artist="Disclosure", duration_ms=256_100)
+    )
+    assert index.matches(ProviderTrack(provider_track_id="d", title="Unrelated", isrc="GBUM71301234"))
+    assert index.matches(ProviderTrack(provider_track_id="e", title="Latch", artist="Disclosure"))
+    assert not index.matches(
+        ProviderTrack(provider_track_id="f", title="Latch", artist="Disclosure", duration_ms=420_000)
+    )
+    assert not index.matches(ProviderTrack(provider_track_id="g", title="Latch", artist=None))
+
+
+def test_dedupe_tracks_by_fingerprint_keeps_first_occurrence():
+    tracks = [
+        ProviderTrack(provider_track_id="1", title="Latch", artist="Disclosure", duration_ms=255_000),
+        ProviderTrack(provider_track_id="2", title="LATCH!", artist="disclosure, Sam Smith", duration_ms=255_500),
+        ProviderTrack(provider_track_id="3", title="White Noise", artist="Disclosure", duration_ms=277_000),
+    ]
+
+    assert [track.provider_track_id for track in dedupe_tracks_by_fingerprint(tracks)] == ["1", "3"]
+    assert fingerprint_track(tracks[0]).song_key == ("latch", "disclosure")
@@ -0,0 +1,53 @@
+import asyncio
+
+from app.services.music_providers.base import ProviderTrack
+from app.services.track_matching import match_tracks
+
+
+class _FakeTargetClient:
+    def __init__(self):
+        self.isrc_batches: list[list[str]] = []
+        self.search_queries: list[str] = []
+
+    async def lookup_tracks_by_isrc(self, isrcs):
+        self.isrc_batches.append(list(isrcs))
+        return [
+            ProviderTrack(provider_track_id="target-isrc-1", title="Latch", artist="Disclosure", isrc="GBUM71300001"),
+        ]
+
+    async def search_tracks(self, query: str, limit: int = 10):
+        self.search_queries.append(query)
+        return [
+            ProviderTrack(provider_track_id="target-wrong", title="White Noise", artist="Someone Else"),
+            ProviderTrack(provider_track_id="target-search-1", title="White Noise", artist="Disclosure"),
+        ]
+
+
+def test_match_tracks_batches_isrc_lookups_and_caches_search_results():
+    source_tracks = [
+        ProviderTrack(provider_track_id="src-1", title="Latch", artist="Disclosure", isrc="gbum71300001"),
+        ProviderTrack(provider_track_id="src-2", title="White Noise", artist="Disclosure, AlunaGeorge"),
+        ProviderTrack(provider_track_id="src-3", title="Missing Song", artist="Nobody", isrc="USXXX0000001"),
+    ]
+    target = _FakeTargetClient()
+
+    async def run():
+        return await match_tracks(
+            source_tracks,
+            source_provider="spotify",
+            target_client=target,
+            target_provider="tidal",
+        )
+
+    results = asyncio.run(run())
+    assert [result.target_track.provider_track_id if result.target_track else None for result in results] == [
+        "target-isrc-1",
+        "target-search-1",
+        None,
+    ]
+    assert target.isrc_batches == [["gbum71300001", "USXXX0000001"]]
+    assert len(target.search_queries) == 2
+
+    asyncio.run(run())
+    assert len(target.isrc_batches) == 1
+    assert len(target.search_queries) == 2
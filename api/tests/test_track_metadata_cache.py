@@ -0,0 +1,68 @@
+from app.services.music_providers import track_cache
+from app.services.music_providers.base import ProviderTrack
+from app.services.music_providers.track_cache import (
+    TrackMetadataCache,
+    remember_tracks,
+    track_metadata_cache_lookups_total,
+)
+from app.utils.metrics import metrics_registry
+
+
+def _track(track_id: str, *, artist: str | None = "Artist", artwork_url: str | None = "https://img") -> ProviderTrack:
+    return ProviderTrack(
+        provider_track_id=track_id,
+        title=f"Title {track_id}",
+        artist=artist,
+        genre=None,
+        artwork_url=artwork_url,
+        url=f"https://example.com/{track_id}",
+    )
+
+
+def test_cache_evicts_least_recently_used_entries():
+    cache = TrackMetadataCache(max_entries=2, ttl_seconds=60)
+    cache.put_many("tidal", [_track("a"), _track("b")])
+    assert cache.get("tidal", "a") is not None
+    cache.put("tidal", _track("c"))
+
+    assert cache.get("tidal", "b") is None
+    assert cache.get("tidal", "a") is not None
+    assert cache.get("tidal", "c") is not None
+    assert cache.get("spotify", "a") is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (3, 2, 2)
+
+
+def test_cache_lookups_are_exported_as_metrics():
+    cache = TrackMetadataCache(max_entries=10, ttl_seconds=60)
+    cache.put("tidal", _track("a"))
+    cache.get("tidal", "a")
+    cache.get_many("tidal", ["a", "b"])
+    cache.get("spotify", "a")
+
+    assert track_metadata_cache_lookups_total.value(provider="tidal", result="hit") == 2
+    assert track_metadata_cache_lookups_total.value(provider="tidal", result="miss") == 1
+    assert track_metadata_cache_lookups_total.value(provider="spotify", result="miss") == 1
+    assert 'votuna_track_metadata_cache_lookups_total{provider="tidal",result="hit"} 2' in metrics_registry.render()
+
+
+def test_cache_expires_entries_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(track_cache.time, "monotonic", lambda: now[0])
+    cache = TrackMetadataCache(max_entries=10, ttl_seconds=5)
+    cache.put("tidal", _track("a"))
+    now[0] = 104.0
+    assert cache.get("tidal", "a") is not None
+    now[0] = 106.0
+    assert cache.get("tidal", "a") is None
+    assert cache.stats().size == 0
+
+
+def test_remember_tracks_skips_sparse_placeholders():
+    remember_tracks("tidal", [_track("full"), _track("no-artist", artist=None), _track("no-art", artwork_url=None)])
+    remember_tracks("tidal", _track("single"))
+
+    assert track_cache.track_metadata_cache.get("tidal", "full") is not None
+    assert track_cache.track_metadata_cache.get("tidal", "single") is not None
+    assert track_cache.track_metadata_cache.get("tidal", "no-artist") is None
+    assert track_cache.track_metadata_cache.get("tidal", "no-art") is None
@@ -1,6 +1,8 @@
 import io
 
+import app.auth.jwt as auth_jwt
 from app.auth.dependencies import AUTH_EXPIRED_HEADER
+from app.auth.jwt import create_access_token
 from app.config.settings import settings
 from app.crud.user import user_crud
 
@@ -21,6 +23,28 @@ def test_get_me_invalid_cookie_clears_auth_cookie(client):
     assert settings.AUTH_COOKIE_NAME in set_cookie_header
 
 
+def test_get_me_verifies_each_token_once(client, user, monkeypatch):
+    decode_calls = []
+    original_decode = auth_jwt.decode_access_token
+
+    def _counting_decode(token):
+        decode_calls.append(token)
+        return original_decode(token)
+
+    monkeypatch.setattr(auth_jwt, "decode_access_token", _counting_decode)
+    client.cookies.set(settings.AUTH_COOKIE_NAME, create_access_token(str(user.id)))
+    for _ in range(3):
+        response = client.get("/api/v1/users/me")
+        assert response.status_code == 200
+        assert response.json()["id"] == user.id
+    assert len(decode_calls) == 1
+
+    expired_token = create_access_token(str(user.id), expires_minutes=-1)
+    client.cookies.set(settings.AUTH_COOKIE_NAME, expired_token)
+    assert client.get("/api/v1/users/me").status_code == 401
+    assert auth_jwt.verified_token_cache.get(expired_token) is None
+
+
 def test_get_me_authorized(auth_client, user):
     response = auth_client.get("/api/v1/users/me")
     assert response.status_code == 200
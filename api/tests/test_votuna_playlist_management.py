@@ -1,11 +1,27 @@
+import asyncio
 import uuid
+from datetime import datetime, timedelta, timezone
 
+import pytest
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import sessionmaker
+
+from app.api.v1.routes.votuna.management import management_job_workers, run_management_job
+from app.crud.votuna_management_job import votuna_management_job_crud
 from app.crud.votuna_playlist import votuna_playlist_crud
 from app.crud.votuna_playlist_member import votuna_playlist_member_crud
 from app.crud.votuna_playlist_settings import votuna_playlist_settings_crud
 from app.crud.votuna_track_addition import votuna_track_addition_crud
-from app.services.music_providers import ProviderAPIError
-from app.services.music_providers.base import ProviderTrack
+from app.services import management_jobs
+from app.services.management_jobs import ManagementJobLeaseLost
+from app.services.music_providers import ProviderAPIError, ProviderAuthError
+from app.services.music_providers.base import ProviderPlaylist, ProviderTrack
+from app.utils import json_response
+
+
+def _run_next_management_job(db_session) -> bool:
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=db_session.get_bind())
+    return asyncio.run(management_job_workers.run_next(session_factory))
 
 
 def _create_owned_votuna_playlist(db_session, owner_user, provider_playlist_id: str | None = None):
@@ -71,6 +87,43 @@ def test_preview_import_owner_success(auth_client, votuna_playlist, provider_stu
     assert data["destination"]["provider_playlist_id"] == votuna_playlist.provider_playlist_id
 
 
+def test_preview_fingerprint_duplicate_match(auth_client, votuna_playlist, provider_stub):
+    provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id] = [
+        ProviderTrack(provider_track_id="track-1", title="Latch", artist="Disclosure", duration_ms=255_000),
+    ]
+    provider_stub.tracks_by_playlist_id["source-1"] = [
+        ProviderTrack(provider_track_id="reupload-1", title="Latch (Remastered)", artist="Disclosure, Sam Smith"),
+        ProviderTrack(provider_track_id="track-2", title="White Noise", artist="Disclosure", isrc="GBUM71300001"),
+        ProviderTrack(provider_track_id="track-3", title="White Noise", artist="Disclosure", isrc="GBUM71300001"),
+    ]
+    payload = {
+        "direction": "import_to_current",
+        "counterparty": {
+            "kind": "provider",
+            "provider": "soundcloud",
+            "provider_playlist_id": "source-1",
+        },
+    }
+
+    by_id_response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/preview",
+        json=payload,
+    )
+    assert by_id_response.status_code == 200
+    assert by_id_response.json()["to_add_count"] == 3
+
+    by_fingerprint_response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/preview",
+        json={**payload, "duplicate_match": "fingerprint"},
+    )
+    assert by_fingerprint_response.status_code == 200
+    data = by_fingerprint_response.json()
+    assert data["matched_count"] == 2
+    assert data["duplicate_count"] == 1
+    assert data["to_add_count"] == 1
+    assert [track["provider_track_id"] for track in data["duplicate_sample"]] == ["reupload-1"]
+
+
 def test_execute_export_to_existing_success(auth_client, votuna_playlist, provider_stub):
     provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id] = [
         ProviderTrack(provider_track_id="track-1", title="Current One", artist="A", genre="House"),
@@ -349,6 +402,98 @@ def test_cross_provider_blocked(auth_client, votuna_playlist):
     assert "Cross-provider" in response.json()["detail"]
 
 
+def test_cross_provider_import_from_member_playlist_matches_tracks(
+    auth_client, db_session, user, other_user, votuna_playlist, provider_stub, monkeypatch
+):
+    source_playlist = votuna_playlist_crud.create(
+        db_session,
+        {
+            "owner_user_id": other_user.id,
+            "provider": "spotify",
+            "provider_playlist_id": "sp-source",
+            "title": "Spotify Source",
+            "description": None,
+            "image_url": None,
+            "is_active": True,
+        },
+    )
+    for member, role in ((other_user, "owner"), (user, "member")):
+        votuna_playlist_member_crud.create(
+            db_session,
+            {"playlist_id": source_playlist.id, "user_id": member.id, "role": role},
+        )
+    provider_stub.tracks_by_playlist_id["sp-source"] = [
+        ProviderTrack(provider_track_id="sp-1", title="Search Result One", artist="Artist One", isrc="USAAA0000001"),
+        ProviderTrack(provider_track_id="sp-2", title="Unreleased Demo", artist="Nobody"),
+    ]
+    search_queries: list[str] = []
+    original_search_tracks = provider_stub.search_tracks
+
+    async def _counting_search_tracks(self, query: str, limit: int = 10):
+        search_queries.append(query)
+        return await original_search_tracks(self, query, limit)
+
+    monkeypatch.setattr(provider_stub, "search_tracks", _counting_search_tracks)
+    payload = {
+        "direction": "import_to_current",
+        "counterparty": {"kind": "votuna", "votuna_playlist_id": source_playlist.id},
+    }
+
+    preview_response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/preview",
+        json=payload,
+    )
+    assert preview_response.status_code == 200
+    preview = preview_response.json()
+    assert preview["source"]["provider"] == "spotify"
+    assert preview["matched_count"] == 2
+    assert preview["to_add_count"] == 1
+    assert preview["unmatched_count"] == 1
+    assert [track["provider_track_id"] for track in preview["matched_sample"]] == ["track-search-1"]
+    assert [track["provider_track_id"] for track in preview["unmatched_sample"]] == ["sp-2"]
+    assert len(search_queries) == 2
+
+    execute_response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/execute",
+        json=payload,
+    )
+    assert execute_response.status_code == 200
+    data = execute_response.json()
+    assert data["added_count"] == 1
+    assert data["failed_count"] == 0
+    assert data["unmatched_count"] == 1
+    assert data["unmatched_track_ids"] == ["sp-2"]
+    assert provider_stub.add_tracks_calls[-1]["track_ids"] == ["track-search-1"]
+    # Match results are cached, so re-planning the transfer searches nothing again.
+    assert len(search_queries) == 2
+
+
+def test_cross_provider_import_requires_source_membership(
+    auth_client, db_session, other_user, votuna_playlist, provider_stub
+):
+    source_playlist = votuna_playlist_crud.create(
+        db_session,
+        {
+            "owner_user_id": other_user.id,
+            "provider": "spotify",
+            "provider_playlist_id": "sp-private",
+            "title": "Spotify Private",
+            "description": None,
+            "image_url": None,
+            "is_active": True,
+        },
+    )
+
+    response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/preview",
+        json={
+            "direction": "import_to_current",
+            "counterparty": {"kind": "votuna", "votuna_playlist_id": source_playlist.id},
+        },
+    )
+    assert response.status_code == 403
+
+
 def test_genre_filter_case_insensitive_exact(auth_client, votuna_playlist, provider_stub):
     provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id] = []
     provider_stub.tracks_by_playlist_id["source-1"] = [
@@ -427,7 +572,7 @@ def test_song_filter_selected_ids_only(auth_client, votuna_playlist, provider_st
     assert data["to_add_count"] == 1
 
 
-def test_preview_rejects_over_limit(auth_client, votuna_playlist, provider_stub):
+def test_preview_flags_over_limit_and_execute_rejects_it(auth_client, votuna_playlist, provider_stub):
     provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id] = []
     provider_stub.tracks_by_playlist_id["source-1"] = [
         ProviderTrack(
@@ -439,21 +584,28 @@ def test_preview_rejects_over_limit(auth_client, votuna_playlist, provider_stub)
         for index in range(501)
     ]
 
-    response = auth_client.post(
-        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/preview",
-        json={
-            "direction": "import_to_current",
-            "counterparty": {
-                "kind": "provider",
-                "provider": "soundcloud",
-                "provider_playlist_id": "source-1",
-            },
-            "selection_mode": "all",
-            "selection_values": [],
+    payload = {
+        "direction": "import_to_current",
+        "counterparty": {
+            "kind": "provider",
+            "provider": "soundcloud",
+            "provider_playlist_id": "source-1",
         },
+        "selection_mode": "all",
+        "selection_values": [],
+    }
+    response = auth_client.post(f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/preview", json=payload)
+    assert response.status_code == 200
+    assert response.json()["to_add_count"] == 501
+    assert response.json()["exceeds_max_tracks_per_action"] is True
+
+    response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/execute",
+        json={**payload, "preview_token": response.json()["preview_token"]},
     )
     assert response.status_code == 400
     assert "500" in response.json()["detail"]
+    assert provider_stub.add_tracks_calls == []
 
 
 def test_execute_export_with_destination_create(auth_client, votuna_playlist, provider_stub):
@@ -514,6 +666,535 @@ def test_execute_best_effort_chunk_fallback(auth_client, votuna_playlist, provid
     assert data["failed_items"][0]["provider_track_id"] == "fail-track"
 
 
+def test_management_job_runs_in_background_without_track_cap(
+    auth_client,
+    db_session,
+    votuna_playlist,
+    provider_stub,
+):
+    provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id] = []
+    provider_stub.tracks_by_playlist_id["bulk-source"] = [
+        ProviderTrack(provider_track_id=f"track-{index}", title=f"Track {index}", artist="Bulk", genre="House")
+        for index in range(650)
+    ]
+
+    response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs",
+        json={
+            "direction": "import_to_current",
+            "counterparty": {
+                "kind": "provider",
+                "provider": "soundcloud",
+                "provider_playlist_id": "bulk-source",
+            },
+            "selection_mode": "all",
+            "selection_values": [],
+        },
+    )
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "queued"
+    assert provider_stub.add_tracks_calls == []
+
+    assert _run_next_management_job(db_session) is True
+    assert _run_next_management_job(db_session) is False
+
+    response = auth_client.get(f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs/{job['id']}")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "completed"
+    assert data["total_count"] == 650
+    assert data["processed_count"] == 650
+    assert data["added_count"] == 650
+    assert data["result"]["added_count"] == 650
+    assert data["finished_at"] is not None
+    assert len(provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id]) == 650
+
+
+def _submit_bulk_import_job(auth_client, votuna_playlist, provider_stub, track_count: int = 3) -> int:
+    provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id] = []
+    provider_stub.tracks_by_playlist_id["lease-source"] = [
+        ProviderTrack(provider_track_id=f"track-{index}", title=f"Track {index}", artist="Bulk", genre="House")
+        for index in range(track_count)
+    ]
+    response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs",
+        json={
+            "direction": "import_to_current",
+            "counterparty": {"kind": "provider", "provider": "soundcloud", "provider_playlist_id": "lease-source"},
+        },
+    )
+    assert response.status_code == 202
+    return response.json()["id"]
+
+
+def test_management_job_reclaimed_worker_stops_writing(auth_client, db_session, votuna_playlist, provider_stub):
+    job_id = _submit_bulk_import_job(auth_client, votuna_playlist, provider_stub)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=db_session.get_bind())
+    first_db, second_db = session_factory(), session_factory()
+    try:
+        first_claim = votuna_management_job_crud.claim_next(
+            first_db, stale_before=datetime.now(timezone.utc) - timedelta(minutes=10)
+        )
+        assert first_claim is not None and first_claim.id == job_id
+        first_lease_token = first_claim.lease_token
+        # The first worker stalls past the stale window and a second worker takes the job over.
+        votuna_management_job_crud.update(
+            second_db,
+            votuna_management_job_crud.get(second_db, job_id),
+            {"heartbeat_at": datetime.now(timezone.utc) - timedelta(hours=1)},
+        )
+        second_claim = votuna_management_job_crud.claim_next(
+            second_db, stale_before=datetime.now(timezone.utc) - timedelta(minutes=10)
+        )
+        assert second_claim is not None and second_claim.id == job_id
+        assert second_claim.lease_token != first_lease_token
+
+        with pytest.raises(ManagementJobLeaseLost):
+            asyncio.run(run_management_job(first_db, first_claim))
+        assert votuna_management_job_crud.heartbeat(first_db, job_id, lease_token=first_lease_token) is False
+        assert provider_stub.add_tracks_calls == []
+
+        asyncio.run(run_management_job(second_db, second_claim))
+    finally:
+        first_db.close()
+        second_db.close()
+
+    data = auth_client.get(f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs/{job_id}").json()
+    assert data["status"] == "completed"
+    assert data["added_count"] == 3
+    assert len(provider_stub.add_tracks_calls) == 1
+
+
+def test_management_job_heartbeat_keeps_slow_job_claimed(
+    auth_client, db_session, votuna_playlist, provider_stub, monkeypatch
+):
+    job_id = _submit_bulk_import_job(auth_client, votuna_playlist, provider_stub)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=db_session.get_bind())
+    monkeypatch.setattr(management_jobs, "JOB_HEARTBEAT_INTERVAL_SECONDS", 0.01)
+    original_list_tracks = provider_stub.list_tracks
+    reclaimed = []
+
+    async def _slow_list_tracks(self, provider_playlist_id: str):
+        if provider_playlist_id == "lease-source":
+            listing_started_at = datetime.now(timezone.utc)
+            await asyncio.sleep(0.1)
+            # A second worker polling now only reclaims jobs that missed a heartbeat since listing began.
+            other_db = session_factory()
+            try:
+                reclaimed.append(votuna_management_job_crud.claim_next(other_db, stale_before=listing_started_at))
+            finally:
+                other_db.close()
+        return await original_list_tracks(self, provider_playlist_id)
+
+    monkeypatch.setattr(provider_stub, "list_tracks", _slow_list_tracks)
+    assert _run_next_management_job(db_session) is True
+
+    assert reclaimed == [None]
+    data = auth_client.get(f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs/{job_id}").json()
+    assert data["status"] == "completed"
+    assert len(provider_stub.add_tracks_calls) == 1
+
+
+def test_management_job_runs_previewed_transfer_over_the_cap(auth_client, db_session, votuna_playlist, provider_stub):
+    provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id] = []
+    provider_stub.tracks_by_playlist_id["bulk-preview-source"] = [
+        ProviderTrack(provider_track_id=f"track-{index}", title=f"Track {index}", artist="Bulk", genre="House")
+        for index in range(650)
+    ]
+    payload = {
+        "direction": "import_to_current",
+        "counterparty": {"kind": "provider", "provider": "soundcloud", "provider_playlist_id": "bulk-preview-source"},
+    }
+
+    preview = auth_client.post(f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/preview", json=payload)
+    assert preview.json()["exceeds_max_tracks_per_action"] is True
+    response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs",
+        json={**payload, "preview_token": preview.json()["preview_token"]},
+    )
+    assert response.status_code == 202
+    assert _run_next_management_job(db_session) is True
+    job = auth_client.get(f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs/{response.json()['id']}")
+    assert job.json()["added_count"] == 650
+
+
+def test_management_job_records_provider_failure(
+    auth_client,
+    db_session,
+    votuna_playlist,
+    provider_stub,
+    monkeypatch,
+):
+    async def _raise_provider_error(self, provider_playlist_id: str):
+        raise ProviderAPIError("Provider unavailable", status_code=503)
+
+    monkeypatch.setattr(provider_stub, "list_tracks", _raise_provider_error)
+    response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs",
+        json={
+            "direction": "import_to_current",
+            "counterparty": {
+                "kind": "provider",
+                "provider": "soundcloud",
+                "provider_playlist_id": "missing-source",
+            },
+            "selection_mode": "all",
+            "selection_values": [],
+        },
+    )
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+
+    assert _run_next_management_job(db_session) is True
+    response = auth_client.get(f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs/{job_id}")
+    data = response.json()
+    assert data["status"] == "failed"
+    assert data["error"] == "Provider unavailable"
+    assert data["result"] is None
+
+
+def test_management_job_retry_resumes_from_last_checkpoint(
+    auth_client,
+    db_session,
+    votuna_playlist,
+    provider_stub,
+    monkeypatch,
+):
+    provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id] = []
+    provider_stub.tracks_by_playlist_id["resume-source"] = [
+        ProviderTrack(provider_track_id=f"track-{index}", title=f"Track {index}", artist="Bulk", genre="House")
+        for index in range(250)
+    ]
+    original_add_tracks = provider_stub.add_tracks
+    original_list_tracks = provider_stub.list_tracks
+    state = {"add_calls": 0, "list_calls": 0}
+
+    async def _flaky_add_tracks(self, provider_playlist_id: str, track_ids):
+        state["add_calls"] += 1
+        if state["add_calls"] == 2:
+            raise ProviderAuthError("token expired")
+        return await original_add_tracks(self, provider_playlist_id, track_ids)
+
+    async def _counting_list_tracks(self, provider_playlist_id: str):
+        state["list_calls"] += 1
+        return await original_list_tracks(self, provider_playlist_id)
+
+    monkeypatch.setattr(provider_stub, "add_tracks", _flaky_add_tracks)
+    monkeypatch.setattr(provider_stub, "list_tracks", _counting_list_tracks)
+
+    response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs",
+        json={
+            "direction": "import_to_current",
+            "counterparty": {
+                "kind": "provider",
+                "provider": "soundcloud",
+                "provider_playlist_id": "resume-source",
+            },
+            "selection_mode": "all",
+            "selection_values": [],
+        },
+    )
+    job_id = response.json()["id"]
+    job_url = f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs/{job_id}"
+
+    assert _run_next_management_job(db_session) is True
+    data = auth_client.get(job_url).json()
+    assert data["status"] == "failed"
+    assert data["added_count"] == 100
+    assert data["processed_count"] == 100
+    assert data["total_count"] == 250
+    assert state["list_calls"] == 2
+
+    response = auth_client.post(f"{job_url}/retry")
+    assert response.status_code == 202
+    assert response.json()["status"] == "queued"
+    assert _run_next_management_job(db_session) is True
+
+    data = auth_client.get(job_url).json()
+    assert data["status"] == "completed"
+    assert data["result"]["added_count"] == 250
+    assert state["list_calls"] == 2
+    resumed_call_track_ids = [call["track_ids"] for call in provider_stub.add_tracks_calls]
+    assert resumed_call_track_ids[1][0] == "track-100"
+    assert len(provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id]) == 250
+    additions = votuna_track_addition_crud.list_latest_for_tracks(
+        db_session,
+        votuna_playlist.id,
+        [f"track-{index}" for index in range(250)],
+    )
+    assert len(additions) == 250
+
+    response = auth_client.post(f"{job_url}/retry")
+    assert response.status_code == 409
+
+
+def test_management_job_retry_reattempts_failed_tracks_of_completed_job(
+    auth_client,
+    db_session,
+    votuna_playlist,
+    provider_stub,
+):
+    provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id] = []
+    provider_stub.tracks_by_playlist_id["partial-source"] = [
+        ProviderTrack(provider_track_id=f"track-{index}", title=f"Track {index}", artist="Bulk", genre="House")
+        for index in range(5)
+    ]
+    provider_stub.fail_add_chunk_for_track_ids = {"track-3"}
+    provider_stub.fail_add_single_for_track_ids = {"track-3"}
+
+    response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs",
+        json={
+            "direction": "import_to_current",
+            "counterparty": {
+                "kind": "provider",
+                "provider": "soundcloud",
+                "provider_playlist_id": "partial-source",
+            },
+            "selection_mode": "all",
+            "selection_values": [],
+        },
+    )
+    job_url = f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs/{response.json()['id']}"
+    assert _run_next_management_job(db_session) is True
+    data = auth_client.get(job_url).json()
+    assert data["status"] == "completed"
+    assert data["added_count"] == 4
+    assert data["failed_count"] == 1
+
+    # The provider recovers; the retry only re-sends the failed track.
+    provider_stub.fail_add_chunk_for_track_ids = set()
+    provider_stub.fail_add_single_for_track_ids = set()
+    provider_stub.add_tracks_calls = []
+    response = auth_client.post(f"{job_url}/retry")
+    assert response.status_code == 202
+    assert _run_next_management_job(db_session) is True
+
+    data = auth_client.get(job_url).json()
+    assert data["status"] == "completed"
+    assert data["added_count"] == 5
+    assert data["failed_count"] == 0
+    assert data["result"]["failed_items"] == []
+    assert [call["track_ids"] for call in provider_stub.add_tracks_calls] == [["track-3"]]
+    destination_ids = [
+        track.provider_track_id for track in provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id]
+    ]
+    assert destination_ids == ["track-0", "track-1", "track-2", "track-4", "track-3"]
+
+    response = auth_client.post(f"{job_url}/retry")
+    assert response.status_code == 409
+
+
+def test_management_job_keeps_unmatched_tracks_out_of_progress_and_retry(
+    auth_client, db_session, user, other_user, votuna_playlist, provider_stub, monkeypatch
+):
+    source_playlist = votuna_playlist_crud.create(
+        db_session,
+        {
+            "owner_user_id": other_user.id,
+            "provider": "spotify",
+            "provider_playlist_id": "sp-unmatched-source",
+            "title": "Spotify Source",
+            "is_active": True,
+        },
+    )
+    for member, role in ((other_user, "owner"), (user, "member")):
+        votuna_playlist_member_crud.create(
+            db_session,
+            {"playlist_id": source_playlist.id, "user_id": member.id, "role": role},
+        )
+    provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id] = []
+    provider_stub.tracks_by_playlist_id["sp-unmatched-source"] = [
+        ProviderTrack(provider_track_id="sp-1", title="Search Result One", artist="Artist One", isrc="USAAA0000001"),
+        ProviderTrack(provider_track_id="sp-2", title="Unreleased Demo", artist="Nobody"),
+        ProviderTrack(provider_track_id="sp-3", title="Another Demo", artist="Nobody Else"),
+    ]
+    progress: list[tuple[int, int]] = []
+    original_update_leased = votuna_management_job_crud.update_leased
+
+    def _recording_update_leased(db, job, values, **kwargs):
+        written = original_update_leased(db, job, values, **kwargs)
+        progress.append((job.processed_count, job.total_count))
+        return written
+
+    monkeypatch.setattr(votuna_management_job_crud, "update_leased", _recording_update_leased)
+    response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs",
+        json={
+            "direction": "import_to_current",
+            "counterparty": {"kind": "votuna", "votuna_playlist_id": source_playlist.id},
+        },
+    )
+    job_url = f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs/{response.json()['id']}"
+    assert _run_next_management_job(db_session) is True
+
+    data = auth_client.get(job_url).json()
+    assert data["status"] == "completed"
+    assert (data["processed_count"], data["total_count"]) == (1, 1)
+    assert data["added_count"] == 1
+    assert data["failed_count"] == 0
+    assert data["unmatched_count"] == 2
+    assert data["result"]["unmatched_track_ids"] == ["sp-2", "sp-3"]
+    assert progress and all(processed <= total for processed, total in progress)
+    assert auth_client.post(f"{job_url}/retry").status_code == 409
+
+
+def test_management_job_rejects_invalid_payload_and_unknown_job(auth_client, votuna_playlist, provider_stub):
+    response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs",
+        json={"direction": "import_to_current", "selection_mode": "all", "selection_values": []},
+    )
+    assert response.status_code == 400
+
+    response = auth_client.get(f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs/999")
+    assert response.status_code == 404
+
+
+def test_management_job_non_owner_forbidden(other_auth_client, votuna_playlist):
+    response = other_auth_client.get(f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs/1")
+    assert response.status_code == 403
+
+
+def test_execute_chunk_fallback_bisects_to_isolate_bad_tracks(auth_client, votuna_playlist, provider_stub):
+    provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id] = [
+        ProviderTrack(provider_track_id=f"track-{index}", title=f"Track {index}", artist="A", genre="House")
+        for index in range(100)
+    ]
+    provider_stub.tracks_by_playlist_id["export-dest-1"] = []
+    provider_stub.fail_add_chunk_for_track_ids = {"track-17", "track-80"}
+    provider_stub.fail_add_single_for_track_ids = {"track-17", "track-80"}
+
+    response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/execute",
+        json={
+            "direction": "export_from_current",
+            "counterparty": {
+                "kind": "provider",
+                "provider": "soundcloud",
+                "provider_playlist_id": "export-dest-1",
+            },
+            "selection_mode": "all",
+            "selection_values": [],
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["added_count"] == 98
+    assert [item["provider_track_id"] for item in data["failed_items"]] == ["track-17", "track-80"]
+    assert len(provider_stub.add_tracks_calls) <= 30
+    added_ids = {track.provider_track_id for track in provider_stub.tracks_by_playlist_id["export-dest-1"]}
+    assert len(added_ids) == 98
+
+
+@pytest.mark.parametrize(
+    ("error", "expected_status"),
+    [
+        (ProviderAPIError("rate limited", status_code=429), 429),
+        (ProviderAuthError("token expired"), 401),
+    ],
+)
+def test_execute_chunk_fallback_stops_bisecting_on_auth_and_rate_limit_errors(
+    auth_client, votuna_playlist, provider_stub, monkeypatch, error, expected_status
+):
+    provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id] = [
+        ProviderTrack(provider_track_id=f"track-{index}", title=f"Track {index}", artist="A", genre="House")
+        for index in range(100)
+    ]
+    provider_stub.tracks_by_playlist_id["export-dest-1"] = []
+
+    async def add_tracks_then_fail(self, provider_playlist_id: str, track_ids):
+        self.add_tracks_calls.append({"provider_playlist_id": provider_playlist_id, "track_ids": list(track_ids)})
+        if len(self.add_tracks_calls) == 1:
+            raise ProviderAPIError("chunk add failed")
+        raise error
+
+    monkeypatch.setattr(provider_stub, "add_tracks", add_tracks_then_fail)
+
+    response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/execute",
+        json={
+            "direction": "export_from_current",
+            "counterparty": {
+                "kind": "provider",
+                "provider": "soundcloud",
+                "provider_playlist_id": "export-dest-1",
+            },
+            "selection_mode": "all",
+            "selection_values": [],
+        },
+    )
+    assert response.status_code == expected_status
+    assert len(provider_stub.add_tracks_calls) == 2
+
+
+def test_management_job_fails_on_rate_limited_chunk_without_bisecting(
+    auth_client, db_session, votuna_playlist, provider_stub, monkeypatch
+):
+    job_id = _submit_bulk_import_job(auth_client, votuna_playlist, provider_stub, track_count=10)
+
+    async def rate_limited_add_tracks(self, provider_playlist_id: str, track_ids):
+        self.add_tracks_calls.append({"provider_playlist_id": provider_playlist_id, "track_ids": list(track_ids)})
+        raise ProviderAPIError("rate limited", status_code=429)
+
+    monkeypatch.setattr(provider_stub, "add_tracks", rate_limited_add_tracks)
+
+    assert _run_next_management_job(db_session) is True
+
+    data = auth_client.get(f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/jobs/{job_id}").json()
+    assert data["status"] == "failed"
+    assert "rate limited" in data["error"]
+    assert data["failed_count"] == 0
+    assert len(provider_stub.add_tracks_calls) == 1
+
+
+def test_execute_chunk_fallback_keeps_tracks_on_read_modify_write_providers(
+    auth_client, votuna_playlist, provider_stub, monkeypatch
+):
+    """Ensure split batches never race when the provider rewrites the whole playlist on every add."""
+    provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id] = [
+        ProviderTrack(provider_track_id=f"track-{index}", title=f"Track {index}", artist="A", genre="House")
+        for index in range(100)
+    ]
+    provider_stub.tracks_by_playlist_id["export-dest-1"] = []
+
+    async def add_tracks_by_rewriting_playlist(self, provider_playlist_id: str, track_ids):
+        normalized_ids = [str(track_id) for track_id in track_ids]
+        self.add_tracks_calls.append({"provider_playlist_id": provider_playlist_id, "track_ids": normalized_ids})
+        if len(normalized_ids) > 1 and "track-42" in normalized_ids:
+            raise ProviderAPIError("chunk add failed")
+        if normalized_ids == ["track-42"]:
+            raise ProviderAPIError("single add failed")
+        current_tracks = list(self.tracks_by_playlist_id.get(provider_playlist_id, []))
+        await asyncio.sleep(0)
+        self.tracks_by_playlist_id[provider_playlist_id] = current_tracks + [
+            ProviderTrack(provider_track_id=track_id, title=f"Track {track_id}") for track_id in normalized_ids
+        ]
+
+    monkeypatch.setattr(provider_stub, "add_tracks", add_tracks_by_rewriting_playlist)
+
+    response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/execute",
+        json={
+            "direction": "export_from_current",
+            "counterparty": {
+                "kind": "provider",
+                "provider": "soundcloud",
+                "provider_playlist_id": "export-dest-1",
+            },
+            "selection_mode": "all",
+            "selection_values": [],
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["added_count"] == 99
+    assert [item["provider_track_id"] for item in data["failed_items"]] == ["track-42"]
+    destination_ids = [track.provider_track_id for track in provider_stub.tracks_by_playlist_id["export-dest-1"]]
+    assert destination_ids == [f"track-{index}" for index in range(100) if index != 42]
+
+
 def test_source_tracks_search_and_pagination(auth_client, votuna_playlist, provider_stub):
     provider_stub.tracks_by_playlist_id["source-1"] = [
         ProviderTrack(provider_track_id="t-1", title="Alpha", artist="DJ A", genre="House"),
@@ -559,6 +1240,118 @@ def test_source_tracks_search_and_pagination(auth_client, votuna_playlist, provi
     assert len(page_data["tracks"]) == 1
 
 
+def test_source_tracks_and_facets_reuse_index_until_source_changes(
+    auth_client, votuna_playlist, provider_stub, monkeypatch
+):
+    provider_stub.tracks_by_playlist_id["source-1"] = [
+        ProviderTrack(provider_track_id="t-1", title="Alpha", artist="DJ A", genre="House"),
+        ProviderTrack(provider_track_id="t-2", title="Beta", artist="DJ B", genre="Techno"),
+    ]
+    list_calls: list[str] = []
+    original_list_tracks = provider_stub.list_tracks
+
+    async def _counting_list_tracks(self, provider_playlist_id: str):
+        list_calls.append(provider_playlist_id)
+        return await original_list_tracks(self, provider_playlist_id)
+
+    monkeypatch.setattr(provider_stub, "list_tracks", _counting_list_tracks)
+    source = {"kind": "provider", "provider": "soundcloud", "provider_playlist_id": "source-1"}
+
+    for search in ("t", "te", "tech", None):
+        response = auth_client.post(
+            f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/source-tracks",
+            json={"source": source, "search": search},
+        )
+        assert response.status_code == 200
+    assert response.json()["total_count"] == 2
+    facets_response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/facets",
+        json={"source": source},
+    )
+    assert facets_response.status_code == 200
+    assert list_calls == ["source-1"]
+
+    provider_stub.tracks_by_playlist_id["source-1"] = [
+        *provider_stub.tracks_by_playlist_id["source-1"],
+        ProviderTrack(provider_track_id="t-3", title="Gamma", artist="DJ C", genre="Techno"),
+    ]
+    search_response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/source-tracks",
+        json={"source": source, "search": "techno"},
+    )
+    assert search_response.status_code == 200
+    assert search_response.json()["total_count"] == 2
+    assert list_calls == ["source-1", "source-1"]
+
+
+def test_source_tracks_relist_when_snapshot_changes_at_same_track_count(
+    auth_client, votuna_playlist, provider_stub, monkeypatch
+):
+    provider_stub.tracks_by_playlist_id["source-1"] = [
+        ProviderTrack(provider_track_id="t-1", title="Alpha", artist="DJ A", genre="House"),
+    ]
+    snapshot = {"id": "snap-1"}
+    list_calls: list[str] = []
+    original_list_tracks = provider_stub.list_tracks
+
+    async def _snapshot_get_playlist(self, provider_playlist_id: str):
+        return ProviderPlaylist(
+            provider=self.provider,
+            provider_playlist_id=provider_playlist_id,
+            title="Source Playlist",
+            track_count=len(self.tracks_by_playlist_id.get(provider_playlist_id, self.tracks)),
+            snapshot_id=snapshot["id"],
+        )
+
+    async def _counting_list_tracks(self, provider_playlist_id: str):
+        list_calls.append(provider_playlist_id)
+        return await original_list_tracks(self, provider_playlist_id)
+
+    monkeypatch.setattr(provider_stub, "get_playlist", _snapshot_get_playlist)
+    monkeypatch.setattr(provider_stub, "list_tracks", _counting_list_tracks)
+    source = {"kind": "provider", "provider": "soundcloud", "provider_playlist_id": "source-1"}
+    url = f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/source-tracks"
+
+    first = auth_client.post(url, json={"source": source})
+    assert first.status_code == 200
+    assert [track["provider_track_id"] for track in first.json()["tracks"]] == ["t-1"]
+
+    provider_stub.tracks_by_playlist_id["source-1"] = [
+        ProviderTrack(provider_track_id="t-9", title="Omega", artist="DJ Z", genre="Techno"),
+    ]
+    cached = auth_client.post(url, json={"source": source})
+    assert [track["provider_track_id"] for track in cached.json()["tracks"]] == ["t-1"]
+    assert list_calls == ["source-1"]
+
+    snapshot["id"] = "snap-2"
+    swapped = auth_client.post(url, json={"source": source})
+    assert swapped.status_code == 200
+    assert [track["provider_track_id"] for track in swapped.json()["tracks"]] == ["t-9"]
+    assert list_calls == ["source-1", "source-1"]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_source_tracks_render_the_same_with_and_without_orjson(
+    auth_client, votuna_playlist, provider_stub, monkeypatch, use_orjson
+):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_response, "orjson", None)
+    provider_stub.tracks_by_playlist_id["source-1"] = [
+        ProviderTrack(provider_track_id="t-1", title="Café del Mar", artist="DJ Ä", genre="Chill"),
+    ]
+
+    response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/source-tracks",
+        json={"source": {"kind": "provider", "provider": "soundcloud", "provider_playlist_id": "source-1"}},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == JSONResponse(response.json()).body
+    assert response.json()["tracks"][0]["title"] == "Café del Mar"
+
+
 def test_facets_owner_success_with_sorting_and_normalization(auth_client, votuna_playlist, provider_stub):
     provider_stub.tracks_by_playlist_id["source-1"] = [
         ProviderTrack(provider_track_id="t-1", title="Alpha", artist="DJ Zebra", genre=" House "),
@@ -671,3 +1464,150 @@ def test_facets_empty_and_top_100_cap(auth_client, votuna_playlist, provider_stu
     assert cap_data["total_tracks_considered"] == 120
     assert len(cap_data["genres"]) == 100
     assert len(cap_data["artists"]) == 100
+
+
+def test_execute_with_preview_token_skips_relisting(auth_client, votuna_playlist, provider_stub, monkeypatch):
+    provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id] = [
+        ProviderTrack(provider_track_id="track-1", title="Current One", artist="A", genre="House"),
+        ProviderTrack(provider_track_id="track-2", title="Current Two", artist="B", genre="UKG"),
+    ]
+    provider_stub.tracks_by_playlist_id["export-dest-1"] = [
+        ProviderTrack(provider_track_id="track-1", title="Current One", artist="A", genre="House"),
+    ]
+    listed_playlist_ids: list[str] = []
+    original_list_tracks = provider_stub.list_tracks
+
+    async def _counting_list_tracks(self, provider_playlist_id: str):
+        listed_playlist_ids.append(provider_playlist_id)
+        return await original_list_tracks(self, provider_playlist_id)
+
+    monkeypatch.setattr(provider_stub, "list_tracks", _counting_list_tracks)
+    payload = {
+        "direction": "export_from_current",
+        "counterparty": {
+            "kind": "provider",
+            "provider": "soundcloud",
+            "provider_playlist_id": "export-dest-1",
+        },
+        "selection_mode": "all",
+        "selection_values": [],
+    }
+
+    preview_response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/preview",
+        json=payload,
+    )
+    assert preview_response.status_code == 200
+    preview_token = preview_response.json()["preview_token"]
+    assert preview_token
+    assert len(listed_playlist_ids) == 2
+
+    execute_response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/execute",
+        json={**payload, "preview_token": preview_token},
+    )
+    assert execute_response.status_code == 200
+    data = execute_response.json()
+    assert data["added_count"] == 1
+    assert data["skipped_duplicate_count"] == 1
+    assert provider_stub.add_tracks_calls[-1] == {"provider_playlist_id": "export-dest-1", "track_ids": ["track-2"]}
+    assert len(listed_playlist_ids) == 2
+
+    # Tokens are single use; replaying one falls back to listing both playlists.
+    replay_response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/execute",
+        json={**payload, "preview_token": preview_token},
+    )
+    assert replay_response.status_code == 200
+    assert len(listed_playlist_ids) == 4
+
+
+def test_execute_with_preview_token_relists_when_snapshot_id_changes(
+    auth_client, votuna_playlist, provider_stub, monkeypatch
+):
+    provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id] = [
+        ProviderTrack(provider_track_id="track-1", title="Current One", artist="A", genre="House"),
+        ProviderTrack(provider_track_id="track-2", title="Current Two", artist="B", genre="UKG"),
+    ]
+    provider_stub.tracks_by_playlist_id["export-dest-1"] = [
+        ProviderTrack(provider_track_id="track-3", title="Other Three", artist="C", genre="Disco"),
+    ]
+    snapshot_ids = {votuna_playlist.provider_playlist_id: "snap-a", "export-dest-1": "snap-b"}
+    original_get_playlist = provider_stub.get_playlist
+
+    async def _get_playlist_with_snapshot(self, provider_playlist_id: str):
+        playlist = await original_get_playlist(self, provider_playlist_id)
+        playlist.snapshot_id = snapshot_ids.get(provider_playlist_id)
+        return playlist
+
+    monkeypatch.setattr(provider_stub, "get_playlist", _get_playlist_with_snapshot)
+    payload = {
+        "direction": "export_from_current",
+        "counterparty": {
+            "kind": "provider",
+            "provider": "soundcloud",
+            "provider_playlist_id": "export-dest-1",
+        },
+        "selection_mode": "all",
+        "selection_values": [],
+    }
+
+    preview_response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/preview",
+        json=payload,
+    )
+    assert preview_response.status_code == 200
+    assert preview_response.json()["to_add_count"] == 2
+
+    # Swapping a track keeps the count but changes the snapshot id.
+    provider_stub.tracks_by_playlist_id["export-dest-1"] = [
+        ProviderTrack(provider_track_id="track-2", title="Current Two", artist="B", genre="UKG"),
+    ]
+    snapshot_ids["export-dest-1"] = "snap-c"
+    execute_response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/execute",
+        json={**payload, "preview_token": preview_response.json()["preview_token"]},
+    )
+    assert execute_response.status_code == 200
+    data = execute_response.json()
+    assert data["added_count"] == 1
+    assert data["skipped_duplicate_count"] == 1
+    assert provider_stub.add_tracks_calls[-1] == {"provider_playlist_id": "export-dest-1", "track_ids": ["track-1"]}
+
+
+def test_execute_with_stale_preview_token_relists(auth_client, votuna_playlist, provider_stub, monkeypatch):
+    provider_stub.tracks_by_playlist_id[votuna_playlist.provider_playlist_id] = [
+        ProviderTrack(provider_track_id="track-1", title="Current One", artist="A", genre="House"),
+        ProviderTrack(provider_track_id="track-2", title="Current Two", artist="B", genre="UKG"),
+    ]
+    provider_stub.tracks_by_playlist_id["export-dest-1"] = []
+    payload = {
+        "direction": "export_from_current",
+        "counterparty": {
+            "kind": "provider",
+            "provider": "soundcloud",
+            "provider_playlist_id": "export-dest-1",
+        },
+        "selection_mode": "all",
+        "selection_values": [],
+    }
+
+    preview_response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/preview",
+        json=payload,
+    )
+    assert preview_response.status_code == 200
+    assert preview_response.json()["to_add_count"] == 2
+
+    provider_stub.tracks_by_playlist_id["export-dest-1"] = [
+        ProviderTrack(provider_track_id="track-2", title="Current Two", artist="B", genre="UKG"),
+    ]
+    execute_response = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/management/execute",
+        json={**payload, "preview_token": preview_response.json()["preview_token"]},
+    )
+    assert execute_response.status_code == 200
+    data = execute_response.json()
+    assert data["added_count"] == 1
+    assert data["skipped_duplicate_count"] == 1
+    assert provider_stub.add_tracks_calls[-1] == {"provider_playlist_id": "export-dest-1", "track_ids": ["track-1"]}
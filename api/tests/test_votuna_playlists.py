@@ -1,11 +1,15 @@
 from datetime import datetime, timezone
 import uuid
 
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
 from app.crud.votuna_playlist_invite import votuna_playlist_invite_crud
 from app.crud.votuna_playlist_member import votuna_playlist_member_crud
 from app.crud.votuna_playlist_settings import votuna_playlist_settings_crud
 from app.crud.votuna_track_addition import votuna_track_addition_crud
 from app.crud.votuna_track_suggestion import votuna_track_suggestion_crud
+from app.schemas.votuna_playlist import ProviderTrackOut
 from app.services.music_providers import ProviderAPIError
 
 
@@ -221,6 +225,28 @@ def test_list_votuna_tracks_includes_suggester(auth_client, db_session, votuna_p
     assert data[0]["suggested_by_display_name"] == "You"
 
 
+def test_list_votuna_tracks_matches_default_json_encoding(
+    auth_client, db_session, votuna_playlist, user, provider_stub
+):
+    """Ensure the one-pass track list serialization emits what FastAPI's default path would."""
+    votuna_track_suggestion_crud.create(
+        db_session,
+        {
+            "playlist_id": votuna_playlist.id,
+            "provider_track_id": "track-1",
+            "track_title": "Test Track",
+            "suggested_by_user_id": user.id,
+            "status": "accepted",
+        },
+    )
+
+    response = auth_client.get(f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    tracks = [ProviderTrackOut.model_validate(item) for item in response.json()]
+    assert response.content == JSONResponse(jsonable_encoder(tracks)).body
+
+
 def test_list_votuna_tracks_uses_playlist_utils_provenance(
     auth_client, db_session, votuna_playlist, user, provider_stub
 ):
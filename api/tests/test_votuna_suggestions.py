@@ -1,7 +1,15 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
 import pytest
+from sqlalchemy.orm import sessionmaker
 
+from app.api.v1.routes.votuna import suggestions
+from app.api.v1.routes.votuna.suggestions import RECOMMENDATION_CURSOR_HEADER, recommendation_pool_refresher
+from app.crud.votuna_playlist import votuna_playlist_crud
 from app.crud.votuna_playlist_member import votuna_playlist_member_crud
 from app.crud.votuna_playlist_settings import votuna_playlist_settings_crud
+from app.crud.votuna_recommendation_pool import votuna_recommendation_pool_crud
 from app.crud.votuna_track_recommendation_decline import (
     votuna_track_recommendation_decline_crud,
 )
@@ -10,6 +18,7 @@ from app.crud.votuna_track_vote import votuna_track_vote_crud
 from app.auth.dependencies import get_current_user, get_optional_current_user
 from app.services.music_providers.base import ProviderTrack
 from app.services.music_providers import ProviderAPIError, ProviderAuthError
+from app.services.recommendation_pool import related_tracks_cache
 from main import app
 
 
@@ -102,6 +111,81 @@ def test_search_tracks_for_suggestions(auth_client, votuna_playlist, provider_st
     assert data[0]["access"] == "preview"
 
 
+def test_search_tracks_for_suggestions_reuses_cached_results_for_normalized_query(
+    auth_client,
+    votuna_playlist,
+    provider_stub,
+    monkeypatch,
+):
+    calls: list[str] = []
+    original_search_tracks = provider_stub.search_tracks
+
+    async def _counting_search_tracks(self, query: str, limit: int = 10):
+        calls.append(query)
+        return await original_search_tracks(self, query, limit=limit)
+
+    monkeypatch.setattr(provider_stub, "search_tracks", _counting_search_tracks)
+    first = auth_client.get(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks/search",
+        params={"q": "Deep  House", "limit": 2},
+    )
+    second = auth_client.get(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks/search",
+        params={"q": " deep house ", "limit": 2},
+    )
+    third = auth_client.get(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks/search",
+        params={"q": "deep house", "limit": 3},
+    )
+
+    assert first.status_code == second.status_code == third.status_code == 200
+    assert second.json() == first.json()
+    assert calls == ["Deep  House", "deep house"]
+
+
+def test_search_tracks_for_suggestions_does_not_share_results_across_owners(
+    client,
+    db_session,
+    user,
+    other_user,
+    votuna_playlist,
+    provider_stub,
+    monkeypatch,
+):
+    other_playlist = votuna_playlist_crud.create(
+        db_session,
+        {
+            "owner_user_id": other_user.id,
+            "provider": "soundcloud",
+            "provider_playlist_id": "pl-other-owner",
+            "title": "Other Owner",
+            "is_active": True,
+        },
+    )
+    votuna_playlist_member_crud.create(
+        db_session,
+        {"playlist_id": other_playlist.id, "user_id": other_user.id, "role": "owner"},
+    )
+    calls: list[str] = []
+
+    async def _expired_for_second_owner(self, query: str, limit: int = 10):
+        calls.append(query)
+        if len(calls) > 1:
+            raise ProviderAuthError("expired")
+        return provider_stub.search_tracks_results[:limit]
+
+    monkeypatch.setattr(provider_stub, "search_tracks", _expired_for_second_owner)
+    app.dependency_overrides[get_current_user] = lambda: user
+    first = client.get(f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks/search", params={"q": "house"})
+    app.dependency_overrides[get_current_user] = lambda: other_user
+    second = client.get(f"/api/v1/votuna/playlists/{other_playlist.id}/tracks/search", params={"q": "house"})
+    app.dependency_overrides.pop(get_current_user, None)
+
+    assert first.status_code == 200
+    assert second.status_code == 401
+    assert calls == ["house", "house"]
+
+
 def test_search_tracks_for_suggestions_whitespace_query_returns_400(
     auth_client,
     votuna_playlist,
@@ -246,6 +330,36 @@ def test_list_suggestions_with_status_filter(auth_client, db_session, votuna_pla
     assert all(item["status"] == "accepted" for item in data)
 
 
+def test_list_suggestions_query_budget_does_not_grow_per_suggestion(
+    client,
+    db_session,
+    votuna_playlist,
+    user,
+    other_user,
+    query_budget,
+):
+    _set_known_members(db_session, votuna_playlist, user.id, [other_user.id])
+    for index in range(6):
+        suggestion = votuna_track_suggestion_crud.create(
+            db_session,
+            {
+                "playlist_id": votuna_playlist.id,
+                "provider_track_id": f"track-budget-{index}",
+                "track_title": f"Budget {index}",
+                "suggested_by_user_id": user.id,
+                "status": "pending",
+            },
+        )
+        votuna_track_vote_crud.set_reaction(db_session, suggestion.id, other_user.id, "up")
+
+    with query_budget(8) as stats:
+        response = _client_as(client, user).get(f"/api/v1/votuna/playlists/{votuna_playlist.id}/suggestions")
+    assert response.status_code == 200
+    assert len(response.json()) == 6
+    assert all(item["upvote_count"] == 1 for item in response.json())
+    assert stats.count > 0
+
+
 def test_create_suggestion_from_track_url_resolves_metadata(auth_client, votuna_playlist, provider_stub):
     response = auth_client.post(
         f"/api/v1/votuna/playlists/{votuna_playlist.id}/suggestions",
@@ -899,6 +1013,97 @@ def test_recommendations_refresh_nonce_changes_order(auth_client, votuna_playlis
     assert ids_a != ids_b
 
 
+def test_recommendations_cursor_slices_one_ranked_list(auth_client, votuna_playlist, provider_stub, monkeypatch):
+    rank_calls = []
+    original_rank = suggestions._rank_recommendations
+
+    async def _counting_rank(*args, **kwargs):
+        rank_calls.append(args)
+        return await original_rank(*args, **kwargs)
+
+    monkeypatch.setattr(suggestions, "_rank_recommendations", _counting_rank)
+    url = f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks/recommendations"
+    full = auth_client.get(url, params={"limit": 50})
+    assert RECOMMENDATION_CURSOR_HEADER not in full.headers
+    assert not suggestions._recommendation_cursors
+    expected_ids = [track["provider_track_id"] for track in full.json()]
+    assert len(expected_ids) > 2
+
+    paged_ids: list[str] = []
+    params: dict[str, object] = {"limit": 2}
+    rank_calls.clear()
+    while True:
+        page = auth_client.get(url, params=params)
+        assert page.status_code == 200
+        paged_ids.extend(track["provider_track_id"] for track in page.json())
+        cursor = page.headers.get(RECOMMENDATION_CURSOR_HEADER)
+        if not cursor:
+            break
+        params = {"limit": 2, "cursor": cursor}
+
+    assert paged_ids == expected_ids
+    assert len(rank_calls) == 1
+
+
+def test_recommendation_cursors_are_bounded(auth_client, votuna_playlist, provider_stub, monkeypatch):
+    monkeypatch.setattr(suggestions, "RECOMMENDATION_CURSOR_MAX_ENTRIES", 2)
+    url = f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks/recommendations"
+    cursors = [auth_client.get(url, params={"limit": 1}).headers[RECOMMENDATION_CURSOR_HEADER] for _ in range(3)]
+
+    assert len(suggestions._recommendation_cursors) == 2
+    assert cursors[0].rpartition(".")[0] not in suggestions._recommendation_cursors
+    evicted = auth_client.get(url, params={"limit": 1, "cursor": cursors[0]})
+    assert evicted.status_code == 200
+    assert evicted.json() == auth_client.get(url, params={"limit": 1, "offset": 1}).json()
+
+
+def test_recommendations_expired_cursor_resumes_at_position(auth_client, votuna_playlist, provider_stub):
+    url = f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks/recommendations"
+    first = auth_client.get(url, params={"limit": 2})
+    cursor = first.headers[RECOMMENDATION_CURSOR_HEADER]
+    suggestions._recommendation_cursors.clear()
+
+    resumed = auth_client.get(url, params={"limit": 2, "cursor": cursor})
+    by_offset = auth_client.get(url, params={"limit": 2, "offset": 2})
+    invalid = auth_client.get(url, params={"cursor": "not-a-cursor"})
+
+    assert resumed.status_code == 200
+    assert resumed.json() == by_offset.json()
+    assert invalid.status_code == 400
+
+
+def test_recommendation_decline_updates_cached_filter_and_cursor(
+    auth_client,
+    votuna_playlist,
+    provider_stub,
+    monkeypatch,
+):
+    url = f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks/recommendations"
+    full_ids = [track["provider_track_id"] for track in auth_client.get(url, params={"limit": 50}).json()]
+    first = auth_client.get(url, params={"limit": 2})
+    cursor = first.headers[RECOMMENDATION_CURSOR_HEADER]
+
+    load_calls = []
+    original_list = votuna_track_recommendation_decline_crud.list_declined_track_ids
+
+    def _counting_list(*args, **kwargs):
+        load_calls.append(kwargs)
+        return original_list(*args, **kwargs)
+
+    monkeypatch.setattr(votuna_track_recommendation_decline_crud, "list_declined_track_ids", _counting_list)
+    declined_id = full_ids[2]
+    decline = auth_client.post(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks/recommendations/decline",
+        json={"provider_track_id": declined_id},
+    )
+    assert decline.status_code == 204
+
+    second = auth_client.get(url, params={"limit": 2, "cursor": cursor})
+    assert second.status_code == 200
+    assert [track["provider_track_id"] for track in second.json()] == full_ids[3:5]
+    assert load_calls == []
+
+
 def test_recommendations_limit_artist_concentration(auth_client, votuna_playlist, provider_stub):
     provider_stub.related_tracks_by_seed = {
         "track-1": [
@@ -1016,6 +1221,173 @@ def test_recommendations_provider_api_error_returns_502(
     assert response.json()["detail"] == "provider unavailable"
 
 
+def test_recommendations_page_over_persisted_pool(auth_client, db_session, votuna_playlist, provider_stub):
+    first = auth_client.get(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks/recommendations",
+        params={"limit": 2},
+    )
+    assert first.status_code == 200
+    fetch_count = len(provider_stub.related_tracks_calls)
+    assert fetch_count > 0
+    pool = votuna_recommendation_pool_crud.get_by_playlist_id(db_session, votuna_playlist.id)
+    assert pool is not None
+    assert pool.is_stale is False
+
+    second = auth_client.get(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks/recommendations",
+        params={"limit": 2, "offset": 2, "refresh_nonce": "another-shuffle"},
+    )
+    assert second.status_code == 200
+    assert len(provider_stub.related_tracks_calls) == fetch_count
+
+    votuna_recommendation_pool_crud.mark_stale(db_session, votuna_playlist.id)
+    third = auth_client.get(
+        f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks/recommendations",
+        params={"limit": 2},
+    )
+    assert third.status_code == 200
+    db_session.expire_all()
+    assert votuna_recommendation_pool_crud.get_by_playlist_id(db_session, votuna_playlist.id).is_stale is False
+    # The rebuild re-lists the playlist but reuses the seed-level related-track cache.
+    assert len(provider_stub.related_tracks_calls) == fetch_count
+    assert [track["provider_track_id"] for track in third.json()] == [
+        track["provider_track_id"] for track in first.json()
+    ]
+
+
+def test_recommendations_rebuild_pool_when_provider_track_count_changes(
+    auth_client,
+    db_session,
+    votuna_playlist,
+    provider_stub,
+    monkeypatch,
+):
+    get_playlist_calls: list[str] = []
+    original_get_playlist = provider_stub.get_playlist
+
+    async def _counting_get_playlist(self, provider_playlist_id: str):
+        get_playlist_calls.append(provider_playlist_id)
+        return await original_get_playlist(self, provider_playlist_id)
+
+    monkeypatch.setattr(provider_stub, "get_playlist", _counting_get_playlist)
+    url = f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks/recommendations"
+    first = auth_client.get(url)
+    assert first.status_code == 200
+    recommended_track_id = first.json()[0]["provider_track_id"]
+    pool = votuna_recommendation_pool_crud.get_by_playlist_id(db_session, votuna_playlist.id)
+    assert pool.track_count == len(provider_stub.tracks)
+
+    added_track = ProviderTrack(
+        provider_track_id=recommended_track_id,
+        title="Added On Provider",
+        artist="Someone Else",
+        genre=None,
+        artwork_url=None,
+        url=None,
+    )
+    monkeypatch.setitem(
+        provider_stub.tracks_by_playlist_id,
+        votuna_playlist.provider_playlist_id,
+        [*provider_stub.tracks, added_track],
+    )
+    # Within the check interval reads are served from the stored pool without asking the provider.
+    for _ in range(3):
+        assert recommended_track_id in [track["provider_track_id"] for track in auth_client.get(url).json()]
+    assert len(get_playlist_calls) == 1
+
+    monkeypatch.setattr(suggestions, "RECOMMENDATION_POOL_TRACK_COUNT_CHECK_SECONDS", 0.0)
+    second = auth_client.get(url)
+
+    assert second.status_code == 200
+    assert recommended_track_id not in [track["provider_track_id"] for track in second.json()]
+    db_session.expire_all()
+    assert votuna_recommendation_pool_crud.get_by_playlist_id(db_session, votuna_playlist.id).track_count == 3
+
+
+def test_recommendations_share_related_tracks_across_playlists(
+    auth_client,
+    db_session,
+    votuna_playlist,
+    user,
+    provider_stub,
+):
+    second_playlist = votuna_playlist_crud.create(
+        db_session,
+        {
+            "owner_user_id": user.id,
+            "provider": "soundcloud",
+            "provider_playlist_id": "pl-shared-seeds",
+            "title": "Shared Seeds",
+            "is_active": True,
+        },
+    )
+    votuna_playlist_member_crud.create(
+        db_session,
+        {"playlist_id": second_playlist.id, "user_id": user.id, "role": "owner"},
+    )
+
+    first = auth_client.get(f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks/recommendations")
+    fetch_count = len(provider_stub.related_tracks_calls)
+    second = auth_client.get(f"/api/v1/votuna/playlists/{second_playlist.id}/tracks/recommendations")
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert len(provider_stub.related_tracks_calls) == fetch_count
+
+
+def test_recommendation_pool_refresher_rebuilds_aged_pools(auth_client, db_session, votuna_playlist, provider_stub):
+    response = auth_client.get(f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks/recommendations")
+    assert response.status_code == 200
+    fetch_count = len(provider_stub.related_tracks_calls)
+
+    pool = votuna_recommendation_pool_crud.get_by_playlist_id(db_session, votuna_playlist.id)
+    old_computed_at = datetime.now(timezone.utc) - timedelta(days=1)
+    votuna_recommendation_pool_crud.update(db_session, pool, {"computed_at": old_computed_at})
+
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=db_session.get_bind())
+    related_tracks_cache.clear()
+    assert asyncio.run(recommendation_pool_refresher.run_once(session_factory)) == 1
+    assert len(provider_stub.related_tracks_calls) == 2 * fetch_count
+
+    db_session.expire_all()
+    refreshed = votuna_recommendation_pool_crud.get_by_playlist_id(db_session, votuna_playlist.id)
+    assert refreshed.computed_at.replace(tzinfo=timezone.utc) > old_computed_at
+    assert asyncio.run(recommendation_pool_refresher.run_once(session_factory)) == 0
+
+
+def test_recommendation_pool_refresher_skips_and_expires_idle_pools(
+    auth_client,
+    db_session,
+    votuna_playlist,
+    provider_stub,
+):
+    response = auth_client.get(f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks/recommendations")
+    assert response.status_code == 200
+    fetch_count = len(provider_stub.related_tracks_calls)
+    pool = votuna_recommendation_pool_crud.get_by_playlist_id(db_session, votuna_playlist.id)
+    assert pool.last_accessed_at is not None
+
+    now = datetime.now(timezone.utc)
+    votuna_recommendation_pool_crud.update(
+        db_session,
+        pool,
+        {"computed_at": now - timedelta(days=2), "last_accessed_at": now - timedelta(days=2)},
+    )
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=db_session.get_bind())
+    related_tracks_cache.clear()
+    assert asyncio.run(recommendation_pool_refresher.run_once(session_factory)) == 0
+    assert len(provider_stub.related_tracks_calls) == fetch_count
+    db_session.expire_all()
+    assert votuna_recommendation_pool_crud.get_by_playlist_id(db_session, votuna_playlist.id) is not None
+
+    pool = votuna_recommendation_pool_crud.get_by_playlist_id(db_session, votuna_playlist.id)
+    votuna_recommendation_pool_crud.update(db_session, pool, {"last_accessed_at": now - timedelta(days=8)})
+    assert asyncio.run(recommendation_pool_refresher.run_once(session_factory)) == 0
+    db_session.expire_all()
+    assert votuna_recommendation_pool_crud.get_by_playlist_id(db_session, votuna_playlist.id) is None
+
+
 def test_recommendations_requires_member(other_auth_client, votuna_playlist):
     list_response = other_auth_client.get(
         f"/api/v1/votuna/playlists/{votuna_playlist.id}/tracks/recommendations",